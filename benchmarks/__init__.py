@@ -0,0 +1 @@
+# pdf_editor/benchmarks/__init__.py
@@ -0,0 +1,101 @@
+# pdf_editor/benchmarks/bench_merge.py
+#
+# Compara core.pdf_merge.merge_pdfs (pypdf, página a página) com
+# merge_pdfs_dedup (PyMuPDF insert_pdf + garbage=4): tempo, pico de memória
+# e tamanho do arquivo gerado. Cada motor roda em um processo separado para
+# que o pico de memória de um não contamine o outro.
+#
+# Uso (na raiz do projeto):
+#     python -m benchmarks.bench_merge [--files 40] [--pages 5]
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import fitz  # PyMuPDF
+
+try:
+    import resource  # não existe no Windows
+except ImportError:
+    resource = None
+
+from core.pdf_merge import merge_pdfs, merge_pdfs_dedup
+
+
+def make_letterhead_pdfs(folder: str, n_files: int, pages_per_file: int) -> list:
+    """Gera PDFs com o mesmo "logotipo" (imagem) em todas as páginas de todos os arquivos."""
+    logo = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 400, 120), False)
+    for y in range(0, 120, 4):
+        for x in range(0, 400, 4):
+            logo.set_pixel(x, y, ((x * 3) % 256, (y * 5) % 256, 128))
+    logo_png = logo.tobytes("png")
+
+    paths = []
+    for f in range(n_files):
+        doc = fitz.open()
+        for p in range(pages_per_file):
+            page = doc.new_page()
+            page.insert_image(fitz.Rect(40, 20, 240, 80), stream=logo_png)
+            page.insert_text((40, 120), f"Relatório {f} - página {p + 1}", fontsize=14)
+            for line in range(30):
+                page.insert_text((40, 150 + line * 18), "Texto de exemplo " * 5, fontsize=9)
+        doc.set_toc([[1, f"Relatório {f}", 1]])
+        path = os.path.join(folder, f"in_{f:04d}.pdf")
+        doc.save(path)
+        doc.close()
+        paths.append(path)
+    return paths
+
+
+def _run_engine(engine: str, paths: list, output_path: str) -> dict:
+    # Roda no processo filho
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    if engine == "pypdf":
+        merge_pdfs(paths, output_path)
+    else:
+        merge_pdfs_dedup(paths, output_path)
+    elapsed = time.perf_counter() - t0
+    _, py_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {
+        "wall_s": round(elapsed, 3),
+        "python_peak_bytes": py_peak,
+        "output_bytes": os.path.getsize(output_path),
+    }
+    if resource is not None:
+        # ru_maxrss: KB no Linux, bytes no macOS
+        result["max_rss"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return result
+
+
+def run(n_files: int = 40, pages_per_file: int = 5) -> dict:
+    with tempfile.TemporaryDirectory() as folder:
+        paths = make_letterhead_pdfs(folder, n_files, pages_per_file)
+        results = {
+            "files": n_files,
+            "pages_per_file": pages_per_file,
+            "inputs_total_bytes": sum(os.path.getsize(p) for p in paths),
+        }
+        for engine in ("pypdf", "pymupdf_dedup"):
+            out = os.path.join(folder, f"merged_{engine}.pdf")
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                results[engine] = pool.submit(_run_engine, engine, paths, out).result()
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dos motores de mesclagem")
+    parser.add_argument("--files", type=int, default=40)
+    parser.add_argument("--pages", type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(run(n_files=args.files, pages_per_file=args.pages), indent=2))
+
+
+if __name__ == "__main__":
+    main()
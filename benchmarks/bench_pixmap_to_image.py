@@ -0,0 +1,88 @@
+# pdf_editor/benchmarks/bench_pixmap_to_image.py
+#
+# Compara o caminho antigo pixmap -> Image.frombytes(pix.samples) -> copy()
+# com o helper sem cópia core.imaging.render_page_to_image.
+#
+# Uso (na raiz do projeto):
+#     python -m benchmarks.bench_pixmap_to_image [--zoom 2.0] [--repeat 5]
+
+import argparse
+import json
+import time
+import tracemalloc
+
+import fitz  # PyMuPDF
+from PIL import Image
+
+from core.imaging import render_page_to_image
+
+
+def make_a3_page_doc() -> fitz.Document:
+    """Documento de uma página A3 com texto e um bloco de imagem."""
+    doc = fitz.open()
+    page = doc.new_page(width=842, height=1191)  # A3 em pontos
+    for i in range(60):
+        page.insert_text((40, 40 + i * 18), f"Linha de teste {i} " * 6, fontsize=10)
+
+    # Imagem de "scan" ocupando metade da página
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 800, 560), False)
+    pix.clear_with(180)
+    page.insert_image(fitz.Rect(40, 600, 800, 1150), pixmap=pix)
+    return doc
+
+
+def old_pipeline(page, zoom):
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+    return img.copy()
+
+
+def new_pipeline(page, zoom):
+    return render_page_to_image(page, zoom=zoom)
+
+
+def measure(fn, page, zoom, repeat):
+    times = []
+    peaks = []
+    for _ in range(repeat):
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        img = fn(page, zoom)
+        img.load()
+        times.append(time.perf_counter() - t0)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peaks.append(peak)
+        del img
+
+    return {
+        "best_ms": round(min(times) * 1000, 2),
+        "mean_ms": round(sum(times) / len(times) * 1000, 2),
+        "python_peak_bytes": max(peaks),
+    }
+
+
+def run(zoom: float = 2.0, repeat: int = 5) -> dict:
+    doc = make_a3_page_doc()
+    page = doc.load_page(0)
+    try:
+        old_pipeline(page, zoom)  # aquecimento (fontes, imagens decodificadas)
+        return {
+            "zoom": zoom,
+            "old_frombytes_copy": measure(old_pipeline, page, zoom, repeat),
+            "new_zero_copy": measure(new_pipeline, page, zoom, repeat),
+        }
+    finally:
+        doc.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pixmap -> PIL.Image")
+    parser.add_argument("--zoom", type=float, default=2.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(run(zoom=args.zoom, repeat=args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,461 @@
+# pdf_editor/benchmarks/suite.py
+#
+# Suíte de benchmarks das operações principais (renderização, texto,
+# exportação de imagem, mesclagem, busca de palavra no ponto, edições).
+# Os PDFs de teste são gerados na hora com o PyMuPDF: um com muito texto,
+# um com muitas imagens e uma pasta com muitos arquivos pequenos.
+#
+# Cada caso roda num processo próprio (o pico de memória de um não contamina
+# o outro): primeiro as repetições cronometradas, depois uma execução extra
+# com tracemalloc para o pico de memória Python (o tracemalloc deixa o código
+# Python mais lento, por isso fica fora da medição de tempo).
+#
+# Uso (na raiz do projeto):
+#     python -m benchmarks.suite run [-o resultados.json] [--quick] [--only render,merge]
+#     python -m benchmarks.suite compare base.json novo.json [--threshold 0.15]
+#
+# Um caso que falha fica registrado como {"error": ...} e a suíte continua.
+# O compare sai com código 1 se algum caso ficou mais lento (ou gastou mais
+# memória) além da tolerância, ou passou a falhar, para poder ser usado em
+# scripts.
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import fitz  # PyMuPDF
+
+try:
+    import resource  # não existe no Windows
+except ImportError:
+    resource = None
+
+from core.pdf_edit import apply_text_overlays
+from core.pdf_manager import PDFManager
+from core.pdf_merge import merge_pdfs
+
+
+RESULTS_VERSION = 1
+
+SIZES = {
+    # text_pages, image_pages, small_files, repetições
+    "full": (200, 30, 300, 5),
+    "quick": (20, 5, 40, 3),
+}
+RENDER_PAGES = 10           # páginas renderizadas por repetição
+HIT_TEST_QUERIES = 20000
+OVERLAY_PAGES = 20
+OVERLAYS_PER_PAGE = 20
+
+DEFAULT_THRESHOLD = 0.15      # +15% de tempo = regressão
+DEFAULT_MEM_THRESHOLD = 0.20  # +20% de pico de memória = regressão
+DEFAULT_MIN_MS = 1.0          # diferenças menores que isso são ruído
+
+
+# =============================
+# PDFs sintéticos
+# =============================
+
+def make_text_pdf(path: str, pages: int):
+    """Páginas densas de texto (~600 palavras cada), como um manual."""
+    doc = fitz.open()
+    for p in range(pages):
+        page = doc.new_page()
+        page.insert_text((50, 40), f"Capítulo {p // 10 + 1} - página {p + 1}", fontsize=14)
+        for line in range(60):
+            words = " ".join(f"palavra{(p * 60 + line * 10 + w) % 997}" for w in range(10))
+            page.insert_text((50, 70 + line * 12), words, fontsize=8)
+    doc.save(path, garbage=1, deflate=True)
+    doc.close()
+
+
+def make_image_pdf(path: str, pages: int):
+    """Uma imagem grande e diferente por página, como um documento escaneado."""
+    doc = fitz.open()
+    for p in range(pages):
+        pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 1200, 1600), False)
+        pix.clear_with(255)
+        for by in range(0, 1600, 40):
+            for bx in range(0, 1200, 40):
+                shade = ((bx * 7 + by * 3 + p * 11) % 200) + 30
+                pix.set_rect(fitz.IRect(bx, by, bx + 36, by + 36), (shade, (shade * 3) % 256, 255 - shade))
+        page = doc.new_page()
+        page.insert_image(page.rect, pixmap=pix)
+        page.insert_text((50, 30), f"Digitalização {p + 1}", fontsize=12)
+    doc.save(path, garbage=1, deflate=True)
+    doc.close()
+
+
+def make_small_files(folder: str, count: int) -> list:
+    """Muitos PDFs de uma página (ex.: comprovantes para mesclar)."""
+    paths = []
+    for i in range(count):
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_text((50, 60), f"Comprovante {i + 1}", fontsize=16)
+        for line in range(10):
+            page.insert_text((50, 100 + line * 14), f"Item {line + 1}: valor {(i * 31 + line) % 1000},00", fontsize=10)
+        path = os.path.join(folder, f"small_{i:04d}.pdf")
+        doc.save(path)
+        doc.close()
+        paths.append(path)
+    return paths
+
+
+def make_fixtures(folder: str, size: str) -> dict:
+    text_pages, image_pages, small_files, _ = SIZES[size]
+    fixtures = {
+        "folder": folder,
+        "text": os.path.join(folder, "text_heavy.pdf"),
+        "image": os.path.join(folder, "image_heavy.pdf"),
+    }
+    make_text_pdf(fixtures["text"], text_pages)
+    make_image_pdf(fixtures["image"], image_pages)
+    small_dir = os.path.join(folder, "small")
+    os.makedirs(small_dir)
+    fixtures["small_files"] = make_small_files(small_dir, small_files)
+    return fixtures
+
+
+# =============================
+# Casos
+# =============================
+#
+# Cada caso é (prepare(fixtures) -> estado, run(estado), cleanup(estado)).
+# Só o run() é cronometrado.
+
+def _open_manager(path):
+    pm = PDFManager()
+    pm.open_pdf(path)
+    return pm
+
+
+def _close_manager(pm):
+    pm.close()
+
+
+def case_render(fixture: str, zoom: float):
+    def run(pm):
+        pm.render_cache.clear()  # mede a renderização, não o cache
+        for page_index in range(min(RENDER_PAGES, pm.page_count())):
+            pm.render_page_image(page_index, zoom=zoom)
+
+    return lambda fx: _open_manager(fx[fixture]), run, _close_manager
+
+
+def case_extract_text():
+    return lambda fx: _open_manager(fx["text"]), lambda pm: pm.extract_text(), _close_manager
+
+
+def case_extract_page_as_image():
+    def prepare(fx):
+        return _open_manager(fx["image"]), os.path.join(fx["folder"], "page.png")
+
+    def run(state):
+        pm, out = state
+        pm.extract_page_as_image(0, out, zoom=2.0)
+
+    return prepare, run, lambda state: _close_manager(state[0])
+
+
+def case_merge():
+    def prepare(fx):
+        return fx["small_files"], os.path.join(fx["folder"], "merged.pdf")
+
+    return prepare, lambda state: merge_pdfs(*state), lambda state: None
+
+
+def case_word_index_build():
+    def run(pm):
+        pm._word_indexes.clear()
+        for page_index in range(min(RENDER_PAGES, pm.page_count())):
+            pm.get_word_index(page_index)
+
+    return lambda fx: _open_manager(fx["text"]), run, _close_manager
+
+
+def case_word_hit_test():
+    def prepare(fx):
+        pm = _open_manager(fx["text"])
+        index = pm.get_word_index(0)
+        rect = pm.doc.load_page(0).rect
+        rng = random.Random(0)
+        points = [(rng.uniform(0, rect.width), rng.uniform(0, rect.height)) for _ in range(HIT_TEST_QUERIES)]
+        return pm, index, points
+
+    def run(state):
+        _, index, points = state
+        for x, y in points:
+            if index.word_at(x, y) is None:
+                index.nearest_word(x, y)
+
+    return prepare, run, lambda state: _close_manager(state[0])
+
+
+def case_apply_overlays():
+    def prepare(fx):
+        edits = {}
+        for page_index in range(OVERLAY_PAGES):
+            edits[page_index] = [
+                ((50, 70 + i * 30, 300, 90 + i * 30), f"Texto corrigido {page_index}.{i}")
+                for i in range(OVERLAYS_PER_PAGE)
+            ]
+        return fx["text"], edits
+
+    def run(state):
+        path, edits = state
+        doc = fitz.open(path)
+        try:
+            apply_text_overlays(doc, {p: e for p, e in edits.items() if p < len(doc)})
+        finally:
+            doc.close()
+
+    return prepare, run, lambda state: None
+
+
+CASES = {
+    "render_text_z1": case_render("text", 1.0),
+    "render_text_z2": case_render("text", 2.0),
+    "render_text_z4": case_render("text", 4.0),
+    "render_image_z1": case_render("image", 1.0),
+    "render_image_z2": case_render("image", 2.0),
+    "extract_text": case_extract_text(),
+    "extract_page_as_image": case_extract_page_as_image(),
+    "merge_small_files": case_merge(),
+    "word_index_build": case_word_index_build(),
+    "word_hit_test": case_word_hit_test(),
+    "apply_overlays": case_apply_overlays(),
+}
+
+
+def _max_rss_bytes():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss: KB no Linux, bytes no macOS
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def _run_case(name: str, fixtures: dict, repeat: int) -> dict:
+    # Roda no processo filho
+    prepare, run, cleanup = CASES[name]
+    state = prepare(fixtures)
+    try:
+        run(state)  # aquecimento (fontes, imagens decodificadas, importações)
+
+        times = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            run(state)
+            times.append(time.perf_counter() - t0)
+
+        tracemalloc.start()
+        run(state)
+        _, py_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        cleanup(state)
+
+    return {
+        "wall_s": {
+            "median": round(statistics.median(times), 6),
+            "min": round(min(times), 6),
+            "runs": [round(t, 6) for t in times],
+        },
+        "python_peak_bytes": py_peak,
+        "max_rss_bytes": _max_rss_bytes(),
+    }
+
+
+def run_suite(size: str = "full", only=None, progress=None) -> dict:
+    names = [n for n in CASES if not only or any(n.startswith(o) for o in only)]
+    repeat = SIZES[size][3]
+    results = {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "size": size,
+            "repeat": repeat,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pymupdf": getattr(fitz, "VersionBind", None),
+        },
+        "cases": {},
+    }
+    with tempfile.TemporaryDirectory() as folder:
+        fixtures = make_fixtures(folder, size)
+        for name in names:
+            if progress is not None:
+                progress(name)
+            # Um caso com erro (ou que derruba o processo) não interrompe os outros
+            try:
+                with ProcessPoolExecutor(max_workers=1) as pool:
+                    results["cases"][name] = pool.submit(_run_case, name, fixtures, repeat).result()
+            except Exception as e:
+                results["cases"][name] = {"error": f"{type(e).__name__}: {e}"}
+    return results
+
+
+# =============================
+# Comparação
+# =============================
+
+def _ratio(base, new):
+    if not base or new is None:
+        return None
+    return new / base
+
+
+def compare(base: dict, new: dict, threshold: float = DEFAULT_THRESHOLD,
+            mem_threshold: float = DEFAULT_MEM_THRESHOLD, min_ms: float = DEFAULT_MIN_MS) -> list:
+    """
+    Compara duas execuções caso a caso. Retorna
+    [{"case", "base_ms", "new_ms", "time_ratio", "mem_ratio", "regressions": [...]}].
+    O tempo comparado é a mediana; memória é o pico Python e o RSS máximo.
+    Casos com erro viram {"case", "error": {"base"|"novo": mensagem}}; um erro
+    só na execução nova conta como regressão.
+    """
+    rows = []
+    base_cases = base.get("cases", {})
+    new_cases = new.get("cases", {})
+    for name in sorted(set(base_cases) | set(new_cases)):
+        b, n = base_cases.get(name), new_cases.get(name)
+        if b is None or n is None:
+            rows.append({"case": name, "missing": "base" if b is None else "novo", "regressions": []})
+            continue
+        if "error" in b or "error" in n:
+            errors = {label: r["error"] for label, r in (("base", b), ("novo", n)) if "error" in r}
+            rows.append({
+                "case": name,
+                "error": errors,
+                "regressions": ["erro"] if "error" in n and "error" not in b else [],
+            })
+            continue
+
+        base_ms = b["wall_s"]["median"] * 1000
+        new_ms = n["wall_s"]["median"] * 1000
+        time_ratio = _ratio(base_ms, new_ms)
+        mem_ratio = _ratio(b.get("python_peak_bytes"), n.get("python_peak_bytes"))
+        rss_ratio = _ratio(b.get("max_rss_bytes"), n.get("max_rss_bytes"))
+
+        regressions = []
+        if time_ratio is not None and time_ratio > 1 + threshold and new_ms - base_ms >= min_ms:
+            regressions.append("tempo")
+        if mem_ratio is not None and mem_ratio > 1 + mem_threshold:
+            regressions.append("memória python")
+        if rss_ratio is not None and rss_ratio > 1 + mem_threshold:
+            regressions.append("rss")
+
+        rows.append({
+            "case": name,
+            "base_ms": base_ms,
+            "new_ms": new_ms,
+            "time_ratio": time_ratio,
+            "mem_ratio": mem_ratio,
+            "rss_ratio": rss_ratio,
+            "regressions": regressions,
+        })
+    return rows
+
+
+def _pct(ratio):
+    return "     -" if ratio is None else f"{(ratio - 1) * 100:+5.0f}%"
+
+
+def format_comparison(rows) -> str:
+    lines = [f"{'caso':<24} {'base ms':>10} {'novo ms':>10} {'tempo':>7} {'mem':>7} {'rss':>7}"]
+    for row in rows:
+        if "missing" in row:
+            lines.append(f"{row['case']:<24} (ausente em {row['missing']})")
+            continue
+        if "error" in row:
+            flag = "  << REGRESSÃO" if row["regressions"] else ""
+            for label, message in row["error"].items():
+                lines.append(f"{row['case']:<24} erro em {label}: {message}{flag}")
+            continue
+        flag = "  << REGRESSÃO: " + ", ".join(row["regressions"]) if row["regressions"] else ""
+        lines.append(
+            f"{row['case']:<24} {row['base_ms']:10.1f} {row['new_ms']:10.1f} "
+            f"{_pct(row['time_ratio']):>7} {_pct(row['mem_ratio']):>7} {_pct(row['rss_ratio']):>7}{flag}"
+        )
+    return "\n".join(lines)
+
+
+# =============================
+# Linha de comando
+# =============================
+
+def cmd_run(args) -> int:
+    only = [o.strip() for o in args.only.split(",") if o.strip()] if args.only else None
+    results = run_suite(
+        size="quick" if args.quick else "full",
+        only=only,
+        progress=lambda name: print(f"  {name}...", file=sys.stderr),
+    )
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+    failed = 0
+    for name, r in results["cases"].items():
+        if "error" in r:
+            failed += 1
+            print(f"{name:<24} ERRO: {r['error']}")
+        else:
+            print(f"{name:<24} {r['wall_s']['median'] * 1000:10.1f} ms")
+    print(f"Resultados em {args.output}")
+    return 1 if failed else 0
+
+
+def cmd_compare(args) -> int:
+    with open(args.base, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(args.new, encoding="utf-8") as f:
+        new = json.load(f)
+    if base.get("meta", {}).get("size") != new.get("meta", {}).get("size"):
+        print("Aviso: as execuções usaram tamanhos diferentes (--quick).", file=sys.stderr)
+
+    rows = compare(base, new, args.threshold, args.mem_threshold, args.min_ms)
+    print(format_comparison(rows))
+    regressed = [row["case"] for row in rows if row["regressions"]]
+    if regressed:
+        print(f"\n{len(regressed)} caso(s) com regressão.")
+        return 1
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks das operações principais")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("run", help="Executa a suíte e grava os resultados em JSON")
+    p.add_argument("-o", "--output", default="benchmark_results.json")
+    p.add_argument("--quick", action="store_true", help="PDFs menores e menos repetições")
+    p.add_argument("--only", help="Prefixos de casos separados por vírgula (ex.: render,merge)")
+    p.set_defaults(func=cmd_run)
+
+    p = sub.add_parser("compare", help="Compara duas execuções e aponta regressões")
+    p.add_argument("base")
+    p.add_argument("new")
+    p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                   help="Aumento relativo de tempo tolerado (padrão: 0.15)")
+    p.add_argument("--mem-threshold", type=float, default=DEFAULT_MEM_THRESHOLD,
+                   help="Aumento relativo de memória tolerado (padrão: 0.20)")
+    p.add_argument("--min-ms", type=float, default=DEFAULT_MIN_MS,
+                   help="Diferença mínima de tempo, em ms, para contar como regressão")
+    p.set_defaults(func=cmd_compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
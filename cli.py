@@ -0,0 +1,406 @@
+# pdf_editor/cli.py
+#
+# Linha de comando (sem interface gráfica) para operações em lote.
+# Cada subcomando importa só os módulos de que precisa, então chamadas
+# pequenas iniciam rápido e nada aqui depende de display/Tk.
+#
+# Uso (na raiz do projeto):
+#     python cli.py merge -o saida.pdf "entrada/*.pdf"
+#     python cli.py split manual.pdf -o partes --chunk 50 -j 4
+#     python cli.py images relatorio.pdf -o imagens --pages "1-5" --dpi 150 -j 4
+#     python cli.py text "docs/*.pdf" -o textos -j 4
+#     python cli.py pdf2docx "docs/*.pdf" -o word -j 2
+#     python cli.py docx2pdf "word/*.docx" -o pdfs
+
+import argparse
+import contextlib
+import glob
+import multiprocessing
+import os
+import sys
+
+
+class CLIError(Exception):
+    """Erro de uso/entrada: mostrado sem traceback."""
+
+
+def expand_inputs(patterns) -> list:
+    """
+    Expande curingas (o cmd do Windows não faz isso) mantendo a ordem dada.
+    Padrões sem correspondência são mantidos como estão, para o erro de
+    "arquivo não encontrado" mostrar o nome digitado.
+    """
+    paths = []
+    seen = set()
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        for path in matches or [pattern]:
+            key = os.path.normcase(os.path.abspath(path))
+            if key not in seen:
+                seen.add(key)
+                paths.append(path)
+    return paths
+
+
+def _check_files(paths):
+    missing = [p for p in paths if not os.path.isfile(p)]
+    if missing:
+        raise CLIError("Arquivo(s) não encontrado(s): " + ", ".join(missing))
+    if not paths:
+        raise CLIError("Nenhum arquivo de entrada.")
+
+
+@contextlib.contextmanager
+def _input_errors(path: str):
+    """
+    Falhas ao abrir ou processar uma entrada (PDF corrompido, sem permissão,
+    intervalo inválido...) viram CLIError com o nome do arquivo.
+    """
+    try:
+        yield
+    except CLIError:
+        raise
+    except Exception as e:
+        raise CLIError(f"{path}: {e}") from e
+
+
+def _output_for(input_path: str, output: str, ext: str, many: bool) -> str:
+    """
+    Caminho de saída para uma entrada: `output` é uma pasta quando há várias
+    entradas (ou quando já existe como pasta); sem `output`, grava ao lado da
+    entrada.
+    """
+    name = os.path.splitext(os.path.basename(input_path))[0] + ext
+    if output is None:
+        return os.path.join(os.path.dirname(os.path.abspath(input_path)), name)
+    if many or os.path.isdir(output):
+        os.makedirs(output, exist_ok=True)
+        return os.path.join(output, name)
+    return output
+
+
+class _Progress:
+    """Progresso numa linha do stderr (só quando é um terminal e sem --quiet)."""
+
+    def __init__(self, label: str, quiet: bool):
+        self.label = label
+        self.enabled = not quiet and sys.stderr.isatty()
+
+    def __call__(self, done, total=None):
+        if self.enabled:
+            suffix = f"{done}/{total}" if total else str(done)
+            sys.stderr.write(f"\r{self.label}: {suffix}")
+            sys.stderr.flush()
+
+    def finish(self):
+        if self.enabled:
+            sys.stderr.write("\n")
+
+
+def _log(args, message: str):
+    if not args.quiet:
+        print(message, file=sys.stderr)
+
+
+# =============================
+# Subcomandos
+# =============================
+
+def cmd_merge(args):
+    inputs = expand_inputs(args.inputs)
+    _check_files(inputs)
+
+    progress = _Progress("Mesclando", args.quiet)
+    if args.engine == "pypdf":
+        from core.pdf_merge import merge_pdfs
+
+        merge_pdfs(inputs, args.output)
+    elif args.engine == "dedup":
+        from core.pdf_merge import merge_pdfs_dedup
+
+        merge_pdfs_dedup(inputs, args.output)
+    else:
+        from core.pdf_merge import merge_pdfs_hierarchical
+
+        merge_pdfs_hierarchical(
+            inputs, args.output, chunk_size=args.chunk_size, workers=args.jobs, progress=progress
+        )
+    progress.finish()
+    _log(args, f"{len(inputs)} arquivo(s) mesclado(s) em {args.output}")
+
+
+def cmd_split(args):
+    inputs = expand_inputs(args.inputs)
+    _check_files(inputs)
+
+    from core.pdf_split import (
+        chunk_parts, extract_pages, outline_parts, page_count_and_toc, range_parts, split_pdf,
+    )
+    from core.page_ranges import parse_page_range
+
+    total_written = 0
+    for pdf_path in inputs:
+        output_dir = args.output or os.path.dirname(os.path.abspath(pdf_path))
+        with _input_errors(pdf_path):
+            page_count, toc = page_count_and_toc(pdf_path)
+            if args.extract is not None:
+                pages = parse_page_range(args.extract, page_count)
+                stem = os.path.splitext(os.path.basename(pdf_path))[0]
+                out_path = os.path.join(output_dir, f"{stem}_extraido.pdf")
+                os.makedirs(output_dir, exist_ok=True)
+                extract_pages(pdf_path, out_path, pages, keep_outlines=not args.no_outlines)
+                _log(args, f"{pdf_path} -> {out_path}")
+                total_written += 1
+                continue
+            if args.chunk is not None:
+                parts = chunk_parts(page_count, args.chunk)
+            elif args.ranges is not None:
+                parts = range_parts(args.ranges.split(";"), page_count)
+            else:
+                parts = outline_parts(toc, page_count, level=args.level)
+
+            progress = _Progress(os.path.basename(pdf_path), args.quiet)
+            written = split_pdf(
+                pdf_path, output_dir, parts,
+                workers=args.jobs, keep_outlines=not args.no_outlines, progress=progress,
+            )
+            progress.finish()
+        total_written += len(written)
+        _log(args, f"{pdf_path}: {len(written)} parte(s) em {output_dir}")
+
+    _log(args, f"{total_written} arquivo(s) gravado(s)")
+
+
+def cmd_images(args):
+    inputs = expand_inputs(args.inputs)
+    _check_files(inputs)
+
+    import fitz  # PyMuPDF
+
+    from core.page_export import export_pages_as_images, validate_pattern, DEFAULT_PATTERN
+    from core.page_ranges import parse_page_range
+
+    pattern = args.pattern or DEFAULT_PATTERN
+    try:
+        validate_pattern(pattern)
+    except ValueError as e:
+        raise CLIError(str(e))
+
+    total_written = 0
+    for pdf_path in inputs:
+        output_dir = args.output or os.path.dirname(os.path.abspath(pdf_path))
+        with _input_errors(pdf_path):
+            with fitz.open(pdf_path) as doc:
+                page_count = len(doc)
+            pages = parse_page_range(args.pages, page_count)
+            os.makedirs(output_dir, exist_ok=True)
+
+            progress = _Progress(os.path.basename(pdf_path), args.quiet)
+            written = export_pages_as_images(
+                pdf_path,
+                output_dir,
+                pages=pages,
+                pattern=pattern,
+                dpi=args.dpi,
+                fmt=args.format,
+                quality=args.quality,
+                workers=args.jobs,
+                progress=progress,
+            )
+            progress.finish()
+        total_written += len(written)
+
+    _log(args, f"{total_written} imagem(ns) exportada(s)")
+
+
+def cmd_text(args):
+    inputs = expand_inputs(args.inputs)
+    _check_files(inputs)
+
+    import fitz  # PyMuPDF
+
+    from core.page_ranges import parse_page_range
+    from core.text_extract import iter_page_texts, iter_page_texts_parallel, write_page_texts
+
+    many = len(inputs) > 1
+
+    for pdf_path in inputs:
+        out_path = _output_for(pdf_path, args.output, ".txt", many)
+        progress = _Progress(os.path.basename(pdf_path), args.quiet)
+
+        with _input_errors(pdf_path), fitz.open(pdf_path) as doc:
+            pages = parse_page_range(args.pages, len(doc))
+            if args.jobs > 1:
+                page_texts = iter_page_texts_parallel(pdf_path, pages, workers=args.jobs)
+            else:
+                page_texts = iter_page_texts(doc, pages)
+            write_page_texts(page_texts, out_path, progress=progress, total=len(pages))
+
+        progress.finish()
+        _log(args, f"{pdf_path} -> {out_path}")
+
+
+def cmd_pdf2docx(args):
+    inputs = expand_inputs(args.inputs)
+    _check_files(inputs)
+
+    from core.pdf_docx_bridge import pdf_to_docx, pdfs_to_docx_batch
+
+    many = len(inputs) > 1
+    jobs = [(p, _output_for(p, args.output, ".docx", many)) for p in inputs]
+
+    if not many:
+        # Um arquivo só: o paralelismo vai para dentro dele (modo multiprocessado do pdf2docx)
+        src, dst = jobs[0]
+        pages = None
+        if args.pages:
+            import fitz  # PyMuPDF
+
+            from core.page_ranges import parse_page_range
+
+            with _input_errors(src), fitz.open(src) as doc:
+                pages = parse_page_range(args.pages, len(doc))
+        try:
+            pdf_to_docx(src, dst, pages=pages, workers=args.jobs)
+        except Exception as e:
+            _report_conversion(args, src, dst, e)
+            raise CLIError("A conversão falhou.")
+        _report_conversion(args, src, dst, None)
+        return
+
+    results = pdfs_to_docx_batch(
+        jobs,
+        workers=args.jobs,
+        page_spec=args.pages or None,
+        progress=lambda _done, _total, r: _report_conversion(args, r["input"], r["output"], r["error"]),
+    )
+    failures = sum(1 for r in results if not r["ok"])
+    if failures:
+        raise CLIError(f"{failures} de {len(jobs)} conversão(ões) falharam.")
+
+
+def cmd_docx2pdf(args):
+    from core.pdf_docx_bridge import docx_to_pdf
+
+    inputs = expand_inputs(args.inputs)
+    _check_files(inputs)
+    many = len(inputs) > 1
+
+    # docx2pdf automatiza o Word (um processo só): as conversões são sequenciais
+    failures = 0
+    for src in inputs:
+        dst = _output_for(src, args.output, ".pdf", many)
+        try:
+            docx_to_pdf(src, dst)
+            error = None
+        except Exception as e:
+            error = e
+        failures += _report_conversion(args, src, dst, error)
+
+    if failures:
+        raise CLIError(f"{failures} de {len(inputs)} conversão(ões) falharam.")
+
+
+def _report_conversion(args, src, dst, error) -> int:
+    if error is not None:
+        print(f"erro: {src}: {error}", file=sys.stderr)
+        return 1
+    _log(args, f"{src} -> {dst}")
+    return 0
+
+
+# =============================
+# Argumentos
+# =============================
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Cotidiano PDF Studio - operações em lote pela linha de comando",
+    )
+    parser.add_argument("-q", "--quiet", action="store_true", help="não mostra progresso nem resumo")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    default_jobs = os.cpu_count() or 1
+
+    p = sub.add_parser("merge", help="mescla PDFs em um único arquivo")
+    p.add_argument("inputs", nargs="+", help="PDFs de entrada (aceita curingas, ex.: 'pasta/*.pdf')")
+    p.add_argument("-o", "--output", required=True, help="PDF de saída")
+    p.add_argument(
+        "--engine", choices=("pypdf", "dedup", "hierarchical"), default="pypdf",
+        help="pypdf (padrão); dedup: unifica recursos repetidos; "
+             "hierarchical: milhares de arquivos com memória limitada",
+    )
+    p.add_argument("--chunk-size", type=int, default=64, help="arquivos por pedaço (hierarchical)")
+    p.add_argument("-j", "--jobs", type=int, default=1, help="processos em paralelo (hierarchical)")
+    p.set_defaults(func=cmd_merge)
+
+    p = sub.add_parser("split", help="divide um PDF em partes (sem re-renderizar as páginas)")
+    p.add_argument("inputs", nargs="+", help="PDFs de entrada (aceita curingas)")
+    p.add_argument("-o", "--output", help="pasta de destino (padrão: ao lado de cada PDF)")
+    mode = p.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--chunk", type=int, help="páginas por parte")
+    mode.add_argument("--ranges", help="uma parte por intervalo, separados por ';', ex.: '1-10; 40-60'")
+    mode.add_argument("--outline", action="store_true", help="uma parte por marcador (sumário)")
+    mode.add_argument("--extract", metavar="PAGINAS", help="copia só essas páginas para um único PDF")
+    p.add_argument("--level", type=int, default=1, help="nível dos marcadores usados por --outline")
+    p.add_argument("--no-outlines", action="store_true", help="não copia os marcadores para as partes")
+    p.add_argument("-j", "--jobs", type=int, default=1, help="processos gravando partes em paralelo")
+    p.set_defaults(func=cmd_split)
+
+    p = sub.add_parser("images", help="exporta páginas como PNG/JPEG")
+    p.add_argument("inputs", nargs="+", help="PDFs de entrada (aceita curingas)")
+    p.add_argument("-o", "--output", help="pasta de destino (padrão: ao lado de cada PDF)")
+    p.add_argument("--pages", default="", help="páginas, ex.: '1-5, 8, 10-' (padrão: todas)")
+    p.add_argument("--dpi", type=int, default=144)
+    p.add_argument("--format", choices=("PNG", "JPEG"), default="PNG", type=str.upper)
+    p.add_argument("--quality", type=int, default=90, help="qualidade JPEG (1-100)")
+    p.add_argument("--pattern", default=None, help="padrão do nome, ex.: '{name}_p{page:04d}.{ext}'")
+    p.add_argument("-j", "--jobs", type=int, default=default_jobs, help="processos em paralelo")
+    p.set_defaults(func=cmd_images)
+
+    p = sub.add_parser("text", help="extrai o texto para .txt")
+    p.add_argument("inputs", nargs="+", help="PDFs de entrada (aceita curingas)")
+    p.add_argument("-o", "--output", help="arquivo .txt (uma entrada) ou pasta (várias)")
+    p.add_argument("--pages", default="", help="páginas, ex.: '1-5, 8, 10-' (padrão: todas)")
+    p.add_argument("-j", "--jobs", type=int, default=1, help="processos em paralelo por arquivo")
+    p.set_defaults(func=cmd_text)
+
+    p = sub.add_parser("pdf2docx", help="converte PDF em DOCX")
+    p.add_argument("inputs", nargs="+", help="PDFs de entrada (aceita curingas)")
+    p.add_argument("-o", "--output", help="arquivo .docx (uma entrada) ou pasta (várias)")
+    p.add_argument("--pages", default="", help="páginas de cada PDF, ex.: '1-5, 8' (padrão: todas)")
+    p.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="processos: arquivos em paralelo, ou páginas em paralelo se houver um arquivo só",
+    )
+    p.set_defaults(func=cmd_pdf2docx)
+
+    p = sub.add_parser("docx2pdf", help="converte DOCX em PDF (requer o Microsoft Word)")
+    p.add_argument("inputs", nargs="+", help="DOCX de entrada (aceita curingas)")
+    p.add_argument("-o", "--output", help="arquivo .pdf (uma entrada) ou pasta (várias)")
+    p.set_defaults(func=cmd_docx2pdf)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if getattr(args, "jobs", 1) < 1:
+        print("erro: --jobs deve ser pelo menos 1", file=sys.stderr)
+        return 2
+    try:
+        args.func(args)
+    except CLIError as e:
+        print(f"erro: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        print("\ninterrompido", file=sys.stderr)
+        return 130
+    return 0
+
+
+if __name__ == "__main__":
+    # Necessário para os pools de processos no executável do PyInstaller (Windows)
+    multiprocessing.freeze_support()
+    sys.exit(main())
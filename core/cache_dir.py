@@ -0,0 +1,132 @@
+# pdf_editor/core/cache_dir.py
+
+import hashlib
+import os
+import sys
+import threading
+
+
+APP_DIR_NAME = "CotidianoPDFStudio"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# (caminho, tamanho, mtime) -> hash, para não reler arquivos grandes
+_hash_memo = {}
+# (caminho, tamanho, mtime) -> threading.Event dos hashes sendo calculados agora
+_hash_inflight = {}
+_hash_lock = threading.Lock()
+
+
+def app_cache_dir(*parts: str) -> str:
+    """
+    Pasta de cache do aplicativo (criada se não existir).
+    Windows: %LOCALAPPDATA%\\CotidianoPDFStudio\\cache; outros: ~/.cache/CotidianoPDFStudio.
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+        root = os.path.join(base, APP_DIR_NAME, "cache")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        root = os.path.join(base, APP_DIR_NAME)
+
+    path = os.path.join(root, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _memo_key(path: str, st) -> tuple:
+    return os.path.abspath(path), st.st_size, st.st_mtime_ns
+
+
+def _claim_hash(memo_key):
+    """
+    (hash, None) se já calculado; (None, event) se esta thread passou a ser a
+    responsável pelo cálculo; espera quem já estiver calculando o mesmo hash.
+    """
+    while True:
+        with _hash_lock:
+            cached = _hash_memo.get(memo_key)
+            if cached is not None:
+                return cached, None
+            event = _hash_inflight.get(memo_key)
+            if event is None:
+                event = _hash_inflight[memo_key] = threading.Event()
+                return None, event
+        # Se o outro cálculo falhar, o memo continua vazio e esta thread tenta
+        event.wait()
+
+
+def _finish_hash(memo_key, event, digest=None):
+    with _hash_lock:
+        if digest is not None:
+            _hash_memo[memo_key] = digest
+        _hash_inflight.pop(memo_key, None)
+    event.set()
+
+
+def file_content_hash(path: str) -> str:
+    """
+    SHA-256 do conteúdo do arquivo (memorizado enquanto tamanho/mtime não mudam).
+    Chamadas simultâneas para o mesmo arquivo leem o disco uma vez só: as
+    outras esperam o cálculo em andamento.
+    """
+    memo_key = _memo_key(path, os.stat(path))
+    cached, event = _claim_hash(memo_key)
+    if cached is not None:
+        return cached
+
+    digest = None
+    try:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        return digest
+    finally:
+        _finish_hash(memo_key, event, digest)
+
+
+def start_content_hash_from_bytes(path: str, data: bytes, st):
+    """
+    Calcula numa thread o hash do arquivo a partir do conteúdo já lido para a
+    memória (ex.: PDF aberto em modo stream), sem reler o disco. Quem pedir o
+    hash do arquivo enquanto isso espera este cálculo. `st` é o os.stat de
+    antes da leitura: se o arquivo mudou desde então, nada é feito.
+    """
+    memo_key = _memo_key(path, st)
+    try:
+        if len(data) != st.st_size or _memo_key(path, os.stat(path)) != memo_key:
+            return
+    except OSError:
+        return
+    with _hash_lock:
+        if memo_key in _hash_memo or memo_key in _hash_inflight:
+            return
+        event = _hash_inflight[memo_key] = threading.Event()
+
+    def compute():
+        digest = None
+        try:
+            digest = hashlib.sha256(data).hexdigest()
+        finally:
+            _finish_hash(memo_key, event, digest)
+
+    threading.Thread(target=compute, name="content-hash", daemon=True).start()
+
+
+def peek_content_hash(path: str):
+    """Hash já calculado para o conteúdo atual do arquivo, ou None (nunca lê o arquivo)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    with _hash_lock:
+        return _hash_memo.get(_memo_key(path, st))
+
+
+def atomic_write_bytes(path: str, data: bytes):
+    """Grava em um arquivo temporário e renomeia (leitores nunca veem arquivo pela metade)."""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
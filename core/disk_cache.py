@@ -0,0 +1,235 @@
+# pdf_editor/core/disk_cache.py
+
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from typing import TYPE_CHECKING
+
+from core.cache_dir import app_cache_dir, atomic_write_bytes
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+DEFAULT_DISK_MAX_BYTES = 1024 * 1024 * 1024  # 1 GB
+EVICT_TARGET = 0.9          # a limpeza desce até 90% do limite (não roda a cada gravação)
+STALE_TMP_SECONDS = 3600    # temporários órfãos (processo que caiu no meio da gravação)
+WRITE_QUEUE_MAX = 16        # páginas aguardando gravação; além disso, descarta
+ZLIB_LEVEL = 1              # páginas são quase todas fundo liso: o nível 1 já reduz ~15x
+
+MAGIC = b"CPRC"
+FORMAT_VERSION = 2
+# magic, versão, modo da imagem, modo gravado (ascii), largura, altura; depois os pixels (zlib)
+_HEADER = struct.Struct("<4sB5s5sII")
+# As páginas renderizadas em RGBA são opacas (core.imaging): o alpha não vai para o disco
+_STORED_MODE = {"RGBA": "RGB"}
+
+
+class DiskRenderCache:
+    """
+    Cache em disco de páginas renderizadas, compartilhado entre sessões e
+    entre instâncias do aplicativo.
+
+    A chave é (hash do conteúdo do PDF, page_index, zoom, colorspace): o
+    mesmo arquivo reaberto amanhã (ou com outro nome) acha as mesmas páginas.
+    Cada página é um arquivo com um cabeçalho curto e os pixels comprimidos
+    com zlib rápido; páginas RGBA (opacas) são gravadas sem o alpha.
+
+    put() só agenda: a codificação, a gravação, a varredura inicial e a
+    limpeza rodam numa thread própria, fora da thread da interface.
+
+    Concorrência entre processos: as gravações são atômicas (temporário +
+    rename) e as entradas nunca mudam depois de gravadas, então um leitor vê
+    o arquivo inteiro ou não vê nada. O "uso recente" do LRU é o mtime do
+    arquivo (atualizado a cada leitura), que todas as instâncias enxergam;
+    qualquer uma pode limpar, e arquivos que sumirem no meio são só misses.
+    """
+
+    def __init__(self, root: str = None, max_bytes: int = DEFAULT_DISK_MAX_BYTES):
+        self.root = root or app_cache_dir("renders")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._approx_bytes = None  # estimativa do total em disco (varrido na 1ª gravação)
+        self._queue = queue.Queue(maxsize=WRITE_QUEUE_MAX)
+        self._queued = set()       # chaves na fila (evita gravar a mesma página duas vezes)
+        self._writer = None
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.dropped = 0
+        self.evictions = 0
+
+    def _path(self, key) -> str:
+        digest, page_index, zoom, colorspace = key
+        # A versão vai no nome: entradas de formatos antigos só saem pelo LRU
+        name = f"{page_index}_{zoom:.4f}_{colorspace}.v{FORMAT_VERSION}"
+        return os.path.join(self.root, digest[:2], digest, name)
+
+    def get(self, key):
+        """Imagem guardada (somente leitura) ou None."""
+        from PIL import Image  # só com um documento aberto: não pesa na abertura da janela
+
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                header = f.read(_HEADER.size)
+                magic, version, mode, stored_mode, width, height = _HEADER.unpack(header)
+                if magic != MAGIC or version != FORMAT_VERSION:
+                    raise ValueError("Formato de cache desconhecido.")
+                mode = mode.rstrip(b"\0").decode("ascii")
+                stored_mode = stored_mode.rstrip(b"\0").decode("ascii")
+                data = zlib.decompress(f.read())
+            img = Image.frombytes(stored_mode, (width, height), data)
+            if img.mode != mode:
+                img = img.convert(mode)
+        except Exception:
+            # Ausente, removido por outra instância, truncado ou de outra versão
+            with self._lock:
+                self.misses += 1
+            return None
+
+        try:
+            os.utime(path)  # marca como usado recentemente (LRU)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return img
+
+    def put(self, key, img: "Image.Image"):
+        """
+        Agenda a gravação da página (a imagem não pode mais ser alterada).
+        Não toca no disco: com a fila cheia, a página simplesmente não é gravada.
+        """
+        with self._lock:
+            if key in self._queued:
+                return
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="disk-render-cache", daemon=True)
+                self._writer.start()
+            try:
+                self._queue.put_nowait((key, img))
+            except queue.Full:
+                self.dropped += 1
+                return
+            self._queued.add(key)
+
+    def flush(self):
+        """Espera as gravações agendadas terminarem."""
+        self._queue.join()
+
+    def _write_loop(self):
+        while True:
+            key, img = self._queue.get()
+            try:
+                self._write(key, img)
+            except Exception:
+                pass  # o cache em disco é só otimização: a página fica sem cópia em disco
+            finally:
+                with self._lock:
+                    self._queued.discard(key)
+                self._queue.task_done()
+
+    def _write(self, key, img: "Image.Image"):
+        """Grava a página (se ainda não existir) e limpa o excedente quando passar do limite."""
+        path = self._path(key)
+        if os.path.exists(path):
+            return
+
+        stored_mode = _STORED_MODE.get(img.mode, img.mode)
+        data = _HEADER.pack(
+            MAGIC, FORMAT_VERSION, img.mode.encode("ascii"), stored_mode.encode("ascii"),
+            img.width, img.height,
+        )
+        data += zlib.compress(img.tobytes("raw", stored_mode), ZLIB_LEVEL)
+        if len(data) > self.max_bytes:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            atomic_write_bytes(path, data)
+        except OSError:
+            # Disco cheio, sem permissão...: o cache em disco é só otimização
+            return
+
+        with self._lock:
+            self.writes += 1
+            if self._approx_bytes is None:
+                self._approx_bytes = self._scan_total()
+            else:
+                self._approx_bytes += len(data)
+            over = self._approx_bytes > self.max_bytes
+        if over:
+            self.evict()
+
+    def _entries(self):
+        """[(mtime, tamanho, caminho)] de todos os arquivos do cache."""
+        entries = []
+        for dirpath, _dirnames, filenames in os.walk(self.root):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def _scan_total(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Remove as páginas usadas há mais tempo até ficar abaixo do limite."""
+        now = time.time()
+        entries = []
+        for mtime, size, path in self._entries():
+            if path.endswith(".tmp"):
+                if now - mtime > STALE_TMP_SECONDS:
+                    self._remove(path)
+                continue
+            entries.append((mtime, size, path))
+
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * EVICT_TARGET
+        evicted = 0
+        for _mtime, size, path in entries:
+            if total <= target:
+                break
+            # Mesmo se falhar (arquivo aberto no Windows, já removido), segue
+            self._remove(path)
+            total -= size
+            evicted += 1
+
+        with self._lock:
+            self._approx_bytes = total
+            self.evictions += evicted
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self):
+        for _mtime, _size, path in self._entries():
+            self._remove(path)
+        with self._lock:
+            self._approx_bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "dropped": self.dropped,
+                "evictions": self.evictions,
+                "bytes": self._approx_bytes,
+                "max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,117 @@
+# pdf_editor/core/imaging.py
+
+import fitz  # PyMuPDF
+from fitz import mupdf
+from PIL import Image
+
+
+# colorspace -> (colorspace do PyMuPDF, alpha do pixmap, modo da PIL)
+#
+# A PIL só consegue apontar para um buffer externo (sem copiar) em alguns
+# modos: "L", "RGBA", "RGBX"... "RGB" não está entre eles, porque a PIL guarda
+# RGB com 4 bytes por pixel. Por isso as páginas coloridas são renderizadas
+# num pixmap RGBA opaco (fundo branco, alpha 255): ocupa o mesmo que uma
+# imagem RGB da PIL e é usado diretamente, sem cópia.
+COLORSPACES = {
+    "RGB": (fitz.csRGB, True, "RGBA"),
+    "GRAY": (fitz.csGRAY, False, "L"),
+}
+
+
+def _draw(run, bounds, mat, fitz_cs, alpha: bool, clip=None) -> fitz.Pixmap:
+    """
+    Rasteriza com o draw device do MuPDF num pixmap pré-preenchido de branco.
+
+    O get_pixmap(alpha=True) do PyMuPDF começa de um fundo transparente; aqui
+    o pixmap RGBA já nasce opaco, então não é preciso compor o fundo depois.
+    `run(dev, area)` executa o conteúdo (página ou display list) no device.
+    """
+    matrix = mupdf.FzMatrix(mat.a, mat.b, mat.c, mat.d, mat.e, mat.f)
+    rect = mupdf.FzRect(*bounds)
+    if clip is not None:
+        rect = mupdf.fz_intersect_rect(rect, mupdf.FzRect(*fitz.Rect(clip)))
+    irect = mupdf.fz_round_rect(mupdf.fz_transform_rect(rect, matrix))
+
+    pix = mupdf.fz_new_pixmap_with_bbox(fitz_cs.this, irect, mupdf.FzSeparations(), alpha)
+    mupdf.fz_clear_pixmap_with_value(pix, 0xFF)  # branco (opaco, quando há alpha)
+    if clip is None:
+        dev = mupdf.fz_new_draw_device(matrix, pix)
+        area = mupdf.FzRect(mupdf.FzRect.Fixed_INFINITE)
+    else:
+        dev = mupdf.fz_new_draw_device_with_bbox(matrix, pix, irect)
+        area = rect
+    try:
+        run(dev, area)
+    finally:
+        mupdf.fz_close_device(dev)
+    return fitz.Pixmap("raw", pix)
+
+
+def render_page_pixmap(page, zoom: float = 1.8, colorspace: str = "RGB", clip=None) -> fitz.Pixmap:
+    """Rasteriza uma fitz.Page (ou só o retângulo `clip`) num pixmap opaco."""
+    fitz_cs, alpha, _ = COLORSPACES[colorspace]
+    mat = fitz.Matrix(zoom, zoom)
+
+    if not alpha:
+        return page.get_pixmap(matrix=mat, colorspace=fitz_cs, alpha=False, clip=clip)
+
+    def run(dev, area):
+        # área passada só ao display list; fz_run_page desenha tudo e o bbox recorta
+        mupdf.fz_run_page(page.this, dev, mupdf.FzMatrix(), mupdf.FzCookie())
+
+    return _draw(run, page.rect, mat, fitz_cs, alpha, clip)
+
+
+def render_displaylist_pixmap(dlist, zoom: float, colorspace: str = "RGB", clip=None) -> fitz.Pixmap:
+    """
+    Como render_page_pixmap, mas a partir de um fitz.DisplayList: o conteúdo
+    da página já foi interpretado uma vez, então rasterizar vários recortes
+    (ladrilhos) não reinterpreta a página inteira a cada um.
+    """
+    fitz_cs, alpha, _ = COLORSPACES[colorspace]
+
+    def run(dev, area):
+        mupdf.fz_run_display_list(dlist.this, dev, mupdf.FzMatrix(), area, mupdf.FzCookie())
+
+    return _draw(run, dlist.rect, fitz.Matrix(zoom, zoom), fitz_cs, alpha, clip)
+
+
+def pixmap_to_image(pix: fitz.Pixmap) -> Image.Image:
+    """
+    Converte um fitz.Pixmap em PIL.Image SEM copiar os pixels.
+
+    A imagem aponta para a memória do pixmap, então o pixmap fica preso à
+    imagem (atributo `_pixmap`) enquanto ela existir. A imagem é somente
+    leitura: a PIL faz uma cópia automática se alguém desenhar nela.
+    """
+    if pix.n == 4 and pix.alpha:
+        mode = "RGBA"
+    elif pix.n == 1 and not pix.alpha:
+        mode = "L"
+    else:
+        # Modo que a PIL não mapeia (ex.: RGB sem alpha): cópia inevitável
+        mode = "RGB" if pix.n == 3 else "RGBA"
+        return Image.frombytes(mode, (pix.width, pix.height), pix.samples)
+
+    img = Image.frombuffer(
+        mode, (pix.width, pix.height), pix.samples_mv, "raw", mode, pix.stride, 1
+    )
+    img._pixmap = pix
+    return img
+
+
+def render_page_to_image(page, zoom: float = 1.8, colorspace: str = "RGB", clip=None) -> Image.Image:
+    """Rasteriza uma fitz.Page como PIL.Image (sem cópia do buffer)."""
+    return pixmap_to_image(render_page_pixmap(page, zoom=zoom, colorspace=colorspace, clip=clip))
+
+
+def save_page_image(page, path: str, zoom: float = 2.0, fmt: str = "PNG", jpg_quality: int = 95):
+    """
+    Salva uma página como PNG/JPEG direto pelo MuPDF, sem passar pela PIL
+    (nenhuma cópia do buffer de pixels).
+    """
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+    if fmt.upper() in ("JPEG", "JPG"):
+        pix.save(path, output="jpg", jpg_quality=jpg_quality)
+    else:
+        pix.save(path, output="png")
@@ -0,0 +1,313 @@
+# pdf_editor/core/jobs.py
+
+import heapq
+import itertools
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from core.perf import span
+
+
+# Prioridades (menor = roda antes)
+PRIORITY_INTERACTIVE = 0   # algo que o usuário está esperando na tela
+PRIORITY_NORMAL = 5
+PRIORITY_BULK = 10         # exportações/conversões grandes
+
+# Estados de um job
+PENDING = "pendente"
+RUNNING = "executando"
+DONE = "concluído"
+FAILED = "falhou"
+CANCELLED = "cancelado"
+
+_job_ids = itertools.count(1)
+
+
+def _perf_name(fn) -> str:
+    """Nome do span de um job em processo: o do @timed da função, se houver."""
+    return getattr(fn, "perf_name", None) or f"job.{getattr(fn, '__name__', 'process')}"
+
+
+class JobCancelled(Exception):
+    """Lançada por quem quiser interromper um job cooperativamente (ctx.check_cancelled())."""
+
+
+class JobContext:
+    """Passado como primeiro argumento às funções de jobs em thread."""
+
+    def __init__(self, job):
+        self._job = job
+        self.cancel_event = job.cancel_event
+
+    def progress(self, done, total=None, message: str = None):
+        self._job._report_progress(done, total, message)
+
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def check_cancelled(self):
+        if self.cancel_event.is_set():
+            raise JobCancelled()
+
+
+class Job:
+    """
+    Uma operação longa agendada no JobScheduler.
+
+    kind="thread": fn(ctx, *args, **kwargs) roda numa thread de trabalho e pode
+    informar progresso e checar cancelamento pelo ctx.
+    kind="process": fn(*args, **kwargs) roda num processo (fn precisa ser
+    "picklable"); só pode ser cancelado antes de começar. Depois disso o
+    processo vai até o fim (e grava o que tiver de gravar), então o resultado
+    é sempre entregue.
+
+    on_done(result), on_error(exc) e on_progress(job) são chamados na thread
+    da UI, por JobScheduler.dispatch_events().
+    """
+
+    def __init__(self, name, fn, args=(), kwargs=None, kind="thread",
+                 priority=PRIORITY_NORMAL, on_done=None, on_error=None, on_progress=None):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Tipo de job inválido: {kind}")
+
+        self.id = next(_job_ids)
+        self.name = name
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.kind = kind
+        self.priority = priority
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+
+        self.state = PENDING
+        self.done = 0
+        self.total = None
+        self.message = ""
+        self.result = None
+        self.error = None
+        self.created_at = time.monotonic()
+        self.started_at = None
+        self.finished_at = None
+        self.cancel_event = threading.Event()
+
+        self._scheduler = None
+
+    @property
+    def fraction(self):
+        if not self.total:
+            return None
+        return min(self.done / self.total, 1.0)
+
+    @property
+    def finished(self) -> bool:
+        return self.state in (DONE, FAILED, CANCELLED)
+
+    @property
+    def cancellable(self) -> bool:
+        """Pendentes e jobs em thread; um processo já iniciado não pode ser interrompido."""
+        return self.state == PENDING or (self.state == RUNNING and self.kind == "thread")
+
+    def cancel(self) -> bool:
+        """Pede o cancelamento. Retorna False se não dá mais para cancelar."""
+        if not self.cancellable:
+            return False
+        self.cancel_event.set()
+        if self._scheduler is not None:
+            self._scheduler._on_cancel_requested(self)
+        return True
+
+    def _report_progress(self, done, total, message):
+        self.done = done
+        if total is not None:
+            self.total = total
+        if message is not None:
+            self.message = message
+        if self._scheduler is not None:
+            self._scheduler._post(self, "progress")
+
+
+class JobScheduler:
+    """
+    Fila de prioridade de jobs executados por algumas threads de trabalho.
+    Uma das threads é reservada para jobs interativos, então exportações
+    grandes nunca deixam um job PRIORITY_INTERACTIVE esperando.
+
+    Nada aqui toca a UI: eventos (progresso/fim/erro) vão para uma fila que a
+    UI consome com dispatch_events(), chamado a partir do after() do Tk.
+    """
+
+    def __init__(self, max_threads: int = 2, max_processes: int = None):
+        self.max_threads = max_threads
+        self.max_processes = max_processes or os.cpu_count() or 1
+
+        self.jobs = []  # todos os jobs, na ordem de criação (para o painel)
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._events = queue.Queue()
+        self._threads = []
+        self._process_pool = None
+        self._stopped = False
+
+    # =============================
+    # API
+    # =============================
+
+    def submit(self, name, fn, *args, kind="thread", priority=PRIORITY_NORMAL,
+               on_done=None, on_error=None, on_progress=None, **kwargs) -> Job:
+        job = Job(
+            name, fn, args=args, kwargs=kwargs, kind=kind, priority=priority,
+            on_done=on_done, on_error=on_error, on_progress=on_progress,
+        )
+        job._scheduler = self
+
+        with self._cond:
+            if self._stopped:
+                raise RuntimeError("Agendador de jobs encerrado.")
+            self.jobs.append(job)
+            heapq.heappush(self._heap, (job.priority, next(self._seq), job))
+            self._ensure_threads()
+            self._cond.notify_all()
+
+        self._post(job, "state")
+        return job
+
+    def active_jobs(self) -> list:
+        return [job for job in self.jobs if not job.finished]
+
+    def clear_finished(self):
+        with self._cond:
+            self.jobs = [job for job in self.jobs if not job.finished]
+
+    def dispatch_events(self, max_events: int = 200) -> list:
+        """
+        Chamar na thread da UI: executa os callbacks dos jobs.
+        Retorna os jobs que mudaram (para o painel se atualizar).
+        """
+        changed = []
+        for _ in range(max_events):
+            try:
+                job, kind = self._events.get_nowait()
+            except queue.Empty:
+                break
+
+            if job not in changed:
+                changed.append(job)
+
+            if kind == "progress" and job.on_progress is not None:
+                job.on_progress(job)
+            elif kind == "done" and job.on_done is not None:
+                job.on_done(job.result)
+            elif kind == "error" and job.on_error is not None:
+                job.on_error(job.error)
+        return changed
+
+    def shutdown(self, cancel_running: bool = True):
+        with self._cond:
+            self._stopped = True
+            pending = [entry[2] for entry in self._heap]
+            self._heap.clear()
+            self._cond.notify_all()
+        for job in pending:
+            job.state = CANCELLED
+        if cancel_running:
+            for job in self.jobs:
+                if job.state == RUNNING:
+                    job.cancel_event.set()
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+
+    # =============================
+    # Interno
+    # =============================
+
+    def _post(self, job, kind):
+        self._events.put((job, kind))
+
+    def _ensure_threads(self):
+        # Chamado com self._cond adquirido
+        self._threads = [t for t in self._threads if t.is_alive()]
+        while len(self._threads) < self.max_threads + 1:
+            interactive_only = not any(getattr(t, "interactive_only", False) for t in self._threads)
+            t = threading.Thread(
+                target=self._worker,
+                args=(interactive_only,),
+                name="job-worker-interativo" if interactive_only else f"job-worker-{len(self._threads)}",
+                daemon=True,
+            )
+            t.interactive_only = interactive_only
+            self._threads.append(t)
+            t.start()
+
+    def _can_take(self, interactive_only: bool) -> bool:
+        # Chamado com self._cond adquirido
+        if not self._heap:
+            return False
+        return not interactive_only or self._heap[0][0] <= PRIORITY_INTERACTIVE
+
+    def _on_cancel_requested(self, job):
+        with self._cond:
+            if job.state != PENDING:
+                return
+            self._heap = [entry for entry in self._heap if entry[2] is not job]
+            heapq.heapify(self._heap)
+            job.state = CANCELLED
+            job.finished_at = time.monotonic()
+        self._post(job, "cancelled")
+
+    def _get_process_pool(self):
+        with self._cond:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=self.max_processes)
+            return self._process_pool
+
+    def _worker(self, interactive_only: bool):
+        while True:
+            with self._cond:
+                while not self._can_take(interactive_only) and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                _, _, job = heapq.heappop(self._heap)
+                if job.kind == "process" and job.cancel_event.is_set():
+                    # Cancelado no instante em que saiu da fila: ainda dá para não iniciar
+                    job.state = CANCELLED
+                    job.finished_at = time.monotonic()
+                    self._post(job, "cancelled")
+                    continue
+                job.state = RUNNING
+                job.started_at = time.monotonic()
+
+            self._post(job, "state")
+            try:
+                if job.kind == "process":
+                    # Spans registrados no processo filho não voltam para o recorder
+                    # daqui: a execução é medida deste lado (envio até o resultado)
+                    with span(_perf_name(job.fn), job=job.name, kind="process"):
+                        future = self._get_process_pool().submit(job.fn, *job.args, **job.kwargs)
+                        job.result = future.result()
+                else:
+                    job.result = job.fn(JobContext(job), *job.args, **job.kwargs)
+            except JobCancelled:
+                job.state = CANCELLED
+            except Exception as e:
+                job.error = e
+                job.state = FAILED
+            else:
+                # Um processo terminou de qualquer jeito (o arquivo já foi gravado):
+                # um cancelamento que chegou tarde demais não esconde o resultado
+                cancelled = job.kind == "thread" and job.cancel_event.is_set()
+                job.state = CANCELLED if cancelled else DONE
+            job.finished_at = time.monotonic()
+
+            if job.state == DONE:
+                self._post(job, "done")
+            elif job.state == FAILED:
+                self._post(job, "error")
+            else:
+                self._post(job, "cancelled")
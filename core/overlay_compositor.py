@@ -0,0 +1,159 @@
+# pdf_editor/core/overlay_compositor.py
+
+import math
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+# O compositor é criado com a janela: o PIL só é importado ao desenhar
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+# família -> arquivos TrueType (normal, negrito, itálico, negrito+itálico)
+FONT_FILES = {
+    "Arial": ("arial.ttf", "arialbd.ttf", "ariali.ttf", "arialbi.ttf"),
+    "Times New Roman": ("times.ttf", "timesbd.ttf", "timesi.ttf", "timesbi.ttf"),
+    "Courier New": ("cour.ttf", "courbd.ttf", "couri.ttf", "courbi.ttf"),
+}
+# Usadas quando a família não está instalada (ex.: Linux sem as fontes do Windows)
+FALLBACK_FONT_FILES = (
+    "DejaVuSans.ttf", "DejaVuSans-Bold.ttf", "DejaVuSans-Oblique.ttf", "DejaVuSans-BoldOblique.ttf",
+)
+
+TEXT_PADDING = 2  # px entre a borda da caixa e o texto
+
+
+@lru_cache(maxsize=1)
+def _measure():
+    """ImageDraw só para medir texto (textbbox precisa de um)."""
+    from PIL import Image, ImageDraw
+
+    return ImageDraw.Draw(Image.new("L", (1, 1)))
+
+
+@lru_cache(maxsize=64)
+def get_pil_font(family: str, size: int, bold: bool = False, italic: bool = False):
+    """Fonte PIL carregada do disco uma única vez por (família, tamanho, estilo)."""
+    from PIL import ImageFont
+
+    style = (1 if bold else 0) + (2 if italic else 0)
+    for files in (FONT_FILES.get(family), FALLBACK_FONT_FILES):
+        if not files:
+            continue
+        for name in (files[style], files[0]):
+            try:
+                return ImageFont.truetype(name, size)
+            except OSError:
+                continue
+    return ImageFont.load_default()
+
+
+def _item_extent(item, size):
+    """Área (inteira, recortada à imagem) que um item ocupa: caixa + texto que vaze dela."""
+    (x0, y0, x1, y1), text, font, _fill = item
+    tx0, ty0, tx1, ty1 = _measure().multiline_textbbox(
+        (x0 + TEXT_PADDING, y0 + TEXT_PADDING), text, font=font
+    )
+    width, height = size
+    return (
+        max(0, math.floor(min(x0, tx0))),
+        max(0, math.floor(min(y0, ty0))),
+        min(width, math.ceil(max(x1, tx1)) + 1),
+        min(height, math.ceil(max(y1, ty1)) + 1),
+    )
+
+
+def _intersects(a, b) -> bool:
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+class OverlayCompositor:
+    """
+    Camada das edições de texto sobre a página renderizada.
+
+    A imagem base (do RenderCache, compartilhada) nunca é alterada: as
+    edições são desenhadas numa cópia feita uma vez por página/zoom. A cada
+    compose() só as áreas dos itens que mudaram são refeitas (recorte da
+    base + itens que cruzam a área), então confirmar uma edição custa o
+    tamanho da caixa, não o da página.
+
+    Um item é (box, texto, fonte, cor), com box em pixels da imagem base.
+    """
+
+    def __init__(self):
+        self._key = None
+        self._base = None
+        self._image = None
+        self._items = {}    # item_id -> item
+        self._extents = {}  # item_id -> área ocupada
+
+    def reset(self):
+        self._key = None
+        self._base = None
+        self._image = None
+        self._items = {}
+        self._extents = {}
+
+    def compose(self, key, base: "Image.Image", items: dict) -> "Image.Image":
+        """
+        Retorna a página com os itens desenhados (a própria base se não houver itens).
+
+        key identifica a base (ex.: (doc_id, page_index, zoom)); items é
+        {item_id: item} na ordem de desenho.
+        """
+        if key != self._key or base is not self._base:
+            self.reset()
+            self._key = key
+            self._base = base
+
+        if not items:
+            self._image = None
+            self._items = {}
+            self._extents = {}
+            return base
+
+        if self._image is None:
+            self._image = base.copy()
+
+        dirty = []
+        for item_id, old in self._items.items():
+            if items.get(item_id) != old:
+                dirty.append(self._extents[item_id])
+
+        extents = {}
+        for item_id, item in items.items():
+            old_extent = self._extents.get(item_id)
+            if self._items.get(item_id) == item:
+                extents[item_id] = old_extent
+            else:
+                extents[item_id] = _item_extent(item, base.size)
+                dirty.append(extents[item_id])
+
+        self._items = dict(items)
+        self._extents = extents
+
+        for box in dirty:
+            self._repaint(box)
+        return self._image
+
+    def _repaint(self, box):
+        if box[0] >= box[2] or box[1] >= box[3]:
+            return
+
+        from PIL import ImageDraw
+
+        region = self._base.crop(box)
+        draw = ImageDraw.Draw(region)
+        dx, dy = box[0], box[1]
+        for item_id, item in self._items.items():
+            if not _intersects(self._extents[item_id], box):
+                continue
+            (x0, y0, x1, y1), text, font, fill = item
+            draw.rectangle([x0 - dx, y0 - dy, x1 - dx, y1 - dy], fill="white")
+            draw.text(
+                (x0 + TEXT_PADDING - dx, y0 + TEXT_PADDING - dy),
+                text,
+                fill=fill,
+                font=font,
+            )
+        self._image.paste(region, box[:2])
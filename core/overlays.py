@@ -0,0 +1,210 @@
+# pdf_editor/core/overlays.py
+
+import hashlib
+import itertools
+import json
+import math
+import os
+
+from core.cache_dir import app_cache_dir, atomic_write_bytes
+
+
+CELL_SIZE = 72.0      # lado da célula da grade, em pontos PDF (1 polegada)
+SESSION_VERSION = 1
+
+_overlay_ids = itertools.count(1)
+
+
+class TextOverlay:
+    """Uma edição de texto: área no PDF (pontos) e o texto que vai nela."""
+
+    __slots__ = ("id", "page_index", "rect", "text")
+
+    def __init__(self, page_index: int, rect, text: str = ""):
+        self.id = next(_overlay_ids)
+        self.page_index = page_index
+        self.rect = tuple(rect)
+        self.text = text
+
+    def __repr__(self):
+        return f"TextOverlay(id={self.id}, page={self.page_index}, rect={self.rect}, text={self.text!r})"
+
+
+class PageOverlays:
+    """
+    Edições de uma página, na ordem de criação, com uma grade uniforme para
+    responder "quais edições estão neste ponto/área" sem percorrer todas.
+    """
+
+    def __init__(self):
+        self._overlays = {}  # id -> TextOverlay (ordem de criação = ordem de desenho)
+        self._cells = {}     # (col, row) -> {id}
+
+    def __len__(self):
+        return len(self._overlays)
+
+    def __iter__(self):
+        return iter(list(self._overlays.values()))
+
+    def __contains__(self, overlay) -> bool:
+        return overlay.id in self._overlays
+
+    @staticmethod
+    def _cells_for(rect):
+        x0, y0, x1, y1 = rect
+        c0, r0 = math.floor(x0 / CELL_SIZE), math.floor(y0 / CELL_SIZE)
+        c1, r1 = math.floor(x1 / CELL_SIZE), math.floor(y1 / CELL_SIZE)
+        return [(c, r) for r in range(r0, r1 + 1) for c in range(c0, c1 + 1)]
+
+    def _index(self, overlay: TextOverlay):
+        for cell in self._cells_for(overlay.rect):
+            self._cells.setdefault(cell, set()).add(overlay.id)
+
+    def _unindex(self, overlay: TextOverlay):
+        for cell in self._cells_for(overlay.rect):
+            ids = self._cells.get(cell)
+            if ids is not None:
+                ids.discard(overlay.id)
+                if not ids:
+                    del self._cells[cell]
+
+    def add(self, overlay: TextOverlay):
+        self._overlays[overlay.id] = overlay
+        self._index(overlay)
+
+    def remove(self, overlay: TextOverlay):
+        if self._overlays.pop(overlay.id, None) is not None:
+            self._unindex(overlay)
+
+    def move(self, overlay: TextOverlay, rect):
+        """Altera a área de uma edição mantendo a grade atualizada (e a ordem de desenho)."""
+        self._unindex(overlay)
+        overlay.rect = tuple(rect)
+        self._index(overlay)
+
+    def in_rect(self, rect) -> list:
+        """Edições cuja área cruza `rect` (na ordem de desenho)."""
+        x0, y0, x1, y1 = rect
+        ids = set()
+        for cell in self._cells_for(rect):
+            ids.update(self._cells.get(cell, ()))
+        found = []
+        for overlay_id in ids:
+            ov = self._overlays[overlay_id]
+            ox0, oy0, ox1, oy1 = ov.rect
+            if ox0 <= x1 and x0 <= ox1 and oy0 <= y1 and y0 <= oy1:
+                found.append(ov)
+        found.sort(key=lambda ov: ov.id)
+        return found
+
+    def at(self, x, y):
+        """Edição mais acima (a última desenhada) que contém o ponto, ou None."""
+        hits = self.in_rect((x, y, x, y))
+        return hits[-1] if hits else None
+
+
+class OverlayStore:
+    """Todas as edições de texto do documento, separadas por página."""
+
+    def __init__(self):
+        self._pages = {}  # page_index -> PageOverlays
+
+    def __bool__(self):
+        return any(len(page) for page in self._pages.values())
+
+    def page(self, page_index: int) -> PageOverlays:
+        """Edições da página (contêiner vazio se não houver nenhuma)."""
+        return self._pages.get(page_index) or PageOverlays()
+
+    def pages(self) -> list:
+        return sorted(p for p, overlays in self._pages.items() if len(overlays))
+
+    def create(self, page_index: int, rect, text: str = "") -> TextOverlay:
+        overlay = TextOverlay(page_index, rect, text)
+        self._pages.setdefault(page_index, PageOverlays()).add(overlay)
+        return overlay
+
+    def remove(self, overlay: TextOverlay):
+        page = self._pages.get(overlay.page_index)
+        if page is not None:
+            page.remove(overlay)
+
+    def move(self, overlay: TextOverlay, rect):
+        self._pages.setdefault(overlay.page_index, PageOverlays()).move(overlay, rect)
+
+    def clear(self):
+        self._pages.clear()
+
+    def edits_by_page(self) -> dict:
+        """{page_index: [(rect, texto), ...]} no formato de core.pdf_edit.apply_text_overlays."""
+        return {
+            page_index: [(ov.rect, ov.text) for ov in self._pages[page_index]]
+            for page_index in self.pages()
+        }
+
+    # =============================
+    # Serialização (sessões de edição)
+    # =============================
+
+    def to_dict(self) -> dict:
+        return {
+            "version": SESSION_VERSION,
+            "pages": {
+                str(page_index): [list(ov.rect) + [ov.text] for ov in self._pages[page_index]]
+                for page_index in self.pages()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "OverlayStore":
+        if data.get("version") != SESSION_VERSION:
+            raise ValueError("Versão de sessão de edição não suportada.")
+        store = cls()
+        for page_key, items in data.get("pages", {}).items():
+            for x0, y0, x1, y1, text in items:
+                store.create(int(page_key), (x0, y0, x1, y1), text)
+        return store
+
+
+def session_path_for(pdf_path: str) -> str:
+    """Arquivo da sessão de edição de um PDF (no cache do aplicativo)."""
+    key = hashlib.sha1(os.path.normcase(os.path.abspath(pdf_path)).encode("utf-8")).hexdigest()
+    return os.path.join(app_cache_dir("sessions"), f"{key}.json")
+
+
+def save_session(store: OverlayStore, pdf_path: str):
+    """Guarda as edições pendentes do PDF; apaga a sessão se não houver nenhuma."""
+    path = session_path_for(pdf_path)
+    if not store:
+        discard_session(pdf_path)
+        return
+    st = os.stat(pdf_path)
+    data = store.to_dict()
+    data["source"] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    atomic_write_bytes(path, json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+
+def load_session(pdf_path: str):
+    """Edições salvas para o PDF, ou None se não houver (ou se o arquivo mudou desde então)."""
+    path = session_path_for(pdf_path)
+    try:
+        with open(path, "rb") as f:
+            data = json.loads(f.read().decode("utf-8"))
+        st = os.stat(pdf_path)
+    except (OSError, ValueError):
+        return None
+
+    source = data.get("source", {})
+    if source.get("size") != st.st_size or source.get("mtime_ns") != st.st_mtime_ns:
+        return None
+    try:
+        return OverlayStore.from_dict(data)
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
+def discard_session(pdf_path: str):
+    try:
+        os.remove(session_path_for(pdf_path))
+    except OSError:
+        pass
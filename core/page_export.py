@@ -0,0 +1,141 @@
+# pdf_editor/core/page_export.py
+
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import fitz  # PyMuPDF
+
+from core.imaging import save_page_image
+from core.page_ranges import split_into_chunks
+
+
+DEFAULT_PATTERN = "{name}_p{page:04d}.{ext}"
+CHUNKS_PER_WORKER = 4  # pedaços menores = progresso mais fino e cancelamento mais rápido
+
+FORMAT_EXTENSIONS = {
+    "PNG": "png",
+    "JPEG": "jpg",
+}
+
+
+PATTERN_FIELDS = ("name", "page", "index", "ext")
+
+
+def validate_pattern(pattern: str):
+    """Levanta ValueError se o padrão usa campos desconhecidos ou formatação inválida."""
+    try:
+        pattern.format(name="doc", page=1, index=0, ext="png")
+    except (KeyError, IndexError, ValueError, AttributeError) as e:
+        fields = ", ".join("{" + f + "}" for f in PATTERN_FIELDS)
+        raise ValueError(f"Padrão de nome inválido: {pattern!r} ({e}). Campos aceitos: {fields}.") from None
+
+
+def output_path_for(output_dir: str, pattern: str, pdf_path: str, page_index: int, fmt: str) -> str:
+    """
+    Monta o nome do arquivo de uma página.
+    Campos aceitos no padrão: {name}, {page} (base 1), {index} (base 0), {ext}.
+    """
+    name = os.path.splitext(os.path.basename(pdf_path))[0]
+    filename = pattern.format(
+        name=name,
+        page=page_index + 1,
+        index=page_index,
+        ext=FORMAT_EXTENSIONS[fmt],
+    )
+    return os.path.join(output_dir, filename)
+
+
+def _export_chunk(pdf_path, page_indices, output_dir, pattern, zoom, fmt, quality,
+                  progress=None, cancel_event=None):
+    """
+    Abre o PDF uma vez e exporta as páginas (roda no processo filho, ou
+    direto no modo serial, com progress(feitas) e cancelamento por página).
+    """
+    written = []
+    doc = fitz.open(pdf_path)
+    try:
+        for page_index in page_indices:
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            path = output_path_for(output_dir, pattern, pdf_path, page_index, fmt)
+            save_page_image(doc.load_page(page_index), path, zoom=zoom, fmt=fmt, jpg_quality=quality)
+            written.append(path)
+            if progress is not None:
+                progress(len(written))
+    finally:
+        doc.close()
+    return written
+
+
+def export_pages_as_images(
+    pdf_path: str,
+    output_dir: str,
+    pages=None,
+    pattern: str = DEFAULT_PATTERN,
+    zoom: float = 2.0,
+    dpi: int = None,
+    fmt: str = "PNG",
+    quality: int = 95,
+    workers: int = None,
+    progress=None,
+    cancel_event=None,
+) -> list:
+    """
+    Exporta várias páginas como PNG/JPEG em paralelo (um processo por núcleo).
+
+    - pages: índices base 0 (None = todas)
+    - dpi: se informado, substitui o zoom (zoom = dpi / 72)
+    - progress(done, total): chamado a cada pedaço concluído
+    - cancel_event: threading.Event; quando setado, nada novo é iniciado
+
+    Retorna a lista de arquivos gerados (parcial se cancelado).
+    """
+    fmt = fmt.upper()
+    if fmt == "JPG":
+        fmt = "JPEG"
+    if fmt not in FORMAT_EXTENSIONS:
+        raise ValueError(f"Formato de imagem não suportado: {fmt}")
+    validate_pattern(pattern)
+    if dpi:
+        zoom = dpi / 72.0
+
+    if pages is None:
+        with fitz.open(pdf_path) as doc:
+            pages = list(range(doc.page_count))
+    pages = list(pages)
+    total = len(pages)
+    os.makedirs(output_dir, exist_ok=True)
+
+    workers = workers or os.cpu_count() or 1
+    written = []
+
+    def cancelled():
+        return cancel_event is not None and cancel_event.is_set()
+
+    if workers <= 1 or total <= 1:
+        return _export_chunk(
+            pdf_path, pages, output_dir, pattern, zoom, fmt, quality,
+            progress=None if progress is None else (lambda done: progress(done, total)),
+            cancel_event=cancel_event,
+        )
+
+    chunks = split_into_chunks(pages, workers * CHUNKS_PER_WORKER)
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        pending = {
+            pool.submit(_export_chunk, pdf_path, chunk, output_dir, pattern, zoom, fmt, quality)
+            for chunk in chunks
+        }
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in done:
+                    written += future.result()
+                if done and progress is not None:
+                    progress(len(written), total)
+                if cancelled():
+                    break
+        finally:
+            for future in pending:
+                future.cancel()
+
+    return written
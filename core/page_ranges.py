@@ -0,0 +1,68 @@
+# pdf_editor/core/page_ranges.py
+
+
+def parse_page_range(spec: str, page_count: int) -> list:
+    """
+    Converte um intervalo digitado pelo usuário em índices de página (base 0).
+
+    Aceita números e intervalos separados por vírgula, em base 1:
+        "1-5, 8, 10-"  ->  páginas 1 a 5, 8 e da 10 até o fim
+    Vazio ou None significa o documento inteiro. A ordem é preservada e
+    páginas repetidas aparecem só uma vez.
+    """
+    if spec is None or not spec.strip():
+        return list(range(page_count))
+
+    pages = []
+    seen = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+
+        try:
+            if "-" in part:
+                start_s, end_s = part.split("-", 1)
+                start = int(start_s) if start_s.strip() else 1
+                end = int(end_s) if end_s.strip() else page_count
+            else:
+                start = end = int(part)
+        except ValueError:
+            raise ValueError(f"Intervalo de páginas inválido: '{part}'")
+
+        if not (1 <= start <= page_count and 1 <= end <= page_count):
+            raise ValueError(f"Páginas fora do intervalo (1 - {page_count}): '{part}'")
+
+        step = 1 if end >= start else -1
+        for num in range(start, end + step, step):
+            if num not in seen:
+                seen.add(num)
+                pages.append(num - 1)
+
+    return pages
+
+
+def split_into_chunks(items, n_chunks: int) -> list:
+    """Divide uma lista em até n_chunks pedaços contíguos de tamanho parecido."""
+    items = list(items)
+    n_chunks = max(1, min(n_chunks, len(items)))
+    size, extra = divmod(len(items), n_chunks)
+    chunks = []
+    start = 0
+    for i in range(n_chunks):
+        end = start + size + (1 if i < extra else 0)
+        if end > start:
+            chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+def contiguous_runs(pages) -> list:
+    """[0, 1, 2, 5, 6, 9] -> [(0, 2), (5, 6), (9, 9)] (respeitando a ordem dada)."""
+    runs = []
+    for p in pages:
+        if runs and p == runs[-1][1] + 1:
+            runs[-1][1] = p
+        else:
+            runs.append([p, p])
+    return [tuple(r) for r in runs]
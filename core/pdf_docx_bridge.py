@@ -1,19 +1,169 @@
 # pdf_editor/core/pdf_docx_bridge.py
 
+import glob
 import os
-from pdf2docx import Converter
-from docx2pdf import convert as docx_to_pdf_convert
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
 
+# pdf2docx (OpenCV, numpy, lxml) e docx2pdf (automação do Word) são pesados:
+# só são importados na primeira conversão.
 
-def pdf_to_docx(pdf_path: str, docx_path: str):
+
+def _is_contiguous(pages) -> bool:
+    return all(b == a + 1 for a, b in zip(pages, pages[1:]))
+
+
+def pdf_to_docx(pdf_path: str, docx_path: str, pages=None, workers: int = 1):
     """
     Converte um PDF em DOCX.
+
+    - pages: índices base 0 (None = todas)
+    - workers > 1: usa o modo multiprocessado do pdf2docx (a análise de
+      layout de cada faixa de páginas roda em um processo). O pdf2docx só
+      aceita isso para páginas contínuas; outras seleções rodam em série.
     """
+    from pdf2docx import Converter
+
+    kwargs = {}
+    if pages is not None:
+        pages = list(pages)
+        if not pages:
+            raise ValueError("Nenhuma página selecionada.")
+        if _is_contiguous(pages):
+            kwargs.update(start=pages[0], end=pages[-1] + 1)
+        else:
+            kwargs.update(pages=pages)
+    if workers > 1 and "pages" not in kwargs:
+        kwargs.update(multi_processing=True, cpu_count=workers)
+
     cv = Converter(pdf_path)
     try:
-        cv.convert(docx_path)
+        cv.convert(docx_path, **kwargs)
     finally:
         cv.close()
+    return docx_path
+
+
+def _convert_one(pdf_path: str, docx_path: str, page_spec: str = None):
+    # Roda no processo de trabalho do lote
+    pages = None
+    if page_spec:
+        import fitz  # PyMuPDF
+
+        from core.page_ranges import parse_page_range
+
+        with fitz.open(pdf_path) as doc:
+            pages = parse_page_range(page_spec, len(doc))
+    return pdf_to_docx(pdf_path, docx_path, pages=pages)
+
+
+def pdfs_to_docx_batch(pairs, workers: int = None, page_spec: str = None,
+                       progress=None, cancel_event=None) -> list:
+    """
+    Converte vários PDFs em DOCX, um arquivo por processo.
+
+    pairs: [(pdf_path, docx_path), ...]
+    page_spec: intervalo em base 1 aplicado a cada arquivo (ex.: "1-3")
+    progress(done, total, result): chamado a cada arquivo concluído
+    cancel_event: threading.Event; quando setado, nada novo é iniciado
+
+    Um arquivo com erro (corrompido, protegido...) não interrompe o lote: o
+    erro fica no resultado dele. Se um processo morrer de vez (o pool fica
+    "quebrado"), só os arquivos que estavam em andamento são repetidos um a
+    um, para achar o culpado; os que ainda não tinham começado voltam para um
+    pool novo com `workers` processos.
+
+    Retorna [{"input", "output", "ok", "error"}] na ordem de `pairs` (arquivos
+    não iniciados por causa do cancelamento ficam de fora).
+    """
+    pairs = list(pairs)
+    workers = max(1, workers or os.cpu_count() or 1)
+    results = [None] * len(pairs)
+    done = 0
+
+    def finish(index, error=None):
+        nonlocal done
+        src, dst = pairs[index]
+        results[index] = {
+            "input": src,
+            "output": dst,
+            "ok": error is None,
+            "error": None if error is None else str(error) or type(error).__name__,
+        }
+        done += 1
+        if progress is not None:
+            progress(done, len(pairs), results[index])
+
+    def cancelled():
+        return cancel_event is not None and cancel_event.is_set()
+
+    def run(indices, pool_size):
+        """
+        Converte `indices`. Retorna (suspeitos, não iniciados): os que estavam
+        em andamento quando o pool quebrou e os que nem chegaram a ser enviados.
+        """
+        pending = list(indices)
+        in_flight = {}
+        pool = ProcessPoolExecutor(max_workers=pool_size)
+        try:
+            while pending or in_flight:
+                while pending and len(in_flight) < pool_size * 2 and not cancelled():
+                    index = pending.pop(0)
+                    src, dst = pairs[index]
+                    in_flight[pool.submit(_convert_one, src, dst, page_spec)] = index
+                if not in_flight:
+                    break
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                broken = []
+                for future in finished:
+                    index = in_flight.pop(future)
+                    try:
+                        future.result()
+                    except BrokenProcessPool:
+                        broken.append(index)
+                    except Exception as e:
+                        finish(index, e)
+                    else:
+                        finish(index)
+                if broken:
+                    return broken + list(in_flight.values()), pending
+            return [], pending
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    pending = list(range(len(pairs)))
+    while pending and not cancelled():
+        suspects, pending = run(pending, workers)
+        # Um por vez: só o arquivo que derruba o processo falha
+        for index in sorted(suspects):
+            if cancelled():
+                break
+            if run([index], 1)[0]:
+                finish(index, RuntimeError("O processo de conversão foi encerrado inesperadamente."))
+
+    return [r for r in results if r is not None]
+
+
+def convert_folder_to_docx(input_dir: str, output_dir: str = None, recursive: bool = False,
+                           **kwargs) -> list:
+    """
+    Converte todos os PDFs de uma pasta (e subpastas, se recursive) para DOCX.
+    Os .docx vão para output_dir (mesma estrutura de subpastas) ou ficam ao
+    lado de cada PDF. Demais argumentos: ver pdfs_to_docx_batch.
+    """
+    pattern = os.path.join(input_dir, "**", "*.pdf") if recursive else os.path.join(input_dir, "*.pdf")
+    pdf_paths = sorted(glob.glob(pattern, recursive=recursive))
+
+    pairs = []
+    for pdf_path in pdf_paths:
+        base = os.path.splitext(pdf_path)[0]
+        if output_dir is not None:
+            base = os.path.join(output_dir, os.path.relpath(base, input_dir))
+            os.makedirs(os.path.dirname(base), exist_ok=True)
+        pairs.append((pdf_path, base + ".docx"))
+
+    return pdfs_to_docx_batch(pairs, **kwargs)
 
 
 def docx_to_pdf(docx_path: str, pdf_path: str = None):
@@ -25,5 +175,7 @@ def docx_to_pdf(docx_path: str, pdf_path: str = None):
         base, _ = os.path.splitext(docx_path)
         pdf_path = base + ".pdf"
 
+    from docx2pdf import convert as docx_to_pdf_convert
+
     docx_to_pdf_convert(docx_path, pdf_path)
     return pdf_path
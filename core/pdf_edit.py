@@ -0,0 +1,110 @@
+# pdf_editor/core/pdf_edit.py
+
+import fitz  # PyMuPDF
+
+from core.perf import timed
+
+
+def _link_font(doc, page, fontname: str, font_xref: int) -> bool:
+    """
+    Coloca uma fonte já existente no documento (font_xref) nos recursos da
+    página, com o nome `fontname`. Segue /Resources e /Font quando são
+    referências indiretas. Retorna False se a página herda os recursos (aí
+    não dá para alterá-los só para ela).
+    """
+    target, path = page.xref, "Resources"
+    kind, value = doc.xref_get_key(target, path)
+    if kind == "null":
+        return False
+    if kind == "xref":
+        target, path = int(value.split()[0]), "Font"
+    else:
+        path = "Resources/Font"
+
+    kind, value = doc.xref_get_key(target, path)
+    if kind == "xref":
+        target, path = int(value.split()[0]), fontname
+    else:
+        path = f"{path}/{fontname}"
+
+    doc.xref_set_key(target, path, f"{font_xref} 0 R")
+    return True
+
+
+def ensure_page_font(page, fontname: str, font_xrefs: dict):
+    """
+    Garante que a fonte `fontname` esteja na página, registrando-a uma única
+    vez por documento: a primeira página recebe a fonte (page.insert_font) e
+    as demais apenas apontam para o mesmo objeto. Sem isso, cada
+    insert_textbox em uma página nova cria outra cópia da fonte.
+
+    font_xrefs: {fontname: xref}, mantido pelo chamador por documento.
+    """
+    if any(font[4] == fontname for font in page.get_fonts()):
+        return
+
+    doc = page.parent
+    font_xref = font_xrefs.get(fontname)
+    if font_xref is not None and _link_font(doc, page, fontname, font_xref):
+        return
+
+    xref = page.insert_font(fontname=fontname)
+    font_xrefs.setdefault(fontname, xref)
+
+
+def apply_text_overlays(doc, overlays_by_page, fontname: str = "helv", fontsize: float = 12,
+                        color=(0, 0, 0), progress=None, font_xrefs: dict = None):
+    """
+    Aplica edições de texto em um fitz.Document já aberto.
+
+    overlays_by_page: {page_index: [((x0, y0, x1, y1), texto), ...]}
+    Cada área é pintada de branco e o novo texto é escrito por cima.
+    As edições de uma página vão para um único content stream, e a fonte é
+    registrada uma vez no documento (font_xrefs pode ser reaproveitado entre
+    chamadas no mesmo documento).
+    Retorna o número de edições aplicadas.
+    """
+    if font_xrefs is None:
+        font_xrefs = {}
+
+    applied = 0
+    total = sum(len(items) for items in overlays_by_page.values())
+    for page_index, items in overlays_by_page.items():
+        items = [(rect, (text or "").strip()) for rect, text in items]
+        items = [(rect, text) for rect, text in items if text]
+        if not items:
+            continue
+
+        page = doc.load_page(page_index)
+        ensure_page_font(page, fontname, font_xrefs)
+
+        shape = page.new_shape()
+        for pdf_rect, text in items:
+            rect_overlay = fitz.Rect(*pdf_rect)
+            shape.draw_rect(rect_overlay)
+            shape.finish(color=(1, 1, 1), fill=(1, 1, 1))
+            shape.insert_textbox(
+                rect_overlay,
+                text,
+                fontsize=fontsize,
+                fontname=fontname,
+                color=color,
+                align=0,
+            )
+            applied += 1
+            if progress is not None:
+                progress(applied, total)
+        shape.commit()
+    return applied
+
+
+@timed("edit.apply_overlays_to_file")
+def apply_text_overlays_to_file(pdf_path: str, out_path: str, overlays_by_page, **kwargs) -> int:
+    """Abre o PDF, aplica as edições e salva em out_path (documento próprio, seguro em threads)."""
+    doc = fitz.open(pdf_path)
+    try:
+        applied = apply_text_overlays(doc, overlays_by_page, **kwargs)
+        doc.save(out_path, garbage=1, deflate=True)
+        return applied
+    finally:
+        doc.close()
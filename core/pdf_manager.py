@@ -1,29 +1,213 @@
 # pdf_editor/core/pdf_manager.py
 
-import fitz  # PyMuPDF
-from PIL import Image
+import itertools
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
 import os
 
+from core.cache_dir import file_content_hash, peek_content_hash
+from core.perf import span, timed
+from core.render_cache import RenderCache, DEFAULT_MAX_BYTES, image_nbytes
+from core.word_index import WordIndex
+
+# O PDFManager é criado junto com a janela, antes de haver documento: o
+# PyMuPDF (fitz), o PIL e os módulos que dependem deles são importados no
+# primeiro uso, para não atrasar a primeira pintura.
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+_doc_ids = itertools.count(1)
+
+DEFAULT_TILE_CACHE_BYTES = 64 * 1024 * 1024  # o visualizador ajusta ao tamanho da janela
+DISPLAY_LIST_PAGES = 2  # páginas com DisplayList guardado (usado pelos ladrilhos)
+
 
 class PDFManager:
-    def __init__(self):
+    def __init__(self, cache_max_bytes: int = DEFAULT_MAX_BYTES, disk_cache=None):
         self.doc = None   # fitz.Document
         self.path = None
         self.current_page_index = 0
 
+        # Identidade do documento aberto no cache de renderização.
+        # Muda a cada abertura e a cada modificação do documento.
+        self.doc_id = None
+        self.render_cache = RenderCache(max_bytes=cache_max_bytes)
+        # Opcional (DiskRenderCache): páginas renderizadas em sessões anteriores
+        self.disk_cache = disk_cache
+        # True quando o documento em memória difere do arquivo em disco
+        self.has_unsaved_changes = False
+        # page_index -> (doc_id, WordIndex)
+        self._word_indexes = {}
+        # fontname -> xref das fontes já inseridas pelo editor neste documento
+        self._font_xrefs = {}
+
+        # Ladrilhos do zoom profundo: chave (doc_id, page_index, zoom, tx, ty, colorspace)
+        self.tile_cache = RenderCache(max_bytes=DEFAULT_TILE_CACHE_BYTES)
+        # page_index -> (doc_id, fitz.DisplayList), poucas páginas (LRU)
+        self._display_lists = OrderedDict()
+
+    @timed("pdf.open")
     def open_pdf(self, path: str):
         """Abre um PDF e reseta o índice de página."""
+        import fitz  # PyMuPDF
+
+        self.adopt_document(fitz.open(path), path)
+
+    def open_stream(self, data: bytes, path: str = None):
+        """
+        Abre um PDF a partir de bytes já em memória. `path` (opcional) é o
+        arquivo de origem, usado por quem relê do disco (prefetch, busca).
+        """
+        import fitz  # PyMuPDF
+
+        self.adopt_document(fitz.open(stream=data, filetype="pdf"), path)
+
+    def adopt_document(self, doc, path: str = None):
+        """
+        Passa a usar um fitz.Document já aberto (ex.: aberto numa thread por
+        core.pdf_open). Quem abriu não deve mais usá-lo.
+        """
         self.close()
-        self.doc = fitz.open(path)
+        self.doc = doc
         self.path = path
         self.current_page_index = 0
+        self.doc_id = next(_doc_ids)
+        self.has_unsaved_changes = False
+        self._start_content_hash()
 
     def close(self):
         if self.doc is not None:
             self.doc.close()
+        if self.doc_id is not None:
+            self.render_cache.invalidate(self.doc_id)
+            self.tile_cache.invalidate(self.doc_id)
+        self._display_lists.clear()
         self.doc = None
         self.path = None
         self.current_page_index = 0
+        self.doc_id = None
+        self.has_unsaved_changes = False
+        self._word_indexes.clear()
+        self._font_xrefs.clear()
+
+    def mark_modified(self, page_index: int = None):
+        """
+        Avisa que o documento foi alterado em memória.
+        Descarta as renderizações em cache (de uma página ou de todas).
+        """
+        if self.doc_id is None:
+            return
+        self.has_unsaved_changes = True
+        if page_index is not None:
+            self.render_cache.invalidate(self.doc_id, page_index)
+            self.tile_cache.invalidate(self.doc_id, page_index)
+            self._word_indexes.pop(page_index, None)
+            self._display_lists.pop(page_index, None)
+            return
+        self.render_cache.invalidate(self.doc_id)
+        self.tile_cache.invalidate(self.doc_id)
+        self._word_indexes.clear()
+        self._display_lists.clear()
+        self.doc_id = next(_doc_ids)
+
+    def can_save_in_place(self) -> bool:
+        """True se o arquivo aberto aceita salvamento incremental."""
+        return (
+            self.doc is not None
+            and self.path is not None
+            # Aberto da memória (stream): não há arquivo de origem para anexar
+            and bool(self.doc.name)
+            and self.doc.can_save_incrementally()
+        )
+
+    @timed("pdf.apply_text_overlays")
+    def apply_text_overlays(self, overlays_by_page, **style) -> int:
+        """Aplica edições de texto no documento aberto (em memória)."""
+        if self.doc is None:
+            raise RuntimeError("Nenhum documento aberto.")
+        from core.pdf_edit import apply_text_overlays
+
+        applied = apply_text_overlays(
+            self.doc, overlays_by_page, font_xrefs=self._font_xrefs, **style
+        )
+        for page_index in overlays_by_page:
+            self.mark_modified(page_index)
+        return applied
+
+    def revert_to_saved(self):
+        """
+        Descarta as alterações em memória reabrindo o arquivo do disco
+        (a página atual é mantida).
+        """
+        if self.path is None:
+            raise RuntimeError("Nenhum arquivo para reabrir.")
+        page_index = self.current_page_index
+        self.open_pdf(self.path)
+        self.go_to_page(page_index)
+
+    @timed("pdf.save_in_place")
+    def save_in_place(self):
+        """
+        Grava as alterações no próprio arquivo com salvamento incremental: só
+        os objetos alterados são anexados ao final, e o documento continua
+        aberto (nada é relido do disco).
+        """
+        if not self.can_save_in_place():
+            raise RuntimeError("Este PDF não permite salvamento incremental.")
+        import fitz  # PyMuPDF
+
+        self.doc.save(self.path, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
+        self.has_unsaved_changes = False
+
+        # O arquivo mudou: novo doc_id para quem abre o arquivo por conta própria
+        # (prefetch, índice de busca). As páginas não alteradas continuam válidas.
+        old_id, self.doc_id = self.doc_id, next(_doc_ids)
+        self.render_cache.rekey(old_id, self.doc_id)
+        self.tile_cache.rekey(old_id, self.doc_id)
+        self._display_lists = OrderedDict(
+            (page_index, (self.doc_id, dlist))
+            for page_index, (doc_id, dlist) in self._display_lists.items()
+            if doc_id == old_id
+        )
+        self._word_indexes = {
+            page_index: (self.doc_id, index)
+            for page_index, (doc_id, index) in self._word_indexes.items()
+            if doc_id == old_id
+        }
+        self._start_content_hash()
+
+    def _start_content_hash(self):
+        """
+        Calcula o hash do arquivo numa thread (arquivos grandes levam um
+        tempo). Até ficar pronto, o cache em disco é simplesmente ignorado.
+        """
+        if self.disk_cache is None or self.path is None:
+            return
+        path = self.path
+
+        def compute():
+            try:
+                file_content_hash(path)
+            except OSError:
+                pass
+
+        threading.Thread(target=compute, name="content-hash", daemon=True).start()
+
+    def _disk_key(self, page_index: int, zoom: float, colorspace: str):
+        """Chave no cache em disco, ou None se ele não se aplica agora."""
+        if self.disk_cache is None or self.path is None or self.has_unsaved_changes:
+            # Com alterações em memória, a página não corresponde ao arquivo
+            return None
+        digest = peek_content_hash(self.path)
+        if digest is None:
+            return None
+        return digest, page_index, zoom, colorspace
+
+    def render_cache_stats(self) -> dict:
+        """Contadores do cache de renderização (hits, misses, evictions...)."""
+        return self.render_cache.stats()
 
     def page_count(self) -> int:
         if self.doc is None:
@@ -51,17 +235,123 @@ class PDFManager:
         if self.current_page_index > 0:
             self.current_page_index -= 1
 
-    def render_current_page_image(self, zoom: float = 1.8) -> Image.Image:
+    def render_current_page_image(self, zoom: float = 1.8, colorspace: str = "RGB") -> "Image.Image":
         """Retorna a página atual como PIL.Image."""
+        return self.render_page_image(self.current_page_index, zoom=zoom, colorspace=colorspace)
+
+    def render_page_image(self, page_index: int, zoom: float = 1.8, colorspace: str = "RGB") -> "Image.Image":
+        """
+        Retorna uma página como PIL.Image, usando o cache de renderização.
+        A imagem retornada é compartilhada com o cache: faça copy() antes de desenhar nela.
+        """
         if self.doc is None:
             raise RuntimeError("Nenhum documento aberto.")
+        if not (0 <= page_index < len(self.doc)):
+            raise IndexError("Índice de página inválido.")
+
+        with span("pdf.render_page", page=page_index, zoom=zoom) as s:
+            key = (self.doc_id, page_index, zoom, colorspace)
+            img = self.render_cache.get(key)
+            if img is not None:
+                s.set(cache="hit")
+                return img
 
-        page = self.doc.load_page(self.current_page_index)
-        mat = fitz.Matrix(zoom, zoom)
-        pix = page.get_pixmap(matrix=mat, alpha=False)
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-        return img
+            disk_key = self._disk_key(page_index, zoom, colorspace)
+            if disk_key is not None:
+                img = self.disk_cache.get(disk_key)
+                if img is not None:
+                    s.set(cache="disk", bytes=image_nbytes(img))
+                    self.render_cache.put(key, img)
+                    return img
 
+            from core.imaging import render_page_to_image
+
+            page = self.doc.load_page(page_index)
+            img = render_page_to_image(page, zoom=zoom, colorspace=colorspace)
+            s.set(cache="miss", bytes=image_nbytes(img))
+
+            self.render_cache.put(key, img)
+            if disk_key is not None:
+                self.disk_cache.put(disk_key, img)
+            return img
+
+    def _display_list(self, page_index: int):
+        """DisplayList da página (o conteúdo é interpretado uma vez para todos os ladrilhos)."""
+        cached = self._display_lists.get(page_index)
+        if cached is not None and cached[0] == self.doc_id:
+            self._display_lists.move_to_end(page_index)
+            return cached[1]
+
+        dlist = self.doc.load_page(page_index).get_displaylist()
+        self._display_lists[page_index] = (self.doc_id, dlist)
+        while len(self._display_lists) > DISPLAY_LIST_PAGES:
+            self._display_lists.popitem(last=False)
+        return dlist
+
+    def cached_tile(self, page_index: int, zoom: float, tx: int, ty: int, colorspace: str = "RGB"):
+        """Ladrilho já renderizado (ou None), sem renderizar."""
+        return self.tile_cache.get((self.doc_id, page_index, zoom, tx, ty, colorspace))
+
+    def render_tile(self, page_index: int, zoom: float, tx: int, ty: int,
+                    colorspace: str = "RGB", tile_size: int = None) -> "Image.Image":
+        """
+        Ladrilho (tx, ty) de TILE_SIZE px (core.tiles) da página no zoom dado, via cache.
+        Só o recorte do ladrilho é rasterizado (clip), então o custo não
+        cresce com o zoom. A imagem é compartilhada com o cache.
+        """
+        if self.doc is None:
+            raise RuntimeError("Nenhum documento aberto.")
+        if not (0 <= page_index < len(self.doc)):
+            raise IndexError("Índice de página inválido.")
+
+        with span("pdf.render_tile", page=page_index, zoom=zoom) as s:
+            key = (self.doc_id, page_index, zoom, tx, ty, colorspace)
+            img = self.tile_cache.get(key)
+            if img is not None:
+                s.set(cache="hit")
+                return img
+
+            from core.tiles import TILE_SIZE, render_tile_image
+
+            img = render_tile_image(self._display_list(page_index), zoom, tx, ty, tile_size or TILE_SIZE, colorspace)
+            s.set(cache="miss", bytes=image_nbytes(img))
+            self.tile_cache.put(key, img)
+            return img
+
+    def is_page_cached(self, page_index: int, zoom: float = 1.8, colorspace: str = "RGB") -> bool:
+        """Indica se a página já está no cache (sem mexer nos contadores)."""
+        return (self.doc_id, page_index, zoom, colorspace) in self.render_cache
+
+    def store_rendered_page(self, doc_id, page_index: int, zoom: float, colorspace: str, img: "Image.Image"):
+        """
+        Guarda no cache uma página renderizada fora daqui (ex.: prefetch).
+        Resultados de um documento que já foi fechado/modificado são ignorados.
+        """
+        if doc_id is None or doc_id != self.doc_id:
+            return
+        self.render_cache.put((doc_id, page_index, zoom, colorspace), img)
+        disk_key = self._disk_key(page_index, zoom, colorspace)
+        if disk_key is not None:
+            self.disk_cache.put(disk_key, img)
+
+    @timed("pdf.word_index")
+    def get_word_index(self, page_index: int) -> WordIndex:
+        """Índice espacial das palavras da página (construído uma vez por documento)."""
+        if self.doc is None:
+            raise RuntimeError("Nenhum documento aberto.")
+        if not (0 <= page_index < len(self.doc)):
+            raise IndexError("Índice de página inválido.")
+
+        cached = self._word_indexes.get(page_index)
+        if cached is not None and cached[0] == self.doc_id:
+            return cached[1]
+
+        page = self.doc.load_page(page_index)
+        index = WordIndex(page.get_text("words"), page.rect)
+        self._word_indexes[page_index] = (self.doc_id, index)
+        return index
+
+    @timed("pdf.extract_page_as_image")
     def extract_page_as_image(self, page_index: int, path: str, zoom: float = 2.0):
         """Exporta uma página específica como imagem PNG/JPEG."""
         if self.doc is None:
@@ -71,10 +361,6 @@ class PDFManager:
             raise IndexError("Índice de página inválido.")
 
         page = self.doc.load_page(page_index)
-        mat = fitz.Matrix(zoom, zoom)
-        pix = page.get_pixmap(matrix=mat, alpha=False)
-
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
 
         ext = os.path.splitext(path)[1].lower()
         if ext in [".jpg", ".jpeg"]:
@@ -82,7 +368,9 @@ class PDFManager:
         else:
             fmt = "PNG"
 
-        img.save(path, format=fmt)
+        from core.imaging import save_page_image
+
+        save_page_image(page, path, zoom=zoom, fmt=fmt)
 
     def extract_current_page_as_image(self, path: str, zoom: float = 2.0):
         """Exporta a página atual como imagem (atalho)."""
@@ -90,15 +378,97 @@ class PDFManager:
             raise RuntimeError("Nenhum documento aberto.")
         self.extract_page_as_image(self.current_page_index, path, zoom=zoom)
 
+    def export_pages_as_images(self, output_dir: str, pages=None, **kwargs) -> list:
+        """
+        Exporta várias páginas do arquivo aberto como imagens, em paralelo.
+        Os processos leem o arquivo em disco (ver core.page_export).
+        """
+        if self.doc is None:
+            raise RuntimeError("Nenhum documento aberto.")
+        from core.page_export import export_pages_as_images
+
+        return export_pages_as_images(self.path, output_dir, pages=pages, **kwargs)
+
+    @timed("pdf.split")
+    def split(self, output_dir: str, parts, workers: int = 1, **kwargs) -> list:
+        """
+        Divide o documento aberto em vários PDFs (partes: ver core.pdf_split).
+        Com workers > 1 os processos leem o arquivo em disco; por isso
+        edições não salvas forçam o modo serial, a partir do documento em memória.
+        """
+        if self.doc is None:
+            raise RuntimeError("Nenhum documento aberto.")
+        from core.pdf_split import split_pdf, write_parts_from_doc, output_paths
+
+        if not self.has_unsaved_changes and self.path:
+            return split_pdf(self.path, output_dir, parts, workers=workers, **kwargs)
+
+        parts = [p for p in parts if len(p.pages)]
+        os.makedirs(output_dir, exist_ok=True)
+        name = self.path or "documento.pdf"
+        jobs = list(zip(output_paths(name, output_dir, parts), [list(p.pages) for p in parts]))
+        return write_parts_from_doc(self.doc, jobs, **kwargs)
+
+    def extract_pages(self, output_path: str, pages, keep_outlines: bool = True) -> str:
+        """Copia as páginas (base 0) do documento aberto, com as edições em memória, para um PDF novo."""
+        if self.doc is None:
+            raise RuntimeError("Nenhum documento aberto.")
+        from core.pdf_split import write_parts_from_doc
+
+        return write_parts_from_doc(self.doc, [(output_path, list(pages))], keep_outlines)[0]
+
+    @timed("pdf.extract_text")
     def extract_text(self) -> str:
         """Extrai todo o texto do PDF como uma string."""
+        from core.text_extract import PAGE_SEPARATOR
+
+        return PAGE_SEPARATOR.join(text for _, text in self.iter_text())
+
+    def iter_text(self, pages=None):
+        """Gera (page_index, texto) página a página (pages: índices base 0, None = todas)."""
         if self.doc is None:
             raise RuntimeError("Nenhum documento aberto.")
+        from core.text_extract import iter_page_texts
+
+        return iter_page_texts(self.doc, pages)
+
+    def snapshot_source(self):
+        """
+        Fonte independente do documento aberto, para trabalhos em outra thread
+        (um fitz.Document não pode ser usado por duas threads): o caminho do
+        arquivo, se não há alterações em memória, ou os bytes do documento.
+        Chame na thread da interface.
+        """
+        if self.doc is None:
+            raise RuntimeError("Nenhum documento aberto.")
+        if self.has_unsaved_changes or not self.path or not self.doc.name:
+            return self.doc.tobytes()
+        return self.path
+
+    @timed("pdf.extract_text_to_file")
+    def extract_text_to_file(self, out_path: str, pages=None, workers: int = 1,
+                             progress=None, cancel_event=None) -> int:
+        """
+        Grava o texto direto em um arquivo, página a página.
+        Com workers > 1 as páginas são divididas entre processos, que leem o
+        arquivo em disco; por isso edições não salvas forçam o modo serial.
+        """
+        if self.doc is None:
+            raise RuntimeError("Nenhum documento aberto.")
+        from core.text_extract import iter_page_texts, iter_page_texts_parallel, write_page_texts
+
+        if pages is None:
+            pages = range(len(self.doc))
+        pages = list(pages)
+
+        if workers > 1 and not self.has_unsaved_changes:
+            page_texts = iter_page_texts_parallel(self.path, pages, workers=workers)
+        else:
+            page_texts = iter_page_texts(self.doc, pages)
 
-        texts = []
-        for page in self.doc:
-            texts.append(page.get_text())
-        return "\n".join(texts)
+        return write_page_texts(
+            page_texts, out_path, progress=progress, total=len(pages), cancel_event=cancel_event
+        )
 
     def extract_text_page(self, page_index: int) -> str:
         """Extrai texto de uma página específica."""
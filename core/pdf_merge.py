@@ -1,10 +1,22 @@
 # pdf_editor/core/pdf_merge.py
 
-from pypdf import PdfWriter, PdfReader
+import bisect
+import math
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
+import fitz  # PyMuPDF
 
+from core.page_ranges import contiguous_runs
+from core.perf import timed
+
+
+@timed("merge.pypdf")
 def merge_pdfs(input_paths, output_path):
     """Mescla uma lista de PDFs em um único arquivo."""
+    from pypdf import PdfWriter, PdfReader  # só quem usa o motor pypdf paga a importação
+
     writer = PdfWriter()
 
     for pdf_path in input_paths:
@@ -14,3 +26,159 @@ def merge_pdfs(input_paths, output_path):
 
     with open(output_path, "wb") as f:
         writer.write(f)
+
+
+def _remap_toc(toc, page_map, fallback_index):
+    """
+    Ajusta o sumário de um arquivo de entrada para as páginas do arquivo mesclado.
+    Entradas que apontam para páginas não selecionadas vão para a próxima página
+    selecionada (ou a última), para não quebrar a hierarquia de níveis.
+    """
+    if not page_map:
+        return []
+    selected = sorted(page_map)
+    remapped = []
+    for entry in toc:
+        level, title, page = entry[0], entry[1], entry[2]
+        old_index = page - 1
+        if old_index in page_map:
+            new_index = page_map[old_index]
+        else:
+            i = bisect.bisect_left(selected, old_index)
+            new_index = page_map[selected[i]] if i < len(selected) else fallback_index
+        remapped.append([level, title, new_index + 1])
+    return remapped
+
+
+@timed("merge.dedup")
+def merge_pdfs_dedup(inputs, output_path, garbage: int = 4, deflate: bool = True,
+                     keep_outlines: bool = True) -> dict:
+    """
+    Mescla PDFs com o PyMuPDF (insert_pdf), sem duplicar recursos.
+
+    `inputs` é uma lista de caminhos ou de (caminho, páginas), onde páginas são
+    índices base 0 (None = todas). Fontes e imagens repetidas entre os arquivos
+    (papel timbrado, logotipo...) são unificadas no salvamento com garbage=4,
+    que também compara o conteúdo dos streams. O sumário (bookmarks) de cada
+    arquivo é preservado, com as páginas ajustadas.
+
+    Retorna {"pages": total de páginas, "inputs": número de arquivos}.
+    """
+    out = fitz.open()
+    merged_toc = []
+    try:
+        for item in inputs:
+            if isinstance(item, (tuple, list)):
+                path, pages = item
+            else:
+                path, pages = item, None
+
+            src = fitz.open(path)
+            try:
+                if pages is None:
+                    pages = range(src.page_count)
+                pages = list(pages)
+
+                start = out.page_count
+                page_map = {}
+                for first, last in contiguous_runs(pages):
+                    # links=True (padrão): links internos entre páginas copiadas são mantidos
+                    out.insert_pdf(src, from_page=first, to_page=last)
+                for offset, old_index in enumerate(pages):
+                    page_map.setdefault(old_index, start + offset)
+
+                if keep_outlines and pages:
+                    merged_toc += _remap_toc(src.get_toc(simple=True), page_map, out.page_count - 1)
+            finally:
+                src.close()
+
+        if merged_toc:
+            out.set_toc(merged_toc)
+
+        out.save(output_path, garbage=garbage, deflate=deflate)
+        return {"pages": out.page_count, "inputs": len(inputs)}
+    finally:
+        out.close()
+
+
+DEFAULT_CHUNK_SIZE = 64
+
+
+def _merge_chunk(paths, output_path, garbage):
+    """Mescla um pedaço em arquivo intermediário (pode rodar em outro processo)."""
+    merge_pdfs_dedup(paths, output_path, garbage=garbage, deflate=False)
+    return output_path
+
+
+@timed("merge.hierarchical")
+def merge_pdfs_hierarchical(input_paths, output_path, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                            workers: int = 1, dedup: bool = True, temp_dir: str = None,
+                            progress=None) -> dict:
+    """
+    Mescla milhares de PDFs com número limitado de arquivos abertos.
+
+    As entradas são mescladas em pedaços de `chunk_size` em arquivos
+    temporários; os temporários são mesclados do mesmo jeito, nível a nível,
+    até sobrar um pedaço, que vira o arquivo final. Cada mesclagem abre um
+    arquivo de entrada por vez, então o uso de memória depende do tamanho de
+    um pedaço (e do documento final), não da quantidade de entradas.
+
+    - workers > 1: os pedaços de cada nível são mesclados em paralelo
+    - dedup: garbage=4 no arquivo final (recursos repetidos unificados)
+    - progress(done, total): chamado a cada pedaço concluído
+    """
+    if chunk_size < 2:
+        raise ValueError("chunk_size deve ser pelo menos 2.")
+
+    paths = list(input_paths)
+    n_inputs = len(paths)
+    final_garbage = 4 if dedup else 1
+
+    # Total de mesclagens (para o progresso): pedaços de cada nível + a final
+    total_steps = 1
+    n = len(paths)
+    while n > chunk_size:
+        n = math.ceil(n / chunk_size)
+        total_steps += n
+    done_steps = 0
+
+    def step_done():
+        nonlocal done_steps
+        done_steps += 1
+        if progress is not None:
+            progress(done_steps, total_steps)
+
+    with tempfile.TemporaryDirectory(prefix="merge_", dir=temp_dir) as tmp:
+        level = 0
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            while len(paths) > chunk_size:
+                groups = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+                outs = [os.path.join(tmp, f"nivel{level}_{i:06d}.pdf") for i in range(len(groups))]
+
+                if pool is None:
+                    for group, out in zip(groups, outs):
+                        _merge_chunk(group, out, 1)
+                        step_done()
+                else:
+                    futures = [pool.submit(_merge_chunk, g, o, 1) for g, o in zip(groups, outs)]
+                    for future in as_completed(futures):
+                        future.result()
+                        step_done()
+
+                if level > 0:
+                    # Intermediários do nível anterior não são mais necessários
+                    for old in paths:
+                        os.remove(old)
+                paths = outs
+                level += 1
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        result = merge_pdfs_dedup(paths, output_path, garbage=final_garbage)
+        step_done()
+
+    result["inputs"] = n_inputs
+    result["levels"] = level
+    return result
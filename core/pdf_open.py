@@ -0,0 +1,113 @@
+# pdf_editor/core/pdf_open.py
+
+import os
+import sys
+
+import fitz  # PyMuPDF
+
+from core.cache_dir import start_content_hash_from_bytes
+
+
+STREAM_CHUNK_SIZE = 16 * 1024 * 1024    # leituras grandes e sequenciais
+STREAM_MAX_BYTES = 512 * 1024 * 1024    # acima disso o arquivo não é carregado na memória
+NETWORK_FS_TYPES = {"nfs", "nfs4", "cifs", "smbfs", "smb3", "fuse.sshfs", "9p", "afs"}
+_DRIVE_REMOTE = 4  # GetDriveTypeW
+
+
+def is_network_path(path: str) -> bool:
+    """True se o arquivo está num compartilhamento de rede (UNC, unidade mapeada, NFS/SMB)."""
+    path = os.path.abspath(path)
+    if path.startswith("\\\\") or path.startswith("//"):
+        return True
+
+    if sys.platform == "win32":
+        drive = os.path.splitdrive(path)[0]
+        if not drive:
+            return False
+        import ctypes
+
+        return ctypes.windll.kernel32.GetDriveTypeW(drive + "\\") == _DRIVE_REMOTE
+
+    # Linux: tipo do sistema de arquivos do ponto de montagem mais próximo
+    try:
+        with open("/proc/mounts", encoding="utf-8") as f:
+            mounts = [line.split()[1:3] for line in f if len(line.split()) >= 3]
+    except OSError:
+        return False
+    best, best_type = "", None
+    for mount_point, fs_type in mounts:
+        mount_point = mount_point.replace("\\040", " ")
+        prefix = mount_point.rstrip("/") + "/"
+        if (path == mount_point or path.startswith(prefix)) and len(mount_point) > len(best):
+            best, best_type = mount_point, fs_type
+    return best_type in NETWORK_FS_TYPES
+
+
+def read_sequential(path: str, chunk_size: int = STREAM_CHUNK_SIZE, progress=None,
+                    cancel_event=None):
+    """
+    Lê o arquivo inteiro em blocos grandes, do início ao fim. Retorna bytes,
+    ou None se cancelado. progress(lidos, total) a cada bloco.
+    """
+    total = os.path.getsize(path)
+    chunks = []
+    done = 0
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            done += len(chunk)
+            if progress is not None:
+                progress(done, max(total, done))
+    return b"".join(chunks)
+
+
+def choose_open_mode(path: str) -> str:
+    """
+    "stream" para arquivos em rede que cabem na memória (uma leitura
+    sequencial em vez de milhares de leituras pequenas e aleatórias do
+    MuPDF); "file" para o resto.
+    """
+    try:
+        if is_network_path(path) and os.path.getsize(path) <= STREAM_MAX_BYTES:
+            return "stream"
+    except OSError:
+        pass
+    return "file"
+
+
+def open_document(path: str, mode: str = "auto", progress=None, cancel_event=None):
+    """
+    Abre um PDF para ser entregue depois a outra thread (PDFManager.adopt_document).
+
+    mode: "file" (o MuPDF lê do arquivo sob demanda), "stream" (o arquivo
+    é lido em blocos sequenciais e aberto da memória) ou "auto".
+    Retorna o fitz.Document, ou None se cancelado. O reparo de arquivos
+    danificados acontece dentro do fitz.open e não pode ser interrompido: o
+    cancelamento vale assim que ele termina.
+    """
+    if mode == "auto":
+        mode = choose_open_mode(path)
+
+    if mode == "stream":
+        st = os.stat(path)
+        data = read_sequential(path, progress=progress, cancel_event=cancel_event)
+        if data is None:
+            return None
+        doc = fitz.open(stream=data, filetype="pdf")
+        # Caches em disco (miniaturas, páginas) usam o hash do arquivo: sai
+        # destes bytes, em vez de ler o arquivo da rede mais uma vez
+        start_content_hash_from_bytes(path, data, st)
+    elif mode == "file":
+        doc = fitz.open(path)
+    else:
+        raise ValueError(f"Modo de abertura inválido: {mode}")
+
+    if cancel_event is not None and cancel_event.is_set():
+        doc.close()
+        return None
+    return doc
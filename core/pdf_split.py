@@ -0,0 +1,222 @@
+# pdf_editor/core/pdf_split.py
+
+import os
+import re
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import fitz  # PyMuPDF
+
+from core.page_ranges import contiguous_runs, parse_page_range, split_into_chunks
+from core.perf import timed
+
+
+# Uma parte da divisão: rótulo (vai para o nome do arquivo) e páginas (base 0, em ordem)
+SplitPart = namedtuple("SplitPart", "label pages")
+
+BATCHES_PER_WORKER = 4  # lotes por processo: equilíbrio entre carga e reaberturas da origem
+MAX_LABEL_CHARS = 60
+_UNSAFE_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]+')
+
+
+# =============================
+# Planejamento das partes
+# =============================
+
+def chunk_parts(page_count: int, chunk_size: int) -> list:
+    """Partes de `chunk_size` páginas (a última pode ser menor)."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size deve ser pelo menos 1.")
+    width = len(str(page_count))
+    parts = []
+    for start in range(0, page_count, chunk_size):
+        end = min(start + chunk_size, page_count) - 1
+        parts.append(SplitPart(f"p{start + 1:0{width}d}-{end + 1:0{width}d}", range(start, end + 1)))
+    return parts
+
+
+def range_parts(specs, page_count: int) -> list:
+    """Uma parte por intervalo digitado (base 1), ex.: ["1-10", "40-60", "70, 75"]."""
+    parts = []
+    for spec in specs:
+        if not spec.strip():
+            continue
+        pages = parse_page_range(spec, page_count)
+        if pages:
+            parts.append(SplitPart(spec.replace(" ", ""), pages))
+    return parts
+
+
+def outline_parts(toc, page_count: int, level: int = 1) -> list:
+    """
+    Divide nos marcadores (sumário) de nível <= `level`: cada parte vai de
+    um marcador até a página antes do próximo. Páginas antes do primeiro
+    marcador viram uma parte "inicio".
+    """
+    starts = {}
+    for entry in toc:
+        lvl, title, page = entry[0], entry[1], entry[2]
+        if lvl <= level and 1 <= page <= page_count:
+            starts.setdefault(page - 1, title)
+    if not starts:
+        raise ValueError("O PDF não tem marcadores (sumário) para dividir.")
+
+    first_pages = sorted(starts)
+    parts = []
+    if first_pages[0] > 0:
+        parts.append(SplitPart("inicio", range(0, first_pages[0])))
+    for i, start in enumerate(first_pages):
+        end = first_pages[i + 1] - 1 if i + 1 < len(first_pages) else page_count - 1
+        parts.append(SplitPart(starts[start], range(start, end + 1)))
+    return parts
+
+
+def _safe_label(label: str) -> str:
+    label = _UNSAFE_CHARS.sub("_", str(label)).strip(" .")
+    return label[:MAX_LABEL_CHARS] or "parte"
+
+
+def output_paths(input_path: str, output_dir: str, parts) -> list:
+    """<nome>_<nº>_<rótulo>.pdf para cada parte (o número garante nomes únicos)."""
+    stem = os.path.splitext(os.path.basename(input_path))[0]
+    width = len(str(len(parts)))
+    return [
+        os.path.join(output_dir, f"{stem}_{i + 1:0{width}d}_{_safe_label(part.label)}.pdf")
+        for i, part in enumerate(parts)
+    ]
+
+
+# =============================
+# Escrita
+# =============================
+
+def _part_toc(toc, page_map) -> list:
+    """Marcadores que caem dentro da parte, com páginas e níveis ajustados."""
+    entries = [
+        [entry[0], entry[1], page_map[entry[2] - 1] + 1]
+        for entry in toc
+        if entry[2] - 1 in page_map
+    ]
+    # set_toc exige começar no nível 1 e nunca pular níveis
+    previous = 0
+    for entry in entries:
+        entry[0] = min(entry[0], previous + 1)
+        previous = entry[0]
+    return entries
+
+
+def write_part(src, pages, output_path: str, toc=None):
+    """
+    Copia as páginas de `src` (fitz.Document aberto) para um novo arquivo.
+    A cópia é por objetos (insert_pdf): nada é re-renderizado nem
+    recomprimido, e recursos usados por várias páginas da parte (fontes,
+    imagens) entram uma vez só.
+    """
+    pages = list(pages)
+    out = fitz.open()
+    try:
+        runs = contiguous_runs(pages)
+        for i, (first, last) in enumerate(runs):
+            # final=False mantém o mapa de objetos já copiados entre as chamadas
+            out.insert_pdf(src, from_page=first, to_page=last, final=(i == len(runs) - 1))
+
+        if toc:
+            page_map = {}
+            for offset, old_index in enumerate(pages):
+                page_map.setdefault(old_index, offset)
+            part_toc = _part_toc(toc, page_map)
+            if part_toc:
+                out.set_toc(part_toc)
+
+        out.save(output_path, deflate=True)
+    finally:
+        out.close()
+    return output_path
+
+
+def _write_batch(src_path: str, batch, keep_outlines: bool) -> list:
+    """Escreve várias partes abrindo a origem uma vez (roda em outro processo)."""
+    with fitz.open(src_path) as src:
+        toc = src.get_toc(simple=True) if keep_outlines else None
+        return [write_part(src, pages, out_path, toc) for out_path, pages in batch]
+
+
+def write_parts_from_doc(src, jobs, keep_outlines: bool = True, progress=None, cancel_event=None) -> list:
+    """Escreve as partes a partir de um documento já aberto (serial, na thread atual)."""
+    toc = src.get_toc(simple=True) if keep_outlines else None
+    written = []
+    for out_path, pages in jobs:
+        if cancel_event is not None and cancel_event.is_set():
+            break
+        written.append(write_part(src, pages, out_path, toc))
+        if progress is not None:
+            progress(len(written), len(jobs))
+    return written
+
+
+@timed("split.pdf")
+def split_pdf(input_path: str, output_dir: str, parts, workers: int = 1, keep_outlines: bool = True,
+              progress=None, cancel_event=None) -> list:
+    """
+    Grava cada parte (SplitPart) como um PDF em output_dir.
+
+    - workers > 1: as partes são divididas em lotes entre processos; cada
+      processo abre a origem uma vez por lote e grava as partes do lote
+    - keep_outlines: os marcadores de cada parte vão junto
+    - progress(done, total) por parte concluída; cancel_event interrompe
+      entre partes (ou lotes)
+
+    Retorna os caminhos gravados, na ordem das partes.
+    """
+    parts = [p for p in parts if len(p.pages)]
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = list(zip(output_paths(input_path, output_dir, parts), [list(p.pages) for p in parts]))
+    if not jobs:
+        return []
+
+    if workers <= 1 or len(jobs) == 1:
+        with fitz.open(input_path) as src:
+            return write_parts_from_doc(src, jobs, keep_outlines, progress, cancel_event)
+
+    order = {out_path: i for i, (out_path, _) in enumerate(jobs)}
+    written = []
+    batches = split_into_chunks(jobs, workers * BATCHES_PER_WORKER)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_write_batch, input_path, batch, keep_outlines) for batch in batches]
+        for future in as_completed(futures):
+            written += future.result()
+            if progress is not None:
+                progress(len(written), len(jobs))
+            if cancel_event is not None and cancel_event.is_set():
+                for f in futures:
+                    f.cancel()
+                break
+    return sorted(written, key=order.get)
+
+
+def page_count_and_toc(input_path: str):
+    with fitz.open(input_path) as doc:
+        return doc.page_count, doc.get_toc(simple=True)
+
+
+def split_by_chunks(input_path: str, output_dir: str, chunk_size: int, **kwargs) -> list:
+    page_count, _ = page_count_and_toc(input_path)
+    return split_pdf(input_path, output_dir, chunk_parts(page_count, chunk_size), **kwargs)
+
+
+def split_by_ranges(input_path: str, output_dir: str, specs, **kwargs) -> list:
+    page_count, _ = page_count_and_toc(input_path)
+    return split_pdf(input_path, output_dir, range_parts(specs, page_count), **kwargs)
+
+
+def split_by_outline(input_path: str, output_dir: str, level: int = 1, **kwargs) -> list:
+    page_count, toc = page_count_and_toc(input_path)
+    return split_pdf(input_path, output_dir, outline_parts(toc, page_count, level), **kwargs)
+
+
+@timed("split.extract")
+def extract_pages(input_path: str, output_path: str, pages, keep_outlines: bool = True) -> str:
+    """Copia as páginas (base 0, na ordem dada) para um único PDF novo."""
+    with fitz.open(input_path) as src:
+        toc = src.get_toc(simple=True) if keep_outlines else None
+        return write_part(src, pages, output_path, toc)
@@ -0,0 +1,182 @@
+# pdf_editor/core/perf.py
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+
+MAX_EVENTS = 20000    # eventos guardados para o trace (os mais antigos saem)
+ROLLING_WINDOW = 200  # durações por operação usadas no p50/p95
+
+# Desligado por padrão: span() devolve um objeto vazio e @timed só chama a função
+_enabled = False
+
+
+def enable(on: bool = True):
+    global _enabled
+    _enabled = bool(on)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def _percentile(sorted_values, fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+class PerfRecorder:
+    """
+    Guarda os spans medidos: uma fila limitada de eventos (para o trace) e,
+    por operação, as últimas durações (para p50/p95) e contadores dos
+    atributos `cache` (hit/miss/disk) e `bytes`.
+    """
+
+    def __init__(self, max_events: int = MAX_EVENTS, window: int = ROLLING_WINDOW):
+        self.window = window
+        self._events = deque(maxlen=max_events)  # (nome, início ns, duração ns, thread, attrs)
+        self._stats = {}                          # nome -> dict
+        self._lock = threading.Lock()
+        self._origin_ns = time.perf_counter_ns()
+
+    def record(self, name: str, start_ns: int, duration_ns: int, attrs: dict):
+        tid = threading.get_ident()
+        with self._lock:
+            self._events.append((name, start_ns, duration_ns, tid, attrs))
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = {
+                    "count": 0, "durations": deque(maxlen=self.window), "bytes": 0, "cache": {},
+                }
+            stats["count"] += 1
+            stats["durations"].append(duration_ns)
+            if attrs:
+                stats["bytes"] += attrs.get("bytes", 0)
+                cache = attrs.get("cache")
+                if cache is not None:
+                    stats["cache"][cache] = stats["cache"].get(cache, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._events.clear()
+            self._stats.clear()
+
+    def summary(self) -> dict:
+        """{nome: {count, p50_ms, p95_ms, max_ms, bytes, cache}} (janela móvel)."""
+        with self._lock:
+            items = [(name, dict(s, durations=sorted(s["durations"]), cache=dict(s["cache"])))
+                     for name, s in self._stats.items()]
+        result = {}
+        for name, s in items:
+            durations = s["durations"]
+            result[name] = {
+                "count": s["count"],
+                "p50_ms": _percentile(durations, 0.50) / 1e6,
+                "p95_ms": _percentile(durations, 0.95) / 1e6,
+                "max_ms": (durations[-1] if durations else 0) / 1e6,
+                "bytes": s["bytes"],
+                "cache": s["cache"],
+            }
+        return result
+
+    def chrome_trace(self) -> dict:
+        """Eventos no formato do chrome://tracing / Perfetto ("X" = evento completo)."""
+        with self._lock:
+            events = list(self._events)
+        pid = os.getpid()
+        trace_events = [
+            {
+                "name": name,
+                "cat": name.split(".", 1)[0],
+                "ph": "X",
+                "ts": (start_ns - self._origin_ns) / 1000,
+                "dur": duration_ns / 1000,
+                "pid": pid,
+                "tid": tid,
+                "args": attrs or {},
+            }
+            for name, start_ns, duration_ns, tid, attrs in events
+        ]
+        return {
+            "traceEvents": trace_events,
+            "displayTimeUnit": "ms",
+            "otherData": {"summary": self.summary()},
+        }
+
+    def export(self, path: str) -> str:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+        return path
+
+
+recorder = PerfRecorder()
+
+
+class _Span:
+    __slots__ = ("name", "attrs", "_start")
+
+    def __init__(self, name: str, attrs: dict):
+        self.name = name
+        self.attrs = attrs
+
+    def set(self, **attrs):
+        """Acrescenta dados ao span (ex.: bytes=..., cache="hit")."""
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        recorder.record(self.name, self._start, end - self._start, self.attrs)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def set(self, **attrs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str, **attrs):
+    """
+    Mede um trecho:  with perf.span("render.page", page=3) as s: ...; s.set(bytes=n)
+    Desligado, devolve sempre o mesmo objeto vazio (nenhuma alocação/relógio).
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, attrs)
+
+
+def timed(name: str):
+    """Decorador: mede cada chamada da função como um span `name`."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Span(name, {}):
+                return fn(*args, **kwargs)
+        # Quem roda a função em outro processo (core.jobs) mede do lado de cá com este nome
+        wrapper.perf_name = name
+        return wrapper
+    return decorator
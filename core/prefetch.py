@@ -0,0 +1,157 @@
+# pdf_editor/core/prefetch.py
+
+import queue
+import sys
+import threading
+
+from core.perf import span
+
+
+DEFAULT_PREFETCH_DEPTH = 2
+MAX_REPEATED_FAILURES = 3  # mesmo erro seguido: o prefetch para neste documento
+
+
+def neighbour_order(center: int, page_count: int, depth: int):
+    """Páginas vizinhas em ordem de prioridade: N+1, N-1, N+2, N-2, ..."""
+    pages = []
+    for offset in range(1, depth + 1):
+        for idx in (center + offset, center - offset):
+            if 0 <= idx < page_count:
+                pages.append(idx)
+    return pages
+
+
+class PagePrefetcher:
+    """
+    Renderiza páginas vizinhas em uma thread de fundo.
+
+    A thread abre o seu próprio fitz.Document (documentos do PyMuPDF não
+    devem ser compartilhados entre threads). Os resultados vão para uma
+    fila thread-safe que a UI consome com poll(), a partir do after() do Tk.
+
+    Falhas não interrompem a navegação (a página é renderizada sob demanda),
+    mas não são escondidas: vão para o stderr e para `last_error`, e o mesmo
+    erro repetido MAX_REPEATED_FAILURES vezes desliga o prefetch daquele
+    documento, em vez de falhar de novo a cada página.
+    """
+
+    def __init__(self, depth: int = DEFAULT_PREFETCH_DEPTH):
+        self.depth = depth
+        self._requests = queue.Queue()
+        self._results = queue.Queue()
+        # Cada request() incrementa a geração; pedidos antigos são descartados
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stopped = False
+        self.last_error = None
+        self._disabled_doc = None  # (path, doc_id) onde o prefetch desistiu
+
+    def request(self, path: str, doc_id, center: int, page_count: int,
+                zoom: float = 1.8, colorspace: str = "RGB", skip=None):
+        """
+        Agenda as páginas ao redor de `center`.
+        `skip(page_index)` pode indicar páginas que já estão prontas.
+        """
+        if self._stopped or not path or self.depth <= 0:
+            return
+        if self._disabled_doc == (path, doc_id):
+            return
+
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+
+        for page_index in neighbour_order(center, page_count, self.depth):
+            if skip is not None and skip(page_index):
+                continue
+            self._requests.put((generation, path, doc_id, page_index, zoom, colorspace))
+
+        self._ensure_thread()
+
+    def cancel(self):
+        """Descarta todos os pedidos pendentes."""
+        with self._lock:
+            self._generation += 1
+
+    def poll(self):
+        """Retorna (sem bloquear) os resultados prontos: [(doc_id, page_index, zoom, colorspace, img)]."""
+        results = []
+        while True:
+            try:
+                results.append(self._results.get_nowait())
+            except queue.Empty:
+                return results
+
+    def shutdown(self):
+        self._stopped = True
+        self.cancel()
+        self._requests.put(None)
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="page-prefetch", daemon=True)
+        self._thread.start()
+
+    def _report_failure(self, doc_key, page_index: int, error: Exception, repeated: int):
+        self.last_error = error
+        if repeated == 1 and sys.stderr is not None:
+            print(f"Prefetch: falha ao renderizar a página {page_index + 1}: {error!r}", file=sys.stderr)
+        if repeated >= MAX_REPEATED_FAILURES:
+            self._disabled_doc = doc_key
+            self.cancel()
+            if sys.stderr is not None:
+                print(f"Prefetch desligado para este documento após {repeated} falhas iguais.", file=sys.stderr)
+
+    def _run(self):
+        # A thread só nasce no primeiro pedido, com um documento aberto
+        import fitz  # PyMuPDF
+
+        from core.imaging import render_page_to_image
+
+        doc = None
+        doc_key = None
+        failure = None  # (documento, tipo, mensagem) da última falha
+        repeated = 0
+        try:
+            while True:
+                job = self._requests.get()
+                if job is None:
+                    return
+
+                generation, path, doc_id, page_index, zoom, colorspace = job
+                if generation != self._generation:
+                    continue
+
+                if self._disabled_doc == (path, doc_id):
+                    continue
+
+                try:
+                    # doc_id muda quando o arquivo é reaberto (ex.: salvo por cima)
+                    if doc_key != (path, doc_id):
+                        if doc is not None:
+                            doc.close()
+                            doc = None
+                        doc = fitz.open(path)
+                        doc_key = (path, doc_id)
+
+                    with span("prefetch.render", page=page_index, zoom=zoom):
+                        page = doc.load_page(page_index)
+                        img = render_page_to_image(page, zoom=zoom, colorspace=colorspace)
+                except Exception as e:
+                    # Prefetch é só otimização: a página será renderizada sob demanda
+                    signature = ((path, doc_id), type(e), str(e))
+                    repeated = repeated + 1 if signature == failure else 1
+                    failure = signature
+                    self._report_failure((path, doc_id), page_index, e, repeated)
+                    continue
+
+                failure = None
+                repeated = 0
+
+                if generation == self._generation:
+                    self._results.put((doc_id, page_index, zoom, colorspace, img))
+        finally:
+            if doc is not None:
+                doc.close()
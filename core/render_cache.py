@@ -0,0 +1,114 @@
+# pdf_editor/core/render_cache.py
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MB
+
+
+def image_nbytes(img: "Image.Image") -> int:
+    """Estimativa do tamanho em memória de uma PIL.Image."""
+    return img.width * img.height * len(img.getbands())
+
+
+class RenderCache:
+    """
+    Cache LRU de páginas renderizadas, limitado por um orçamento em bytes.
+
+    A chave é (doc_id, page_index, zoom, colorspace). As imagens guardadas
+    são compartilhadas: quem for desenhar sobre elas deve fazer uma cópia.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (img, nbytes)
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Retorna a imagem em cache (ou None) e marca como usada recentemente."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def put(self, key, img: "Image.Image"):
+        """Guarda a imagem e descarta as menos usadas até caber no orçamento."""
+        nbytes = image_nbytes(img)
+        if nbytes > self.max_bytes:
+            # Maior que o cache inteiro: não vale a pena guardar
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._current_bytes -= old[1]
+
+            self._entries[key] = (img, nbytes)
+            self._current_bytes += nbytes
+
+            self._evict_to_budget()
+
+    def invalidate(self, doc_id, page_index=None):
+        """Remove as entradas de um documento (ou só de uma página dele)."""
+        with self._lock:
+            for key in list(self._entries):
+                if key[0] != doc_id:
+                    continue
+                if page_index is not None and key[1] != page_index:
+                    continue
+                _, nbytes = self._entries.pop(key)
+                self._current_bytes -= nbytes
+
+    def rekey(self, old_doc_id, new_doc_id):
+        """Passa as entradas de old_doc_id para new_doc_id (sem renderizar de novo)."""
+        with self._lock:
+            for key in list(self._entries):
+                if key[0] == old_doc_id:
+                    self._entries[(new_doc_id,) + key[1:]] = self._entries.pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def set_max_bytes(self, max_bytes: int):
+        """Altera o orçamento e descarta o excedente imediatamente."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict_to_budget()
+
+    def _evict_to_budget(self):
+        # Chamado com o lock já adquirido
+        while self._current_bytes > self.max_bytes and self._entries:
+            _, (_, evicted_bytes) = self._entries.popitem(last=False)
+            self._current_bytes -= evicted_bytes
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._current_bytes,
+                "max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,185 @@
+# pdf_editor/core/search_index.py
+
+import bisect
+import os
+import pickle
+import unicodedata
+from array import array
+
+import fitz  # PyMuPDF
+
+from core.cache_dir import app_cache_dir, atomic_write_bytes, file_content_hash
+
+
+INDEX_VERSION = 1
+POS_BITS = 20  # posição da palavra na página (até ~1 milhão de palavras por página)
+POS_MASK = (1 << POS_BITS) - 1
+STRIP_CHARS = "\"'()[]{}<>.,;:!?«»“”‘’–—…*/\\|"
+
+
+def normalize_token(word: str) -> str:
+    """Minúsculas, sem acentos e sem pontuação nas pontas ("Ação," -> "acao")."""
+    word = unicodedata.normalize("NFKD", word.casefold())
+    word = "".join(c for c in word if not unicodedata.combining(c))
+    return word.strip(STRIP_CHARS)
+
+
+class SearchIndex:
+    """
+    Índice invertido palavra -> [(página, posição)] com as caixas das palavras.
+
+    Construído uma vez a partir de page.get_text("words") e salvo em disco
+    pelo hash do conteúdo do arquivo. Frases são resolvidas por posições
+    consecutivas na mesma página; a última palavra da busca casa por prefixo.
+    """
+
+    def __init__(self, page_count: int = 0):
+        self.page_count = page_count
+        # token -> array('Q') de (página << POS_BITS) | posição
+        self.postings = {}
+        # página -> array('f') com x0, y0, x1, y1 de cada palavra
+        self.page_rects = [array("f") for _ in range(page_count)]
+        self._sorted_tokens = None
+
+    # =============================
+    # Construção
+    # =============================
+
+    @classmethod
+    def build(cls, doc, progress=None, cancel_event=None):
+        """Extrai as palavras de todas as páginas. progress(done, total) por página."""
+        index = cls(doc.page_count)
+        for page_index in range(doc.page_count):
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            words = doc.load_page(page_index).get_text("words")
+            index.add_page(page_index, words)
+            if progress is not None:
+                progress(page_index + 1, doc.page_count)
+        return index
+
+    def add_page(self, page_index: int, words):
+        rects = self.page_rects[page_index]
+        for pos, w in enumerate(words):
+            rects.extend((w[0], w[1], w[2], w[3]))
+            token = normalize_token(w[4])
+            if not token:
+                continue
+            postings = self.postings.get(token)
+            if postings is None:
+                postings = self.postings[token] = array("Q")
+            postings.append((page_index << POS_BITS) | pos)
+        self._sorted_tokens = None
+
+    # =============================
+    # Busca
+    # =============================
+
+    def _tokens_with_prefix(self, prefix: str):
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self.postings)
+        start = bisect.bisect_left(self._sorted_tokens, prefix)
+        for token in self._sorted_tokens[start:]:
+            if not token.startswith(prefix):
+                break
+            yield token
+
+    def _word_rect(self, page_index: int, pos: int):
+        rects = self.page_rects[page_index]
+        i = pos * 4
+        return rects[i], rects[i + 1], rects[i + 2], rects[i + 3]
+
+    def search(self, query: str) -> list:
+        """
+        Retorna [(page_index, [rects])] em ordem de página/posição.
+        Cada resultado traz as caixas (x0, y0, x1, y1) de todas as palavras da frase.
+        """
+        terms = [t for t in (normalize_token(w) for w in query.split()) if t]
+        if not terms:
+            return []
+
+        # Todas as palavras exatas, menos a última, que casa por prefixo (busca "enquanto digita")
+        last_matches = set()
+        for token in self._tokens_with_prefix(terms[-1]):
+            last_matches.update(self.postings[token])
+
+        if len(terms) == 1:
+            starts = sorted(last_matches)
+        else:
+            first = self.postings.get(terms[0])
+            if first is None:
+                return []
+            exact_sets = [set(self.postings.get(t, ())) for t in terms[1:-1]]
+            starts = []
+            for code in first:
+                ok = all((code + k + 1) in exact_sets[k] for k in range(len(exact_sets)))
+                if ok and (code + len(terms) - 1) in last_matches:
+                    starts.append(code)
+
+        hits = []
+        for code in starts:
+            page_index, pos = code >> POS_BITS, code & POS_MASK
+            rects = [self._word_rect(page_index, pos + k) for k in range(len(terms))]
+            hits.append((page_index, rects))
+        return hits
+
+    # =============================
+    # Persistência
+    # =============================
+
+    def to_bytes(self) -> bytes:
+        data = {
+            "version": INDEX_VERSION,
+            "page_count": self.page_count,
+            "postings": self.postings,
+            "page_rects": self.page_rects,
+        }
+        return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_bytes(cls, raw: bytes):
+        data = pickle.loads(raw)
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError("Versão de índice incompatível.")
+        index = cls()
+        index.page_count = data["page_count"]
+        index.postings = data["postings"]
+        index.page_rects = data["page_rects"]
+        return index
+
+
+def index_cache_path(pdf_path: str) -> str:
+    return os.path.join(app_cache_dir("search"), file_content_hash(pdf_path) + ".idx")
+
+
+def load_cached_index(pdf_path: str):
+    """Índice salvo para este conteúdo de arquivo, ou None."""
+    path = index_cache_path(pdf_path)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            return SearchIndex.from_bytes(f.read())
+    except Exception:
+        # Cache corrompido/antigo: será reconstruído
+        return None
+
+
+def load_or_build_index(pdf_path: str, doc=None, progress=None, cancel_event=None):
+    """
+    Carrega o índice do cache em disco ou constrói (e salva) um novo.
+    Sem `doc`, abre o arquivo por conta própria (útil em threads de fundo).
+    """
+    index = load_cached_index(pdf_path)
+    if index is not None:
+        return index
+
+    if doc is None:
+        with fitz.open(pdf_path) as own_doc:
+            index = SearchIndex.build(own_doc, progress=progress, cancel_event=cancel_event)
+    else:
+        index = SearchIndex.build(doc, progress=progress, cancel_event=cancel_event)
+
+    if index is not None:
+        atomic_write_bytes(index_cache_path(pdf_path), index.to_bytes())
+    return index
@@ -0,0 +1,89 @@
+# pdf_editor/core/startup_profile.py
+
+import builtins
+import os
+import sys
+import time
+
+from core.cache_dir import app_cache_dir
+
+
+# Módulos pesados que não deveriam ser carregados antes da primeira pintura
+WATCHED_MODULES = (
+    "fitz", "PIL", "PIL.ImageTk", "customtkinter", "pypdf",
+    "pdf2docx", "docx2pdf", "cv2", "numpy", "lxml",
+)
+TOP_IMPORTS = 15
+
+
+class StartupProfiler:
+    """
+    Mede a abertura do aplicativo: marcos (importações, janela criada,
+    primeira pintura) e o tempo de cada importação feita pela primeira vez.
+
+    Os tempos de importação são inclusivos (contam os submódulos que o
+    módulo importa), como no `python -X importtime`.
+    """
+
+    def __init__(self, start: float = None):
+        self.start = time.perf_counter() if start is None else start
+        self.marks = []    # [(nome, segundos desde o início)]
+        self.imports = []  # [(módulo, segundos, profundidade)]
+        self._depth = 0
+        self._original_import = None
+
+    def mark(self, name: str):
+        self.marks.append((name, time.perf_counter() - self.start))
+
+    def install_import_timer(self):
+        if self._original_import is not None:
+            return
+        original = self._original_import = builtins.__import__
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if level or name in sys.modules:
+                return original(name, globals, locals, fromlist, level)
+            self._depth += 1
+            t0 = time.perf_counter()
+            try:
+                return original(name, globals, locals, fromlist, level)
+            finally:
+                self._depth -= 1
+                self.imports.append((name, time.perf_counter() - t0, self._depth))
+
+        builtins.__import__ = timed_import
+
+    def uninstall_import_timer(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def report(self) -> str:
+        lines = ["== Perfil de inicialização =="]
+        for name, t in self.marks:
+            lines.append(f"{t * 1000:9.1f} ms  {name}")
+
+        if self.imports:
+            lines.append("")
+            lines.append(f"Importações mais lentas (inclusivo, top {TOP_IMPORTS}):")
+            for name, t, depth in sorted(self.imports, key=lambda i: i[1], reverse=True)[:TOP_IMPORTS]:
+                lines.append(f"{t * 1000:9.1f} ms  {'  ' * min(depth, 4)}{name}")
+
+        loaded = [m for m in WATCHED_MODULES if m in sys.modules]
+        lines.append("")
+        lines.append("Módulos pesados já carregados: " + (", ".join(loaded) if loaded else "nenhum"))
+        return "\n".join(lines)
+
+    def emit(self) -> str:
+        """
+        Mostra o relatório no stderr; no executável sem console (stderr None)
+        grava em startup_profile.txt no cache do aplicativo. Retorna o texto.
+        """
+        text = self.report()
+        if sys.stderr is not None:
+            print(text, file=sys.stderr)
+        else:
+            path = os.path.join(app_cache_dir(), "startup_profile.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+        return text
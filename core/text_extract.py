@@ -0,0 +1,112 @@
+# pdf_editor/core/text_extract.py
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import fitz  # PyMuPDF
+
+
+PAGES_PER_CHUNK = 16  # páginas por tarefa no modo multiprocesso
+PAGE_SEPARATOR = "\n"
+
+
+def iter_page_texts(doc, pages=None):
+    """
+    Gera (page_index, texto) página a página, sem montar o texto inteiro.
+    `doc` é um fitz.Document já aberto; `pages` são índices base 0 (None = todas).
+    """
+    if pages is None:
+        pages = range(doc.page_count)
+    for page_index in pages:
+        yield page_index, doc.load_page(page_index).get_text()
+
+
+def _extract_chunk(pdf_path, pages):
+    """Roda no processo filho: abre o PDF por conta própria."""
+    doc = fitz.open(pdf_path)
+    try:
+        return list(iter_page_texts(doc, pages))
+    finally:
+        doc.close()
+
+
+def iter_page_texts_parallel(pdf_path: str, pages=None, workers: int = None):
+    """
+    Como iter_page_texts, mas distribui pedaços de páginas entre processos.
+    Os resultados saem sempre na ordem das páginas pedidas, e só há alguns
+    pedaços em andamento por vez (memória limitada).
+    """
+    if pages is None:
+        with fitz.open(pdf_path) as doc:
+            pages = range(doc.page_count)
+    pages = list(pages)
+    workers = workers or os.cpu_count() or 1
+
+    chunks = [pages[i:i + PAGES_PER_CHUNK] for i in range(0, len(pages), PAGES_PER_CHUNK)]
+    if workers <= 1 or len(chunks) <= 1:
+        with fitz.open(pdf_path) as doc:
+            yield from iter_page_texts(doc, pages)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        chunk_iter = iter(chunks)
+        try:
+            for chunk in chunk_iter:
+                in_flight.append(pool.submit(_extract_chunk, pdf_path, chunk))
+                if len(in_flight) >= workers * 2:
+                    yield from in_flight.popleft().result()
+            while in_flight:
+                yield from in_flight.popleft().result()
+        finally:
+            # Consumidor parou antes do fim (ou erro): descarta o que falta
+            for future in in_flight:
+                future.cancel()
+
+
+def write_page_texts(page_texts, out_path: str, progress=None, total: int = None,
+                     cancel_event=None) -> int:
+    """
+    Grava (page_index, texto) em um arquivo .txt conforme chegam.
+    Retorna quantas páginas foram gravadas.
+    """
+    count = 0
+    with open(out_path, "w", encoding="utf-8") as f:
+        for _, text in page_texts:
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            if count:
+                f.write(PAGE_SEPARATOR)
+            f.write(text)
+            count += 1
+            if progress is not None:
+                progress(count, total)
+    return count
+
+
+def extract_text_to_file(source, out_path: str, pages=None, workers: int = 1,
+                         progress=None, cancel_event=None) -> int:
+    """
+    Grava o texto de `source` em um arquivo .txt, abrindo o próprio
+    documento (pode rodar em qualquer thread).
+
+    source: caminho do PDF (com workers > 1, as páginas são divididas entre
+    processos) ou os bytes de um documento em memória (PDFManager.snapshot_source).
+    """
+    if isinstance(source, (bytes, bytearray)):
+        with fitz.open(stream=source, filetype="pdf") as doc:
+            pages = list(range(doc.page_count) if pages is None else pages)
+            return write_page_texts(
+                iter_page_texts(doc, pages), out_path, progress=progress, total=len(pages),
+                cancel_event=cancel_event,
+            )
+
+    if pages is None:
+        with fitz.open(source) as doc:
+            pages = range(doc.page_count)
+    pages = list(pages)
+    return write_page_texts(
+        iter_page_texts_parallel(source, pages, workers=workers), out_path, progress=progress,
+        total=len(pages), cancel_event=cancel_event,
+    )
@@ -0,0 +1,201 @@
+# pdf_editor/core/thumbnails.py
+
+import io
+import os
+import queue
+import threading
+
+from core.cache_dir import app_cache_dir, atomic_write_bytes, file_content_hash, peek_content_hash
+
+
+THUMB_WIDTH = 110   # caixa onde a miniatura cabe (pixels)
+THUMB_HEIGHT = 150
+THUMB_JPEG_QUALITY = 75
+THUMB_VERSION = 1   # muda o nome da pasta se o formato mudar
+
+
+def thumbnail_zoom(page_rect, width: int = THUMB_WIDTH, height: int = THUMB_HEIGHT) -> float:
+    """Zoom que faz a página caber na caixa width x height."""
+    return min(width / max(page_rect.width, 1), height / max(page_rect.height, 1))
+
+
+def render_thumbnail_bytes(page, width: int = THUMB_WIDTH, height: int = THUMB_HEIGHT) -> bytes:
+    """Miniatura da página já em JPEG, codificada pelo MuPDF (sem passar pela PIL)."""
+    import fitz  # PyMuPDF (a faixa de miniaturas é criada com a janela, antes de haver documento)
+
+    zoom = thumbnail_zoom(page.rect, width, height)
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+    return pix.tobytes(output="jpg", jpg_quality=THUMB_JPEG_QUALITY)
+
+
+def thumbnail_cache_dir(pdf_path: str, width: int = THUMB_WIDTH, height: int = THUMB_HEIGHT,
+                        wait: bool = True):
+    """
+    Pasta das miniaturas deste conteúdo de arquivo (uma imagem por página).
+    Com wait=False, retorna None se o hash do arquivo ainda não foi calculado.
+    """
+    digest = file_content_hash(pdf_path) if wait else peek_content_hash(pdf_path)
+    if digest is None:
+        return None
+    return app_cache_dir("thumbs", f"{digest}-{width}x{height}-v{THUMB_VERSION}")
+
+
+def _thumb_file(cache_dir: str, page_index: int) -> str:
+    return os.path.join(cache_dir, f"{page_index}.jpg")
+
+
+def load_thumbnail(cache_dir: str, page_index: int):
+    """Miniatura salva (PIL.Image carregada) ou None."""
+    from PIL import Image
+
+    try:
+        with open(_thumb_file(cache_dir, page_index), "rb") as f:
+            img = Image.open(io.BytesIO(f.read()))
+            img.load()
+        return img
+    except Exception:
+        # Ausente ou corrompida: será gerada de novo
+        return None
+
+
+class ThumbnailWorker:
+    """
+    Gera miniaturas em uma thread de fundo e as guarda em disco, pelo hash
+    do conteúdo do arquivo (reabrir o mesmo PDF não renderiza nada de novo).
+
+    Ordem de trabalho: primeiro as páginas pedidas pela UI (as visíveis na
+    faixa lateral), depois o resto do documento, em ordem, só para o disco.
+    Como no PagePrefetcher, a thread abre o seu próprio fitz.Document e os
+    resultados vão para uma fila que a UI consome com poll().
+    """
+
+    def __init__(self, width: int = THUMB_WIDTH, height: int = THUMB_HEIGHT):
+        self.width = width
+        self.height = height
+        self._results = queue.Queue()
+        self._cond = threading.Condition()
+        # Estado protegido por _cond
+        self._generation = 0
+        self._document = None   # (path, doc_id, page_count)
+        self._wanted = []       # páginas pedidas pela UI, em ordem de prioridade
+        self._fill_next = 0     # próxima página do preenchimento em segundo plano
+        self._stopped = False
+        self._thread = None
+
+    def open(self, path: str, doc_id, page_count: int):
+        """Passa a trabalhar neste documento (o anterior é abandonado)."""
+        with self._cond:
+            self._generation += 1
+            self._document = (path, doc_id, page_count) if path else None
+            self._wanted = []
+            self._fill_next = 0
+            self._cond.notify()
+        self._ensure_thread()
+
+    def close(self):
+        self.open(None, None, 0)
+
+    def request(self, pages):
+        """Páginas que a UI precisa agora (substitui o pedido anterior)."""
+        with self._cond:
+            self._wanted = list(pages)
+            self._cond.notify()
+
+    def poll(self):
+        """Retorna (sem bloquear) as miniaturas prontas: [(doc_id, page_index, img)]."""
+        results = []
+        while True:
+            try:
+                results.append(self._results.get_nowait())
+            except queue.Empty:
+                return results
+
+    def shutdown(self):
+        with self._cond:
+            self._stopped = True
+            self._generation += 1
+            self._cond.notify()
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="thumbnails", daemon=True)
+        self._thread.start()
+
+    def _next_task(self):
+        """(geração, documento, página, entregar à UI?) ou None. Chamado com _cond."""
+        if self._document is None:
+            return None
+        page_count = self._document[2]
+        while self._wanted:
+            page_index = self._wanted.pop(0)
+            if 0 <= page_index < page_count:
+                return self._generation, self._document, page_index, True
+        if self._fill_next < page_count:
+            page_index = self._fill_next
+            self._fill_next += 1
+            return self._generation, self._document, page_index, False
+        return None
+
+    def _run(self):
+        # A thread só nasce com um documento aberto
+        import fitz  # PyMuPDF
+        from PIL import Image
+
+        doc = None
+        doc_key = None
+        cache_dir = None
+        try:
+            while True:
+                with self._cond:
+                    task = None
+                    while not self._stopped:
+                        task = self._next_task()
+                        if task is not None:
+                            break
+                        if doc is not None:
+                            # Ocioso: não segura o arquivo aberto (pode ser salvo por cima)
+                            doc.close()
+                            doc = None
+                        self._cond.wait()
+                    if self._stopped:
+                        return
+
+                generation, (path, doc_id, _), page_index, deliver = task
+                try:
+                    if doc_key != (path, doc_id):
+                        if doc is not None:
+                            doc.close()
+                            doc = None
+                        cache_dir = None
+                        doc_key = (path, doc_id)
+                    if cache_dir is None:
+                        # As visíveis não esperam o hash do arquivo: até ele ficar
+                        # pronto saem direto do PDF, sem passar pelo disco
+                        cache_dir = thumbnail_cache_dir(path, self.width, self.height, wait=not deliver)
+
+                    if deliver:
+                        img = load_thumbnail(cache_dir, page_index) if cache_dir else None
+                    elif os.path.exists(_thumb_file(cache_dir, page_index)):
+                        continue
+                    else:
+                        img = None
+
+                    if img is None:
+                        if doc is None:
+                            doc = fitz.open(path)
+                        data = render_thumbnail_bytes(doc.load_page(page_index), self.width, self.height)
+                        if cache_dir is not None:
+                            atomic_write_bytes(_thumb_file(cache_dir, page_index), data)
+                        if deliver:
+                            img = Image.open(io.BytesIO(data))
+                            img.load()
+                except Exception:
+                    # Miniatura é só conveniência: a página continua navegável
+                    continue
+
+                if deliver and generation == self._generation:
+                    self._results.put((doc_id, page_index, img))
+        finally:
+            if doc is not None:
+                doc.close()
@@ -0,0 +1,68 @@
+# pdf_editor/core/tiles.py
+
+import math
+
+import fitz  # PyMuPDF
+
+from core.imaging import render_displaylist_pixmap, pixmap_to_image
+
+
+TILE_SIZE = 256  # lado do ladrilho, em pixels
+# Níveis de zoom do visualizador ampliado (1.0 = 72 dpi = 100%)
+ZOOM_LEVELS = (1.0, 1.5, 2.0, 3.0, 4.0, 6.0, 8.0)
+TILE_MARGIN = 1  # anel de ladrilhos renderizados além dos visíveis
+
+
+def tile_grid(page_rect, zoom: float, tile_size: int = TILE_SIZE):
+    """(colunas, linhas) de ladrilhos que cobrem a página no zoom dado."""
+    width = max(1, math.ceil(page_rect.width * zoom))
+    height = max(1, math.ceil(page_rect.height * zoom))
+    return math.ceil(width / tile_size), math.ceil(height / tile_size)
+
+
+def tile_clip(page_rect, zoom: float, tx: int, ty: int, tile_size: int = TILE_SIZE) -> fitz.Rect:
+    """Retângulo (em pontos da página) coberto pelo ladrilho (tx, ty)."""
+    step = tile_size / zoom
+    x0 = page_rect.x0 + tx * step
+    y0 = page_rect.y0 + ty * step
+    return fitz.Rect(x0, y0, x0 + step, y0 + step) & page_rect
+
+
+def visible_tiles(view, zoom: float, page_rect, tile_size: int = TILE_SIZE,
+                  margin: int = TILE_MARGIN) -> list:
+    """
+    Ladrilhos (tx, ty) que cruzam a área visível `view` = (x0, y0, x1, y1),
+    em pixels da página no zoom dado, mais `margin` ladrilhos em volta.
+    Ordenados do centro da vista para fora (os do meio são renderizados antes).
+    """
+    cols, rows = tile_grid(page_rect, zoom, tile_size)
+    x0, y0, x1, y1 = view
+    c0 = max(0, int(x0 // tile_size) - margin)
+    r0 = max(0, int(y0 // tile_size) - margin)
+    c1 = min(cols - 1, int(max(x1 - 1, x0) // tile_size) + margin)
+    r1 = min(rows - 1, int(max(y1 - 1, y0) // tile_size) + margin)
+
+    cx = (x0 + x1) / 2 / tile_size - 0.5
+    cy = (y0 + y1) / 2 / tile_size - 0.5
+    tiles = [(tx, ty) for ty in range(r0, r1 + 1) for tx in range(c0, c1 + 1)]
+    tiles.sort(key=lambda t: (t[0] - cx) ** 2 + (t[1] - cy) ** 2)
+    return tiles
+
+
+def tile_budget_bytes(view_width: int, view_height: int, tile_size: int = TILE_SIZE,
+                      margin: int = TILE_MARGIN, levels: int = 2) -> int:
+    """
+    Orçamento do cache de ladrilhos para uma vista desse tamanho: os
+    ladrilhos visíveis + margem, em `levels` níveis de zoom (o atual e o
+    anterior, para voltar sem re-renderizar). Depende da janela, não do zoom.
+    """
+    cols = math.ceil(view_width / tile_size) + 1 + 2 * margin
+    rows = math.ceil(view_height / tile_size) + 1 + 2 * margin
+    return cols * rows * tile_size * tile_size * 4 * levels
+
+
+def render_tile_image(dlist, zoom: float, tx: int, ty: int, tile_size: int = TILE_SIZE,
+                      colorspace: str = "RGB"):
+    """Rasteriza um ladrilho a partir do DisplayList da página (PIL.Image, sem cópia)."""
+    clip = tile_clip(dlist.rect, zoom, tx, ty, tile_size)
+    return pixmap_to_image(render_displaylist_pixmap(dlist, zoom, colorspace, clip=clip))
@@ -0,0 +1,131 @@
+# pdf_editor/core/word_index.py
+
+import math
+
+
+WORDS_PER_CELL = 4  # ocupação média alvo de cada célula da grade
+
+
+class WordIndex:
+    """
+    Índice espacial das palavras de uma página (grade uniforme).
+
+    Recebe a saída de page.get_text("words"):
+        (x0, y0, x1, y1, texto, block_no, line_no, word_no)
+    e responde "palavra no ponto", "palavra mais próxima" e "linha inteira"
+    sem percorrer todas as palavras.
+    """
+
+    def __init__(self, words, page_rect):
+        self.words = list(words)
+        self.x0 = page_rect.x0
+        self.y0 = page_rect.y0
+
+        n_cells = max(1, len(self.words) // WORDS_PER_CELL)
+        width = max(page_rect.width, 1.0)
+        height = max(page_rect.height, 1.0)
+        self.cols = max(1, int(round(math.sqrt(n_cells * width / height))))
+        self.rows = max(1, int(math.ceil(n_cells / self.cols)))
+        self.cell_w = width / self.cols
+        self.cell_h = height / self.rows
+
+        # Células por caixa (para "palavra no ponto") e por centro (para "mais próxima")
+        self._box_cells = {}
+        self._center_cells = {}
+        # (block_no, line_no) -> [índices de palavras, ordenados por word_no]
+        self._lines = {}
+
+        for i, w in enumerate(self.words):
+            x0, y0, x1, y1 = w[0], w[1], w[2], w[3]
+            c0, r0 = self._cell(x0, y0)
+            c1, r1 = self._cell(x1, y1)
+            for r in range(r0, r1 + 1):
+                for c in range(c0, c1 + 1):
+                    self._box_cells.setdefault((c, r), []).append(i)
+
+            self._center_cells.setdefault(
+                self._cell((x0 + x1) / 2, (y0 + y1) / 2), []
+            ).append(i)
+            self._lines.setdefault((w[5], w[6]), []).append(i)
+
+        for indices in self._lines.values():
+            indices.sort(key=lambda i: self.words[i][7])
+
+    def __len__(self):
+        return len(self.words)
+
+    def _cell(self, x, y):
+        c = int((x - self.x0) / self.cell_w)
+        r = int((y - self.y0) / self.cell_h)
+        return min(max(c, 0), self.cols - 1), min(max(r, 0), self.rows - 1)
+
+    def word_at(self, x, y):
+        """Palavra cuja caixa contém o ponto (a primeira na ordem de leitura) ou None."""
+        chosen = None
+        for i in self._box_cells.get(self._cell(x, y), ()):
+            w = self.words[i]
+            if w[0] <= x <= w[2] and w[1] <= y <= w[3]:
+                if chosen is None or i < chosen:
+                    chosen = i
+        return None if chosen is None else self.words[chosen]
+
+    def nearest_word(self, x, y):
+        """Palavra com o centro mais próximo do ponto (busca em anéis de células)."""
+        if not self.words:
+            return None
+
+        cx, cy = self._cell(x, y)
+        min_cell = min(self.cell_w, self.cell_h)
+        max_ring = max(self.cols, self.rows)
+
+        best = None
+        best_dist = float("inf")
+        for ring in range(max_ring + 1):
+            for c, r in self._ring_cells(cx, cy, ring):
+                for i in self._center_cells.get((c, r), ()):
+                    w = self.words[i]
+                    d = ((w[0] + w[2]) / 2 - x) ** 2 + ((w[1] + w[3]) / 2 - y) ** 2
+                    if d < best_dist or (d == best_dist and i < best):
+                        best_dist = d
+                        best = i
+            # Células ainda não visitadas estão a pelo menos ring * min_cell
+            if best is not None and best_dist <= (ring * min_cell) ** 2:
+                break
+
+        return self.words[best]
+
+    def _ring_cells(self, cx, cy, ring):
+        if ring == 0:
+            yield cx, cy
+            return
+        for c in range(cx - ring, cx + ring + 1):
+            for r in (cy - ring, cy + ring):
+                if 0 <= c < self.cols and 0 <= r < self.rows:
+                    yield c, r
+        for r in range(cy - ring + 1, cy + ring):
+            for c in (cx - ring, cx + ring):
+                if 0 <= c < self.cols and 0 <= r < self.rows:
+                    yield c, r
+
+    def line_words(self, block_no, line_no):
+        """Palavras de uma linha, na ordem de leitura."""
+        return [self.words[i] for i in self._lines.get((block_no, line_no), ())]
+
+    def line_at(self, x, y):
+        """
+        Linha que contém (ou está mais perto de) o ponto.
+        Retorna (texto, (x0, y0, x1, y1)) ou None se a página não tem texto.
+        """
+        chosen = self.word_at(x, y) or self.nearest_word(x, y)
+        if chosen is None:
+            return None
+
+        line = self.line_words(chosen[5], chosen[6])
+        text = " ".join(w[4] for w in line)
+        rect = (
+            min(w[0] for w in line),
+            min(w[1] for w in line),
+            max(w[2] for w in line),
+            max(w[3] for w in line),
+        )
+        return text, rect
@@ -1,12 +1,73 @@
 # pdf_editor/main.py
+#
+# Perfil de inicialização (tempos de importação e da primeira pintura):
+#     python main.py --profile-startup          (mostra e continua aberto)
+#     python main.py --profile-startup=exit     (mostra e fecha; útil para comparar versões)
+# ou com a variável de ambiente COTIDIANO_PROFILE_STARTUP=1.
+#
+# COTIDIANO_PERF=1 liga a medição de desempenho (core.perf) desde a abertura;
+# ela também pode ser ligada no painel "Desempenho".
 
-from ui.main_window import PDFEditorApp
+import time
 
+_START = time.perf_counter()
+
+import multiprocessing
+import os
+import sys
+
+
+def _profile_mode(argv):
+    for arg in argv:
+        if arg == "--profile-startup":
+            return "keep"
+        if arg == "--profile-startup=exit":
+            return "exit"
+    if os.environ.get("COTIDIANO_PROFILE_STARTUP"):
+        return "keep"
+    return None
+
+
+def main(argv=None):
+    mode = _profile_mode(sys.argv[1:] if argv is None else argv)
+
+    profiler = None
+    if mode is not None:
+        from core.startup_profile import StartupProfiler
+
+        profiler = StartupProfiler(start=_START)
+        profiler.install_import_timer()
+
+    if os.environ.get("COTIDIANO_PERF"):
+        from core import perf
+
+        perf.enable()
+
+    from ui.main_window import PDFEditorApp
+
+    if profiler is not None:
+        profiler.mark("importações da interface")
 
-def main():
     app = PDFEditorApp()
+
+    if profiler is not None:
+        profiler.mark("janela criada")
+
+        def on_first_paint():
+            profiler.mark("primeira pintura")
+            profiler.uninstall_import_timer()
+            profiler.emit()
+            if mode == "exit":
+                app.on_close()
+
+        # update_idletasks desenha a janela; o after_idle roda logo depois
+        app.update_idletasks()
+        app.after_idle(on_first_paint)
+
     app.mainloop()
 
 
 if __name__ == "__main__":
+    # Necessário para os pools de processos no executável do PyInstaller (Windows)
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,27 @@
+# pdf_editor/tests/test_cli.py
+#
+# Rodar na raiz do projeto:  python -m pytest -q
+
+import pytest
+
+import cli
+
+
+@pytest.mark.parametrize("command", [
+    ["split", "{pdf}", "-o", "{out}", "--chunk", "1"],
+    ["split", "{pdf}", "-o", "{out}", "--extract", "1"],
+    ["images", "{pdf}", "-o", "{out}"],
+    ["text", "{pdf}", "-o", "{out}"],
+])
+def test_corrupt_input_is_reported_without_traceback(tmp_path, capsys, command):
+    pdf_path = tmp_path / "quebrado.pdf"
+    pdf_path.write_bytes(b"%PDF-1.7\nisto nao e um pdf de verdade\n")
+    out = tmp_path / "out"
+
+    argv = [arg.format(pdf=pdf_path, out=out) for arg in command]
+    code = cli.main(argv)
+
+    assert code == 1
+    err = capsys.readouterr().err
+    assert f"erro: {pdf_path}:" in err
+    assert "Traceback" not in err
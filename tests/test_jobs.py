@@ -0,0 +1,56 @@
+# pdf_editor/tests/test_jobs.py
+
+import time
+
+from core.jobs import CANCELLED, DONE, RUNNING, JobScheduler
+
+
+def _slow_write(path, delay):
+    time.sleep(delay)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("ok")
+    return path
+
+
+def _wait(scheduler, job, timeout=20):
+    deadline = time.monotonic() + timeout
+    while not job.finished and time.monotonic() < deadline:
+        scheduler.dispatch_events()
+        time.sleep(0.02)
+    scheduler.dispatch_events()
+
+
+def test_running_process_job_cannot_be_cancelled_and_still_reports(tmp_path):
+    scheduler = JobScheduler(max_processes=1)
+    done = []
+    out = str(tmp_path / "saida.txt")
+    try:
+        job = scheduler.submit("escrever", _slow_write, out, 0.5, kind="process", on_done=done.append)
+        while job.state != RUNNING:
+            time.sleep(0.01)
+
+        assert not job.cancellable
+        assert job.cancel() is False
+        _wait(scheduler, job)
+
+        assert job.state == DONE
+        assert done == [out]
+    finally:
+        scheduler.shutdown()
+
+
+def test_pending_process_job_is_cancelled_without_running(tmp_path):
+    scheduler = JobScheduler(max_threads=1, max_processes=1)
+    out = tmp_path / "nunca.txt"
+    try:
+        # Ocupa o único worker para que o próximo job fique pendente
+        blocker = scheduler.submit("bloqueia", _slow_write, str(tmp_path / "b.txt"), 0.5, kind="process")
+        job = scheduler.submit("escrever", _slow_write, str(out), 0, kind="process")
+        assert job.cancellable
+        assert job.cancel() is True
+        _wait(scheduler, blocker)
+
+        assert job.state == CANCELLED
+        assert not out.exists()
+    finally:
+        scheduler.shutdown()
@@ -0,0 +1,70 @@
+# pdf_editor/tests/test_page_export.py
+
+import os
+
+import fitz  # PyMuPDF
+import pytest
+
+import cli
+from core import page_export
+from core.page_export import export_pages_as_images, validate_pattern
+
+
+def _make_pdf(path, pages=3):
+    doc = fitz.open()
+    for i in range(pages):
+        doc.new_page(width=100, height=100).insert_text((10, 50), f"p{i + 1}")
+    doc.save(str(path))
+    doc.close()
+
+
+@pytest.mark.parametrize("pattern", ["{nome}.{ext}", "{0}.png", "{page:xyz}.png"])
+def test_invalid_pattern_raises_value_error(pattern):
+    with pytest.raises(ValueError, match="Campos aceitos"):
+        validate_pattern(pattern)
+
+
+def test_valid_pattern_passes():
+    validate_pattern(page_export.DEFAULT_PATTERN)
+    validate_pattern("{name}-{index}.{ext}")
+
+
+def test_export_rejects_unknown_field_before_writing(tmp_path):
+    pdf_path = tmp_path / "a.pdf"
+    _make_pdf(pdf_path)
+    out_dir = tmp_path / "out"
+    with pytest.raises(ValueError):
+        export_pages_as_images(str(pdf_path), str(out_dir), pattern="{nome}.{ext}", workers=1)
+    assert not out_dir.exists() or not os.listdir(out_dir)
+
+
+def test_cli_reports_invalid_pattern_without_traceback(tmp_path, capsys):
+    pdf_path = tmp_path / "a.pdf"
+    _make_pdf(pdf_path)
+    code = cli.main(["images", str(pdf_path), "-o", str(tmp_path / "out"), "--pattern", "{nome}.{ext}"])
+    assert code != 0
+    err = capsys.readouterr().err
+    assert "erro:" in err and "{name}" in err
+    assert "Traceback" not in err
+
+
+def test_serial_export_opens_the_pdf_once(tmp_path, monkeypatch):
+    pdf_path = tmp_path / "a.pdf"
+    _make_pdf(pdf_path, pages=5)
+
+    opened = []
+    real_open = fitz.open
+
+    def counting_open(*args, **kwargs):
+        opened.append(args)
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(page_export.fitz, "open", counting_open)
+    progress = []
+    written = export_pages_as_images(
+        str(pdf_path), str(tmp_path / "out"), pages=range(5), workers=1,
+        progress=lambda done, total: progress.append((done, total)),
+    )
+    assert len(written) == 5
+    assert len(opened) == 1
+    assert progress[-1] == (5, 5)
@@ -0,0 +1,35 @@
+# pdf_editor/tests/test_startup_imports.py
+#
+# Rodar na raiz do projeto:  python -m pytest -q
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# O que a janela principal importa (e cria) antes da primeira pintura
+STARTUP_MODULES = (
+    "core.disk_cache", "core.jobs", "core.overlay_compositor", "core.overlays",
+    "core.page_ranges", "core.pdf_manager", "core.perf", "core.prefetch", "core.thumbnails",
+)
+
+
+def test_startup_chain_does_not_load_fitz_or_pil():
+    code = (
+        "import sys\n"
+        f"for name in {STARTUP_MODULES!r}:\n"
+        "    __import__(name)\n"
+        "from core.disk_cache import DiskRenderCache\n"
+        "from core.overlay_compositor import OverlayCompositor\n"
+        "from core.pdf_manager import PDFManager\n"
+        "from core.prefetch import PagePrefetcher\n"
+        "from core.thumbnails import ThumbnailWorker\n"
+        "PDFManager(disk_cache=DiskRenderCache()); OverlayCompositor()\n"
+        "PagePrefetcher(); ThumbnailWorker()\n"
+        "print(','.join(m for m in ('fitz', 'pymupdf', 'PIL') if m in sys.modules))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == ""
@@ -0,0 +1,73 @@
+# pdf_editor/tests/test_text_extract.py
+#
+# Rodar na raiz do projeto:  python -m pytest -q
+
+import threading
+
+import fitz  # PyMuPDF
+
+from core.pdf_manager import PDFManager
+from core.text_extract import extract_text_to_file
+
+
+def _make_pdf(path, pages=6):
+    doc = fitz.open()
+    for i in range(pages):
+        doc.new_page().insert_text((50, 60), f"Pagina original {i + 1}", fontsize=12)
+    doc.save(str(path))
+    doc.close()
+
+
+def test_snapshot_survives_edit_and_close_during_extraction(tmp_path):
+    pdf_path = tmp_path / "doc.pdf"
+    out_path = tmp_path / "texto.txt"
+    _make_pdf(pdf_path)
+
+    pm = PDFManager()
+    pm.open_pdf(str(pdf_path))
+    pm.apply_text_overlays({0: [((50, 100, 300, 120), "Edicao nao salva")]})
+    assert pm.has_unsaved_changes
+
+    source = pm.snapshot_source()
+    assert isinstance(source, bytes)
+
+    first_page_done = threading.Event()
+    ui_done = threading.Event()
+
+    def progress(done, total):
+        if done == 1:
+            first_page_done.set()
+            ui_done.wait(5)  # a "interface" mexe no documento no meio da extração
+
+    result = {}
+    worker = threading.Thread(
+        target=lambda: result.update(n=extract_text_to_file(source, str(out_path), progress=progress))
+    )
+    worker.start()
+
+    assert first_page_done.wait(5)
+    pm.apply_text_overlays({1: [((50, 100, 300, 120), "Edicao posterior")]})
+    pm.close()
+    ui_done.set()
+    worker.join(10)
+
+    assert not worker.is_alive()
+    assert result["n"] == 6
+    text = out_path.read_text(encoding="utf-8")
+    assert "Edicao nao salva" in text      # edição feita antes do início entra
+    assert "Edicao posterior" not in text  # e o que mudou depois não interfere
+    assert "Pagina original 6" in text
+
+
+def test_snapshot_source_is_path_without_unsaved_changes(tmp_path):
+    pdf_path = tmp_path / "doc.pdf"
+    _make_pdf(pdf_path, pages=2)
+
+    pm = PDFManager()
+    pm.open_pdf(str(pdf_path))
+    try:
+        assert pm.snapshot_source() == str(pdf_path)
+        out_path = tmp_path / "texto.txt"
+        assert extract_text_to_file(pm.snapshot_source(), str(out_path), workers=1) == 2
+    finally:
+        pm.close()
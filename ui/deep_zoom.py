@@ -0,0 +1,264 @@
+# pdf_editor/ui/deep_zoom.py
+
+import tkinter as tk
+
+import customtkinter as ctk
+from PIL import Image, ImageTk
+
+from core.tiles import (
+    TILE_SIZE,
+    ZOOM_LEVELS,
+    tile_budget_bytes,
+    tile_clip,
+    tile_grid,
+    visible_tiles,
+)
+
+
+PREVIEW_ZOOM = 1.0       # página inteira em baixa resolução (ladrilhos provisórios)
+DEFAULT_ZOOM_INDEX = 2   # 200%
+CANVAS_BG = "#2b2b2b"
+
+
+class DeepZoomWindow(ctk.CTkToplevel):
+    """
+    Visualização ampliada de uma página, renderizada em ladrilhos.
+
+    Só os ladrilhos visíveis (e um anel em volta) existem: cada um é
+    rasterizado com `clip` a partir do DisplayList da página, um por vez no
+    loop do Tk, e guardado no cache de ladrilhos do PDFManager. Enquanto um
+    ladrilho nítido não fica pronto, aparece um recorte ampliado da página
+    em baixa resolução. A memória depende do tamanho da janela, não do zoom.
+
+    Roda (ou +/-) muda o zoom mantendo o ponto sob o cursor; arrastar move.
+    """
+
+    def __init__(self, master, pdf_manager, page_index: int, zoom_index: int = DEFAULT_ZOOM_INDEX):
+        super().__init__(master)
+        self.pm = pdf_manager
+        self.page_index = page_index
+        self.doc_id = pdf_manager.doc_id
+        # Identidade do documento mostrado: outro arquivo aberto fecha a janela
+        self.path = pdf_manager.path
+        self.page_count = pdf_manager.page_count()
+        self.page_rect = pdf_manager.doc.load_page(page_index).rect
+        self.zoom_index = max(0, min(zoom_index, len(ZOOM_LEVELS) - 1))
+
+        self.title(f"Zoom - página {page_index + 1}")
+        self.geometry("900x700")
+
+        toolbar = ctk.CTkFrame(self)
+        toolbar.pack(fill="x", padx=10, pady=(10, 0))
+        ctk.CTkButton(toolbar, text="−", width=30, command=lambda: self.step_zoom(-1)).pack(side="left", padx=5, pady=5)
+        self.zoom_label = ctk.CTkLabel(toolbar, text="", width=60)
+        self.zoom_label.pack(side="left", padx=5)
+        ctk.CTkButton(toolbar, text="+", width=30, command=lambda: self.step_zoom(1)).pack(side="left", padx=5, pady=5)
+        ctk.CTkLabel(
+            toolbar, text="Roda do mouse: zoom  •  Arrastar: mover", font=ctk.CTkFont(size=12)
+        ).pack(side="right", padx=10)
+
+        body = ctk.CTkFrame(self)
+        body.pack(fill="both", expand=True, padx=10, pady=10)
+        body.grid_rowconfigure(0, weight=1)
+        body.grid_columnconfigure(0, weight=1)
+
+        self.canvas = tk.Canvas(body, bg=CANVAS_BG, highlightthickness=0)
+        yscroll = ctk.CTkScrollbar(body, command=self._on_yscroll)
+        xscroll = ctk.CTkScrollbar(body, orientation="horizontal", command=self._on_xscroll)
+        self.canvas.configure(yscrollcommand=yscroll.set, xscrollcommand=xscroll.set)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        yscroll.grid(row=0, column=1, sticky="ns")
+        xscroll.grid(row=1, column=0, sticky="ew")
+
+        # Página inteira em baixa resolução (vem do cache de renderização)
+        self._preview = pdf_manager.render_page_image(page_index, zoom=PREVIEW_ZOOM)
+
+        # (tx, ty) -> [id no canvas, PhotoImage, nítido?]
+        self._tiles = {}
+        self._pending = []
+        self._render_after_id = None
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        self.canvas.bind("<ButtonPress-1>", lambda e: self.canvas.scan_mark(e.x, e.y))
+        self.canvas.bind("<B1-Motion>", self._on_drag)
+        self.canvas.bind("<MouseWheel>", lambda e: self.step_zoom(1 if e.delta > 0 else -1, e))
+        self.canvas.bind("<Button-4>", lambda e: self.step_zoom(1, e))
+        self.canvas.bind("<Button-5>", lambda e: self.step_zoom(-1, e))
+        self.bind("<plus>", lambda _e: self.step_zoom(1))
+        self.bind("<KP_Add>", lambda _e: self.step_zoom(1))
+        self.bind("<minus>", lambda _e: self.step_zoom(-1))
+        self.bind("<KP_Subtract>", lambda _e: self.step_zoom(-1))
+        self.bind("<Destroy>", self._on_destroy)
+
+        self._apply_zoom()
+
+    @property
+    def zoom(self) -> float:
+        return ZOOM_LEVELS[self.zoom_index]
+
+    # =============================
+    # Zoom / rolagem
+    # =============================
+
+    def _page_size_px(self):
+        cols, rows = tile_grid(self.page_rect, self.zoom)
+        width = int(round(self.page_rect.width * self.zoom))
+        height = int(round(self.page_rect.height * self.zoom))
+        return max(1, min(width, cols * TILE_SIZE)), max(1, min(height, rows * TILE_SIZE))
+
+    def _apply_zoom(self):
+        self.zoom_label.configure(text=f"{self.zoom * 100:.0f}%")
+        width, height = self._page_size_px()
+        self.canvas.configure(scrollregion=(0, 0, width, height))
+        self._drop_tiles()
+        self._update_visible()
+
+    def step_zoom(self, step: int, event=None):
+        new_index = max(0, min(self.zoom_index + step, len(ZOOM_LEVELS) - 1))
+        if new_index == self.zoom_index:
+            return
+
+        # Mantém fixo o ponto da página sob o cursor (ou o centro da vista)
+        if event is not None:
+            vx, vy = event.x, event.y
+        else:
+            vx, vy = self.canvas.winfo_width() / 2, self.canvas.winfo_height() / 2
+        old_w, old_h = self._page_size_px()
+        fx = self.canvas.canvasx(vx) / old_w
+        fy = self.canvas.canvasy(vy) / old_h
+
+        self.zoom_index = new_index
+        new_w, new_h = self._page_size_px()
+        self._apply_zoom()
+        self.canvas.xview_moveto(max(0.0, (fx * new_w - vx) / new_w))
+        self.canvas.yview_moveto(max(0.0, (fy * new_h - vy) / new_h))
+        self._update_visible()
+
+    def _on_xscroll(self, *args):
+        self.canvas.xview(*args)
+        self._update_visible()
+
+    def _on_yscroll(self, *args):
+        self.canvas.yview(*args)
+        self._update_visible()
+
+    def _on_drag(self, event):
+        self.canvas.scan_dragto(event.x, event.y, gain=1)
+        self._update_visible()
+
+    def _on_configure(self, event):
+        # Orçamento do cache proporcional à janela (não ao zoom)
+        self.pm.tile_cache.set_max_bytes(tile_budget_bytes(event.width, event.height))
+        self._update_visible()
+
+    # =============================
+    # Ladrilhos
+    # =============================
+
+    def _document_changed(self) -> bool:
+        pm = self.pm
+        if pm.doc is None or pm.path != self.path or pm.page_count() != self.page_count:
+            # Outro documento aberto (ou fechado): esta página não existe mais nele
+            self.destroy()
+            return True
+        if pm.doc_id != self.doc_id:
+            # Mesmo arquivo editado/salvo: ladrilhos e prévia antigos não valem mais
+            self.doc_id = pm.doc_id
+            page_rect = pm.doc.load_page(self.page_index).rect
+            if page_rect != self.page_rect:
+                self.page_rect = page_rect
+                width, height = self._page_size_px()
+                self.canvas.configure(scrollregion=(0, 0, width, height))
+            self._preview = pm.render_page_image(self.page_index, zoom=PREVIEW_ZOOM)
+            self._drop_tiles()
+        return False
+
+    def _update_visible(self):
+        if self._document_changed():
+            return
+
+        view = (
+            self.canvas.canvasx(0),
+            self.canvas.canvasy(0),
+            self.canvas.canvasx(self.canvas.winfo_width()),
+            self.canvas.canvasy(self.canvas.winfo_height()),
+        )
+        wanted = visible_tiles(view, self.zoom, self.page_rect)
+        wanted_set = set(wanted)
+
+        for tile in list(self._tiles):
+            if tile not in wanted_set:
+                self.canvas.delete(self._tiles.pop(tile)[0])
+
+        for tile in wanted:
+            if tile not in self._tiles:
+                self._create_tile(tile)
+
+        self._pending = [t for t in wanted if not self._tiles[t][2]]
+        self._schedule_render()
+
+    def _create_tile(self, tile):
+        tx, ty = tile
+        img = self.pm.cached_tile(self.page_index, self.zoom, tx, ty)
+        sharp = img is not None
+        if not sharp:
+            img = self._preview_tile(tx, ty)
+        photo = ImageTk.PhotoImage(img)
+        item = self.canvas.create_image(tx * TILE_SIZE, ty * TILE_SIZE, image=photo, anchor="nw")
+        self._tiles[tile] = [item, photo, sharp]
+
+    def _preview_tile(self, tx, ty) -> Image.Image:
+        """Ladrilho provisório: recorte da prévia em baixa resolução, ampliado."""
+        clip = tile_clip(self.page_rect, self.zoom, tx, ty)
+        size = (
+            max(1, int(round(clip.width * self.zoom))),
+            max(1, int(round(clip.height * self.zoom))),
+        )
+        box = (
+            (clip.x0 - self.page_rect.x0) * PREVIEW_ZOOM,
+            (clip.y0 - self.page_rect.y0) * PREVIEW_ZOOM,
+            (clip.x1 - self.page_rect.x0) * PREVIEW_ZOOM,
+            (clip.y1 - self.page_rect.y0) * PREVIEW_ZOOM,
+        )
+        return self._preview.resize(size, Image.BILINEAR, box=box)
+
+    def _drop_tiles(self):
+        for item, _photo, _sharp in self._tiles.values():
+            self.canvas.delete(item)
+        self._tiles.clear()
+        self._pending = []
+
+    def _schedule_render(self):
+        if self._render_after_id is None and self._pending:
+            self._render_after_id = self.after(1, self._render_next)
+
+    def _render_next(self):
+        """Um ladrilho nítido por vez (do centro para fora) para não travar o Tk."""
+        self._render_after_id = None
+        if self._document_changed():
+            return
+        while self._pending:
+            tile = self._pending.pop(0)
+            entry = self._tiles.get(tile)
+            if entry is not None and not entry[2]:
+                break
+        else:
+            return
+
+        tx, ty = tile
+        img = self.pm.render_tile(self.page_index, self.zoom, tx, ty)
+        photo = ImageTk.PhotoImage(img)
+        self.canvas.itemconfigure(entry[0], image=photo)
+        entry[1] = photo
+        entry[2] = True
+
+        self._schedule_render()
+
+    def _on_destroy(self, event):
+        if event.widget is not self:
+            return
+        if self._render_after_id is not None:
+            self.after_cancel(self._render_after_id)
+            self._render_after_id = None
+        self._tiles.clear()
+        self._preview = None
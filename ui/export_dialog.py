@@ -0,0 +1,162 @@
+# pdf_editor/ui/export_dialog.py
+
+import os
+from tkinter import filedialog, messagebox
+
+import customtkinter as ctk
+
+from core.jobs import PRIORITY_BULK
+from core.page_export import export_pages_as_images, DEFAULT_PATTERN
+from core.page_ranges import parse_page_range
+
+
+class BatchExportDialog(ctk.CTkToplevel):
+    """Janela para exportar várias páginas como imagem, em paralelo (como job)."""
+
+    def __init__(self, master, scheduler, pdf_path: str, page_count: int):
+        super().__init__(master)
+        self.scheduler = scheduler
+        self.pdf_path = pdf_path
+        self.page_count = page_count
+
+        self.title("Exportar páginas como imagens")
+        self.geometry("520x430")
+        self.transient(master)
+        self.grid_columnconfigure(1, weight=1)
+
+        self._job = None
+
+        default_dir = os.path.dirname(os.path.abspath(pdf_path))
+        self.pages_var = ctk.StringVar(value="")
+        self.dpi_var = ctk.StringVar(value="144")
+        self.format_var = ctk.StringVar(value="PNG")
+        self.quality_var = ctk.StringVar(value="90")
+        self.dir_var = ctk.StringVar(value=default_dir)
+        self.pattern_var = ctk.StringVar(value=DEFAULT_PATTERN)
+        self.workers_var = ctk.StringVar(value=str(os.cpu_count() or 1))
+
+        row = 0
+        for label, var in (
+            (f"Páginas (ex.: 1-5, 8; vazio = todas de {page_count}):", self.pages_var),
+            ("DPI:", self.dpi_var),
+            ("Qualidade JPEG (1-100):", self.quality_var),
+            ("Padrão do nome:", self.pattern_var),
+            ("Processos:", self.workers_var),
+        ):
+            ctk.CTkLabel(self, text=label).grid(row=row, column=0, padx=10, pady=5, sticky="w")
+            ctk.CTkEntry(self, textvariable=var).grid(row=row, column=1, padx=10, pady=5, sticky="ew")
+            row += 1
+
+        ctk.CTkLabel(self, text="Formato:").grid(row=row, column=0, padx=10, pady=5, sticky="w")
+        ctk.CTkComboBox(
+            self, values=["PNG", "JPEG"], variable=self.format_var
+        ).grid(row=row, column=1, padx=10, pady=5, sticky="w")
+        row += 1
+
+        ctk.CTkLabel(self, text="Pasta de destino:").grid(row=row, column=0, padx=10, pady=5, sticky="w")
+        dir_frame = ctk.CTkFrame(self, fg_color="transparent")
+        dir_frame.grid(row=row, column=1, padx=10, pady=5, sticky="ew")
+        dir_frame.grid_columnconfigure(0, weight=1)
+        ctk.CTkEntry(dir_frame, textvariable=self.dir_var).grid(row=0, column=0, sticky="ew")
+        ctk.CTkButton(
+            dir_frame, text="...", width=30, command=self._choose_dir
+        ).grid(row=0, column=1, padx=(5, 0))
+        row += 1
+
+        self.progress_bar = ctk.CTkProgressBar(self)
+        self.progress_bar.set(0)
+        self.progress_bar.grid(row=row, column=0, columnspan=2, padx=10, pady=(15, 5), sticky="ew")
+        row += 1
+
+        self.status_label = ctk.CTkLabel(self, text="")
+        self.status_label.grid(row=row, column=0, columnspan=2, padx=10, pady=5)
+        row += 1
+
+        buttons = ctk.CTkFrame(self, fg_color="transparent")
+        buttons.grid(row=row, column=0, columnspan=2, pady=10)
+        self.export_btn = ctk.CTkButton(buttons, text="Exportar", command=self._start)
+        self.export_btn.grid(row=0, column=0, padx=5)
+        self.cancel_btn = ctk.CTkButton(buttons, text="Cancelar", command=self._cancel, state="disabled")
+        self.cancel_btn.grid(row=0, column=1, padx=5)
+
+    def _choose_dir(self):
+        path = filedialog.askdirectory(title="Pasta de destino", initialdir=self.dir_var.get())
+        if path:
+            self.dir_var.set(path)
+
+    def _start(self):
+        try:
+            pages = parse_page_range(self.pages_var.get(), self.page_count)
+            dpi = int(self.dpi_var.get())
+            quality = int(self.quality_var.get())
+            workers = int(self.workers_var.get())
+        except ValueError as e:
+            messagebox.showerror("Erro", f"Parâmetros inválidos.\n\n{e}", parent=self)
+            return
+
+        if not pages:
+            messagebox.showwarning("Atenção", "Nenhuma página selecionada.", parent=self)
+            return
+
+        output_dir = self.dir_var.get()
+        kwargs = dict(
+            pages=pages,
+            pattern=self.pattern_var.get() or DEFAULT_PATTERN,
+            dpi=dpi,
+            fmt=self.format_var.get(),
+            quality=quality,
+            workers=workers,
+        )
+
+        def export(ctx):
+            return export_pages_as_images(
+                self.pdf_path,
+                output_dir,
+                progress=ctx.progress,
+                cancel_event=ctx.cancel_event,
+                **kwargs,
+            )
+
+        self.export_btn.configure(state="disabled")
+        self.cancel_btn.configure(state="normal")
+        self.progress_bar.set(0)
+        self.status_label.configure(text=f"0/{len(pages)}")
+
+        self._job = self.scheduler.submit(
+            f"Exportar {len(pages)} páginas",
+            export,
+            priority=PRIORITY_BULK,
+            on_done=lambda written: self._on_done(written, len(pages)),
+            on_error=self._on_error,
+            on_progress=self._on_progress,
+        )
+
+    # Callbacks do job: chamados na thread da UI (JobScheduler.dispatch_events)
+
+    def _on_progress(self, job):
+        if not self.winfo_exists():
+            return
+        self.progress_bar.set(job.fraction or 0)
+        self.status_label.configure(text=f"{job.done}/{job.total}")
+
+    def _on_done(self, written, total):
+        if not self.winfo_exists():
+            return
+        self._finish()
+        messagebox.showinfo("Sucesso", f"{len(written)} de {total} páginas exportadas.", parent=self)
+
+    def _on_error(self, e):
+        if not self.winfo_exists():
+            return
+        self._finish()
+        messagebox.showerror("Erro", f"Falha ao exportar páginas.\n\n{e}", parent=self)
+
+    def _finish(self):
+        self.export_btn.configure(state="normal")
+        self.cancel_btn.configure(state="disabled")
+
+    def _cancel(self):
+        if self._job is not None:
+            self._job.cancel()
+            self._finish()
+            self.status_label.configure(text="Cancelado")
@@ -0,0 +1,78 @@
+# pdf_editor/ui/jobs_panel.py
+
+import customtkinter as ctk
+
+from core.jobs import RUNNING
+
+
+class JobsPanel(ctk.CTkToplevel):
+    """Lista das tarefas em segundo plano, com progresso e botão de cancelar."""
+
+    def __init__(self, master, scheduler):
+        super().__init__(master)
+        self.scheduler = scheduler
+
+        self.title("Tarefas em segundo plano")
+        self.geometry("560x360")
+
+        top = ctk.CTkFrame(self, fg_color="transparent")
+        top.pack(fill="x", padx=10, pady=(10, 0))
+        ctk.CTkButton(
+            top, text="Limpar concluídas", width=140, command=self._clear_finished
+        ).pack(side="right")
+
+        self.list_frame = ctk.CTkScrollableFrame(self)
+        self.list_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        self.list_frame.grid_columnconfigure(1, weight=1)
+
+        # job.id -> widgets da linha
+        self._rows = {}
+        self.refresh()
+
+    def refresh(self, changed=None):
+        """Atualiza as linhas (todas, ou só as dos jobs em `changed`)."""
+        jobs = self.scheduler.jobs
+        known = {job.id for job in jobs}
+        for job_id in list(self._rows):
+            if job_id not in known:
+                for widget in self._rows.pop(job_id).values():
+                    widget.destroy()
+
+        for row, job in enumerate(jobs):
+            if job.id not in self._rows:
+                self._create_row(job)
+            elif changed is not None and job not in changed:
+                continue
+            self._update_row(job, row)
+
+    def _create_row(self, job):
+        name = ctk.CTkLabel(self.list_frame, text=job.name, anchor="w")
+        bar = ctk.CTkProgressBar(self.list_frame)
+        bar.set(0)
+        state = ctk.CTkLabel(self.list_frame, text="", width=110, anchor="w")
+        cancel = ctk.CTkButton(self.list_frame, text="Cancelar", width=80, command=job.cancel)
+        self._rows[job.id] = {"name": name, "bar": bar, "state": state, "cancel": cancel}
+
+    def _update_row(self, job, row):
+        widgets = self._rows[job.id]
+        widgets["name"].grid(row=row, column=0, padx=5, pady=4, sticky="w")
+        widgets["bar"].grid(row=row, column=1, padx=5, pady=4, sticky="ew")
+        widgets["state"].grid(row=row, column=2, padx=5, pady=4, sticky="w")
+        widgets["cancel"].grid(row=row, column=3, padx=5, pady=4)
+
+        fraction = job.fraction
+        if fraction is not None:
+            widgets["bar"].set(fraction)
+        elif job.finished:
+            widgets["bar"].set(1)
+
+        text = job.state
+        if job.state == RUNNING and job.total:
+            text = f"{job.done}/{job.total}"
+        widgets["state"].configure(text=text)
+        # Processos já iniciados vão até o fim: o botão só vale para o que dá para interromper
+        widgets["cancel"].configure(state="normal" if job.cancellable else "disabled")
+
+    def _clear_finished(self):
+        self.scheduler.clear_finished()
+        self.refresh()
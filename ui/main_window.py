@@ -1,15 +1,56 @@
 # pdf_editor/ui/main_window.py
 
+import math
 import os
 import tkinter as tk
 from tkinter import filedialog, messagebox, colorchooser
 
 import customtkinter as ctk
-import fitz  # PyMuPDF
-from PIL import Image, ImageDraw, ImageFont
 
+from core.disk_cache import DiskRenderCache
 from core.pdf_manager import PDFManager
-from core.pdf_merge import merge_pdfs
+from core.perf import span, timed
+from core.jobs import JobScheduler, JobCancelled, CANCELLED, PRIORITY_INTERACTIVE, PRIORITY_BULK
+from core.overlay_compositor import OverlayCompositor, get_pil_font
+from core.overlays import OverlayStore, save_session, load_session, discard_session
+from core.page_ranges import parse_page_range
+from core.prefetch import PagePrefetcher, DEFAULT_PREFETCH_DEPTH
+from ui.thumbnail_strip import ThumbnailStrip
+
+# Importados sob demanda (não atrasam a abertura da janela):
+#   PIL e tudo que importa o PyMuPDF (fitz): core.pdf_open, core.imaging,
+#   core.pdf_edit, core.search_index, core.text_extract (o fitz é carregado
+#   no job de abertura do primeiro PDF, fora da thread da interface);
+#   core.pdf_docx_bridge, core.pdf_merge (pypdf), ui.export_dialog,
+#   ui.jobs_panel, ui.perf_panel, ui.merged_preview (PIL.ImageTk)
+
+
+PREFETCH_POLL_MS = 40
+
+DEFAULT_DISPLAY_ZOOM = 1.8  # usado enquanto o frame ainda não tem tamanho
+PREVIEW_MARGIN = 80         # espaço livre ao redor da página no preview
+RESIZE_DEBOUNCE_MS = 150
+
+TEXT_PAGES_PER_TICK = 4     # páginas de texto inseridas por ciclo do Tk
+
+JOBS_POLL_MS = 50
+SEARCH_HIT_COLOR = (255, 230, 0, 90)        # amarelo translúcido
+SEARCH_CURRENT_COLOR = (255, 140, 0, 130)   # resultado selecionado
+
+
+def fit_zoom(rect_page, frame_width: int, frame_height: int) -> float:
+    """Zoom para a página caber num frame desse tamanho (função pura: serve em threads)."""
+    if frame_width <= PREVIEW_MARGIN or frame_height <= PREVIEW_MARGIN:
+        return DEFAULT_DISPLAY_ZOOM
+    if rect_page.width <= 0 or rect_page.height <= 0:
+        return DEFAULT_DISPLAY_ZOOM
+
+    zoom = min(
+        (frame_width - PREVIEW_MARGIN) / rect_page.width,
+        (frame_height - PREVIEW_MARGIN) / rect_page.height,
+    )
+    # Arredonda para baixo: evita chaves de cache quase iguais e nunca passa do frame
+    return max(math.floor(zoom * 1000) / 1000, 0.05)
 
 
 def hex_to_rgb01(hex_color: str):
@@ -43,16 +84,48 @@ class PDFEditorApp(ctk.CTk):
         self.minsize(900, 600)
 
         # Estado do PDF / imagem
-        self.pdf_manager = PDFManager()
+        # Páginas renderizadas também vão para o disco (reabrir o mesmo PDF não re-renderiza)
+        self.pdf_manager = PDFManager(disk_cache=DiskRenderCache())
         self.current_page_image = None  # CTkImage
         self.display_img_size = None    # (w, h) exibida
         self.full_img_size = None       # (w, h) original
-        self.display_zoom = 1.8         # zoom usado ao renderizar
+        self.display_zoom = DEFAULT_DISPLAY_ZOOM  # zoom usado ao renderizar
+
+        # Resize: eventos <Configure> são agrupados (debounce)
+        self._resize_after_id = None
+        self._last_frame_size = None
+        self._last_display_image = None  # PIL.Image exibida (para o preview rápido)
+
+        # Prefetch das páginas vizinhas (N±1..N±depth) em segundo plano
+        self.prefetch_depth = DEFAULT_PREFETCH_DEPTH
+        self.prefetcher = PagePrefetcher(depth=self.prefetch_depth)
+
+        # Operações longas (mesclar, exportar, converter...) rodam como jobs;
+        # os resultados voltam para a UI só pelo _poll_jobs (after)
+        self.jobs = JobScheduler()
+        self.jobs_panel = None
+        self.perf_panel = None
+        self._open_job = None  # abertura de PDF em andamento (uma por vez)
+        # Aberturas ainda não terminadas (inclusive as já canceladas/substituídas):
+        # se uma delas terminar cancelada com o documento aberto, ele é fechado aqui
+        self._open_jobs = set()
+
+        # Busca: índice persistente (carregado/construído em segundo plano)
+        self.search_index = None
+        self._search_doc_id = None
+        self._search_job = None
+        self.search_hits = []       # [(page_index, [rects])]
+        self.search_hit_pos = -1
 
         # Estado de edição
-        # page_index -> [ { "pdf_rect":(x0,y0,x1,y1), "text":str, "widget":CTkTextbox|None, ... } ]
-        self.text_overlays = {}
+        # Edições de texto (modelo em core.overlays); os widgets ficam à parte:
+        # overlay.id -> {"widget": CTkTextbox, "dragging": bool, ...} só das caixas abertas
+        self.overlays = OverlayStore()
+        self._overlay_widgets = {}
+        self._overlay_page_shown = None  # página cujas caixas estão posicionadas
         self.active_overlay = None
+        # Camada das edições sobre a página em cache (redesenha só o que mudou)
+        self.overlay_compositor = OverlayCompositor()
         self.editor_mode = False
 
         # Estado da formatação
@@ -66,18 +139,22 @@ class PDFEditorApp(ctk.CTk):
         # Interface
         self._build_layout()
 
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.after(PREFETCH_POLL_MS, self._poll_prefetch)
+        self.after(JOBS_POLL_MS, self._poll_jobs)
+
     # =============================
     # Layout
     # =============================
 
     def _build_layout(self):
-        self.grid_columnconfigure(1, weight=1)
+        self.grid_columnconfigure(2, weight=1)
         self.grid_rowconfigure(0, weight=1)
 
         # Sidebar
         self.sidebar = ctk.CTkFrame(self, width=220, corner_radius=0)
         self.sidebar.grid(row=0, column=0, sticky="nsw")
-        self.sidebar.grid_rowconfigure(12, weight=1)
+        self.sidebar.grid_rowconfigure(15, weight=1)
 
         title_label = ctk.CTkLabel(
             self.sidebar,
@@ -112,35 +189,91 @@ class PDFEditorApp(ctk.CTk):
             command=self.extract_page_as_image_dialog
         ).grid(row=4, column=0, padx=20, pady=5, sticky="ew")
 
+        ctk.CTkButton(
+            self.sidebar,
+            text="🗂️ Exportar páginas em lote",
+            command=self.export_pages_dialog
+        ).grid(row=5, column=0, padx=20, pady=5, sticky="ew")
+
         ctk.CTkButton(
             self.sidebar,
             text="📝 Extrair texto do PDF",
             command=self.extract_text_dialog
-        ).grid(row=5, column=0, padx=20, pady=5, sticky="ew")
+        ).grid(row=6, column=0, padx=20, pady=5, sticky="ew")
+
+        # Conversões (rodam em segundo plano)
+        convert_frame = ctk.CTkFrame(self.sidebar, fg_color="transparent")
+        convert_frame.grid(row=7, column=0, padx=20, pady=5, sticky="ew")
+        convert_frame.grid_columnconfigure((0, 1), weight=1)
+
+        ctk.CTkButton(
+            convert_frame, text="PDF → DOCX", command=self.pdf_to_docx_dialog
+        ).grid(row=0, column=0, padx=(0, 3), sticky="ew")
+
+        ctk.CTkButton(
+            convert_frame, text="DOCX → PDF", command=self.docx_to_pdf_dialog
+        ).grid(row=0, column=1, padx=(3, 0), sticky="ew")
+
+        ctk.CTkButton(
+            convert_frame, text="Pasta de PDFs → DOCX", command=self.folder_to_docx_dialog
+        ).grid(row=1, column=0, columnspan=2, pady=(5, 0), sticky="ew")
 
         # Modo editor híbrido
         ctk.CTkLabel(
             self.sidebar,
             text="Modo editor interno",
             font=ctk.CTkFont(size=13, weight="bold")
-        ).grid(row=6, column=0, padx=20, pady=(20, 5), sticky="w")
+        ).grid(row=8, column=0, padx=20, pady=(20, 5), sticky="w")
 
         self.editor_mode_btn = ctk.CTkButton(
             self.sidebar,
             text="✏️ Ativar modo editor",
             command=self.toggle_editor_mode
         )
-        self.editor_mode_btn.grid(row=7, column=0, padx=20, pady=5, sticky="ew")
+        self.editor_mode_btn.grid(row=9, column=0, padx=20, pady=5, sticky="ew")
+
+        save_frame = ctk.CTkFrame(self.sidebar, fg_color="transparent")
+        save_frame.grid(row=10, column=0, padx=20, pady=5, sticky="ew")
+        save_frame.grid_columnconfigure((0, 1), weight=1)
 
         ctk.CTkButton(
-            self.sidebar,
-            text="💾 Salvar edição no PDF",
-            command=self.apply_overlays_to_pdf
-        ).grid(row=8, column=0, padx=20, pady=5, sticky="ew")
+            save_frame, text="💾 Salvar", command=self.save_overlays_in_place
+        ).grid(row=0, column=0, padx=(0, 3), sticky="ew")
+
+        ctk.CTkButton(
+            save_frame, text="Salvar como...", command=self.apply_overlays_to_pdf
+        ).grid(row=0, column=1, padx=(3, 0), sticky="ew")
+
+        # Busca no documento
+        search_frame = ctk.CTkFrame(self.sidebar)
+        search_frame.grid(row=11, column=0, padx=20, pady=(20, 0), sticky="ew")
+        search_frame.grid_columnconfigure(0, weight=1)
+
+        self.search_var = tk.StringVar(value="")
+        search_entry = ctk.CTkEntry(
+            search_frame, textvariable=self.search_var, placeholder_text="Buscar no PDF"
+        )
+        search_entry.grid(row=0, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        search_entry.bind("<Return>", lambda _e: self.run_search())
+
+        ctk.CTkButton(
+            search_frame, text="🔎", width=30, command=self.run_search
+        ).grid(row=0, column=2, padx=(0, 5), pady=5)
+
+        ctk.CTkButton(
+            search_frame, text="◀", width=30, command=lambda: self.jump_to_search_hit(-1)
+        ).grid(row=1, column=0, padx=5, pady=(0, 5), sticky="w")
+
+        self.search_label = ctk.CTkLabel(search_frame, text="", font=ctk.CTkFont(size=12))
+        self.search_label.grid(row=1, column=1, padx=5, pady=(0, 5))
+
+        ctk.CTkButton(
+            search_frame, text="▶", width=30, command=lambda: self.jump_to_search_hit(1)
+        ).grid(row=1, column=2, padx=(0, 5), pady=(0, 5))
 
         # Navegação de página
         nav_frame = ctk.CTkFrame(self.sidebar)
-        nav_frame.grid(row=11, column=0, padx=20, pady=20, sticky="ew")
+        nav_frame.grid(row=12, column=0, padx=20, pady=(20, 5), sticky="ew")
         nav_frame.grid_columnconfigure((0, 2), weight=1)
 
         ctk.CTkButton(
@@ -156,9 +289,29 @@ class PDFEditorApp(ctk.CTk):
             nav_frame, text="➡", width=10, command=self.next_page
         ).grid(row=0, column=2, padx=5, pady=5)
 
+        ctk.CTkButton(
+            nav_frame, text="🔍 Ampliar página", command=self.show_deep_zoom
+        ).grid(row=1, column=0, columnspan=3, padx=5, pady=(0, 5), sticky="ew")
+
+        ctk.CTkButton(
+            self.sidebar,
+            text="⏳ Tarefas",
+            command=self.show_jobs_panel
+        ).grid(row=13, column=0, padx=20, pady=5, sticky="ew")
+
+        ctk.CTkButton(
+            self.sidebar,
+            text="📊 Desempenho",
+            command=self.show_perf_panel
+        ).grid(row=14, column=0, padx=20, pady=(5, 20), sticky="ew")
+
+        # Miniaturas das páginas (geradas em segundo plano, cache em disco)
+        self.thumbnail_strip = ThumbnailStrip(self, on_select=self.go_to_page)
+        self.thumbnail_strip.grid(row=0, column=1, sticky="ns")
+
         # Área de preview
         self.preview_frame = ctk.CTkFrame(self, corner_radius=0)
-        self.preview_frame.grid(row=0, column=1, sticky="nsew")
+        self.preview_frame.grid(row=0, column=2, sticky="nsew")
         self.preview_frame.grid_rowconfigure(1, weight=1)
         self.preview_frame.grid_columnconfigure(0, weight=1)
 
@@ -262,34 +415,49 @@ class PDFEditorApp(ctk.CTk):
 
     def clear_overlays(self):
         """Remove todas as caixas de texto da interface e memória."""
-        for overlays in self.text_overlays.values():
-            for ov in overlays:
-                widget = ov.get("widget")
-                if widget is not None:
-                    try:
-                        widget.destroy()
-                    except Exception:
-                        pass
-        self.text_overlays.clear()
+        for state in self._overlay_widgets.values():
+            try:
+                state["widget"].destroy()
+            except Exception:
+                pass
+        self._overlay_widgets.clear()
+        self.overlays.clear()
+        self._overlay_page_shown = None
         self.active_overlay = None
 
-    def update_overlay_positions(self):
-        """Reposiciona / mostra as caixas da página atual (esconde as outras)."""
-        for overlays in self.text_overlays.values():
-            for ov in overlays:
-                widget = ov.get("widget")
-                if widget:
-                    widget.place_forget()
-
-        if not self.editor_mode:
+    def _save_edit_session(self):
+        """Guarda as edições pendentes para poderem ser restauradas ao reabrir o PDF."""
+        if self.pdf_manager.path is None:
             return
-        if self.pdf_manager.doc is None:
+        try:
+            save_session(self.overlays, self.pdf_manager.path)
+        except OSError:
+            pass
+
+    def update_overlay_positions(self, rect_page=None):
+        """
+        Reposiciona as caixas abertas da página atual. Ao trocar de página, só
+        as caixas da página anterior são escondidas.
+        """
+        page_index = None
+        if self.editor_mode and self.pdf_manager.doc is not None:
+            page_index = self.pdf_manager.get_current_page_index()
+
+        if self._overlay_page_shown is not None and self._overlay_page_shown != page_index:
+            for ov in self.overlays.page(self._overlay_page_shown):
+                state = self._overlay_widgets.get(ov.id)
+                if state is not None:
+                    state["widget"].place_forget()
+        self._overlay_page_shown = page_index
+
+        if page_index is None:
             return
         if self.display_img_size is None or self.full_img_size is None:
             return
 
-        page_index = self.pdf_manager.get_current_page_index()
-        page_overlays = self.text_overlays.get(page_index, [])
+        page_overlays = [
+            ov for ov in self.overlays.page(page_index) if ov.id in self._overlay_widgets
+        ]
         if not page_overlays:
             return
 
@@ -299,15 +467,12 @@ class PDFEditorApp(ctk.CTk):
             return
 
         scale = full_w / img_w
-        page = self.pdf_manager.doc.load_page(page_index)
-        rect_page = page.rect
+        if rect_page is None:
+            rect_page = self.pdf_manager.doc.load_page(page_index).rect
 
         for ov in page_overlays:
-            widget = ov.get("widget")
-            if not widget:
-                continue
-
-            x0, y0, x1, y1 = ov["pdf_rect"]
+            widget = self._overlay_widgets[ov.id]["widget"]
+            x0, y0, x1, y1 = ov.rect
 
             x0_full = (x0 - rect_page.x0) * self.display_zoom
             y0_full = (y0 - rect_page.y0) * self.display_zoom
@@ -335,72 +500,153 @@ class PDFEditorApp(ctk.CTk):
         )
         if not file_path:
             return
-
-        try:
+        self.open_pdf_async(file_path)
+
+    def open_pdf_async(self, path: str):
+        """
+        Abre o PDF num job: arquivos enormes, em rede ou danificados (o MuPDF
+        repara na abertura) não travam a janela. A primeira página já é
+        renderizada no job; o documento atual continua aberto até o novo
+        ficar pronto. Esc (ou o painel de tarefas) cancela.
+        """
+        if self._open_job is not None:
+            self._open_job.cancel()
+
+        name = os.path.basename(path)
+        frame_size = (self.preview_frame.winfo_width(), self.preview_frame.winfo_height())
+
+        def open_job(ctx):
+            from core.imaging import render_page_to_image
+            from core.pdf_open import open_document
+
+            doc = open_document(path, progress=ctx.progress, cancel_event=ctx.cancel_event)
+            if doc is None:
+                raise JobCancelled()
+            try:
+                first = None
+                if doc.page_count:
+                    page = doc.load_page(0)
+                    zoom = fit_zoom(page.rect, *frame_size)
+                    first = (zoom, render_page_to_image(page, zoom=zoom))
+                ctx.check_cancelled()
+            except BaseException:
+                doc.close()
+                raise
+            return doc, first
+
+        def on_progress(job):
+            if job is self._open_job and job.total:
+                self._show_open_status(f"Abrindo {name}... {job.done * 100 // job.total}%")
+
+        def on_done(result):
+            doc, first = result
+            if job is not self._open_job:
+                doc.close()
+                return
+            self._finish_open()
             self.clear_overlays()
-            self.pdf_manager.open_pdf(file_path)
+            self.pdf_manager.adopt_document(doc, path)
+            if first is not None:
+                zoom, img = first
+                self.pdf_manager.store_rendered_page(self.pdf_manager.doc_id, 0, zoom, "RGB", img)
+            self._restore_edit_session()
             self.show_current_page()
-        except Exception as e:
+            if doc.is_repaired:
+                messagebox.showwarning(
+                    "Arquivo reparado",
+                    f"{name} estava danificado e foi reparado na abertura.\n"
+                    "Use \"Salvar como...\" para gravar uma cópia íntegra."
+                )
+
+        def on_error(e):
+            if job is not self._open_job:
+                return
+            self._finish_open()
             messagebox.showerror("Erro", f"Não foi possível abrir o PDF.\n\n{e}")
 
+        job = self.jobs.submit(
+            f"Abrir {name}",
+            open_job,
+            priority=PRIORITY_INTERACTIVE,
+            on_done=on_done,
+            on_error=on_error,
+            on_progress=on_progress,
+        )
+        self._open_job = job
+        self._open_jobs.add(job)
+        self._show_open_status(f"Abrindo {name}...")
+        self.bind("<Escape>", lambda _e: self.cancel_open())
+
+    def _show_open_status(self, text: str):
+        # Com um documento aberto, ele continua visível; o aviso vai para o rótulo de página
+        if self.pdf_manager.doc is None:
+            self.preview_label.configure(text=f"{text}\n\n(Esc cancela)")
+        else:
+            self.page_label.configure(text=text)
+
+    def cancel_open(self):
+        if self._open_job is not None:
+            self._open_job.cancel()
+            self._finish_open()
+
+    def _finish_open(self):
+        """Encerra o estado "abrindo..." (concluída, com erro ou cancelada)."""
+        job, self._open_job = self._open_job, None
+        self.unbind("<Escape>")
+        if self.pdf_manager.doc is None:
+            self.preview_label.configure(text="Abra um PDF para começar")
+        else:
+            total = self.pdf_manager.page_count()
+            self.page_label.configure(text=f"Página {self.pdf_manager.get_current_page_index() + 1}/{total}")
+
+    def _restore_edit_session(self):
+        path = self.pdf_manager.path
+        store = load_session(path)
+        if store is None:
+            return
+        count = sum(len(store.page(p)) for p in store.pages())
+        if messagebox.askyesno(
+            "Edições não salvas",
+            f"Há {count} edição(ões) não salva(s) deste PDF. Deseja restaurá-las?"
+        ):
+            self.overlays = store
+        else:
+            discard_session(path)
+
+    @timed("ui.show_current_page")
     def show_current_page(self):
         """Renderiza a página + aplica as edições visuais (preview)."""
         if self.pdf_manager.doc is None:
             return
 
         try:
-            self.display_zoom = 1.8
+            page_idx = self.pdf_manager.get_current_page_index()
+            page = self.pdf_manager.doc.load_page(page_idx)
+            rect_page = page.rect
+
+            # Renderiza já no tamanho exibido (sem renderizar grande e reduzir)
+            self.display_zoom = self._fit_zoom(rect_page)
             img_full = self.pdf_manager.render_current_page_image(zoom=self.display_zoom)
             self.full_img_size = img_full.size
 
-            frame_width = self.preview_frame.winfo_width()
-            frame_height = self.preview_frame.winfo_height()
-
-            img = img_full.copy()
-            if frame_width > 80 and frame_height > 80:
-                img.thumbnail((frame_width - 80, frame_height - 80))
-
+            # A imagem vem do cache (compartilhada): só copia se for desenhar nela
+            img = img_full
             self.display_img_size = img.size
 
-            page_idx = self.pdf_manager.get_current_page_index()
-            page = self.pdf_manager.doc.load_page(page_idx)
-            rect_page = page.rect
             full_w, _ = self.full_img_size
             disp_w, _ = self.display_img_size
             scale = full_w / disp_w if disp_w > 0 else 1.0
 
-            overlays = self.text_overlays.get(page_idx, [])
-            if overlays:
-                draw = ImageDraw.Draw(img)
-                try:
-                    font_pil = ImageFont.truetype("arial.ttf", self.editor_font_size.get())
-                except Exception:
-                    font_pil = ImageFont.load_default()
-
-                for ov in overlays:
-                    text = ov.get("text")
-                    if not text:
-                        continue
-
-                    x0, y0, x1, y1 = ov["pdf_rect"]
-
-                    x0_full = (x0 - rect_page.x0) * self.display_zoom
-                    y0_full = (y0 - rect_page.y0) * self.display_zoom
-                    x1_full = (x1 - rect_page.x0) * self.display_zoom
-                    y1_full = (y1 - rect_page.y0) * self.display_zoom
-
-                    x0_disp = x0_full / scale
-                    y0_disp = y0_full / scale
-                    x1_disp = x1_full / scale
-                    y1_disp = y1_full / scale
-
-                    draw.rectangle([x0_disp, y0_disp, x1_disp, y1_disp], fill="white")
-                    draw.text(
-                        (x0_disp + 2, y0_disp + 2),
-                        text,
-                        fill=self.editor_color,
-                        font=font_pil,
-                    )
+            # Edições: compostas sobre a imagem do cache (que não é alterada)
+            img = self.overlay_compositor.compose(
+                (self.pdf_manager.doc_id, page_idx, self.display_zoom),
+                img_full,
+                self._overlay_layer_items(page_idx, rect_page, scale),
+            )
+
+            page_hits = self._search_hits_on_page(page_idx)
+            if page_hits:
+                img = self._draw_search_highlights(img, page_hits, rect_page, scale)
 
             self.current_page_image = ctk.CTkImage(
                 light_image=img,
@@ -409,63 +655,247 @@ class PDFEditorApp(ctk.CTk):
             )
             self.preview_label.configure(image=self.current_page_image, text="")
             self.preview_label.image = self.current_page_image
+            self._last_display_image = img
 
             total = self.pdf_manager.page_count()
             self.page_label.configure(text=f"Página {page_idx + 1}/{total}")
+            self.thumbnail_strip.show_document(
+                self.pdf_manager.path, self.pdf_manager.doc_id, total, page_idx
+            )
 
-            self.update_overlay_positions()
+            self.update_overlay_positions(rect_page)
+            self._schedule_prefetch()
 
         except Exception as e:
             messagebox.showerror("Erro", f"Erro ao renderizar página.\n\n{e}")
 
-    # ---------- NOVO: visualização com scroll do PDF mesclado ----------
+    # =============================
+    # Busca no documento
+    # =============================
 
-    def show_merged_preview(self, merged_path: str):
-        """Abre uma janela com scroll vertical mostrando TODAS as páginas do PDF mesclado."""
-        try:
-            doc = fitz.open(merged_path)
-        except Exception as e:
-            messagebox.showerror(
-                "Erro",
-                f"Não foi possível abrir o PDF mesclado para visualização.\n\n{e}"
-            )
+    def run_search(self):
+        pm = self.pdf_manager
+        if pm.doc is None:
+            messagebox.showwarning("Atenção", "Nenhum PDF aberto.")
             return
 
-        win = ctk.CTkToplevel(self)
-        win.title(f"Pré-visualização do PDF mesclado - {os.path.basename(merged_path)}")
-        win.geometry("900x700")
+        if self._search_doc_id != pm.doc_id:
+            self.search_index = None
+            self.search_hits = []
+            self.search_hit_pos = -1
+            self._search_doc_id = pm.doc_id
+            if self._search_job is not None:
+                self._search_job.cancel()
+                self._search_job = None
+
+        if self.search_index is None:
+            if self._search_job is None:
+                self._start_search_index_build()
+            return
 
-        info_label = ctk.CTkLabel(
-            win,
-            text=f"PDF mesclado: {os.path.basename(merged_path)}\n"
-                 f"Use a barra de rolagem para ver todas as páginas.",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            justify="center"
+        query = self.search_var.get().strip()
+        self.search_hits = self.search_index.search(query) if query else []
+        self.search_hit_pos = -1
+        if not self.search_hits:
+            self.search_label.configure(text="0 resultados" if query else "")
+            self.show_current_page()
+            return
+        self.jump_to_search_hit(1)
+
+    def _start_search_index_build(self):
+        """Carrega o índice do cache em disco ou o constrói num job com o seu próprio documento."""
+        pm = self.pdf_manager
+        path, doc_id = pm.path, pm.doc_id
+        self.search_label.configure(text="Indexando...")
+
+        def build(ctx):
+            from core.search_index import load_or_build_index
+
+            return load_or_build_index(path, progress=ctx.progress, cancel_event=ctx.cancel_event)
+
+        def on_progress(job):
+            if doc_id == self._search_doc_id:
+                self.search_label.configure(text=f"Indexando {job.done}/{job.total}")
+
+        def on_done(index):
+            self._search_job = None
+            if doc_id != self._search_doc_id or index is None:
+                # Resultado de um documento que não está mais aberto
+                return
+            self.search_index = index
+            self.run_search()
+
+        def on_error(e):
+            self._search_job = None
+            self.search_label.configure(text="")
+            messagebox.showerror("Erro", f"Falha ao indexar o PDF.\n\n{e}")
+
+        self._search_job = self.jobs.submit(
+            f"Indexar {os.path.basename(path)}",
+            build,
+            priority=PRIORITY_INTERACTIVE,
+            on_done=on_done,
+            on_error=on_error,
+            on_progress=on_progress,
         )
-        info_label.pack(padx=10, pady=(10, 5))
 
-        scroll = ctk.CTkScrollableFrame(win, width=850, height=600)
-        scroll.pack(fill="both", expand=True, padx=10, pady=10)
+    def jump_to_search_hit(self, step: int):
+        if not self.search_hits:
+            return
+        self.search_hit_pos = (self.search_hit_pos + step) % len(self.search_hits)
+        page_index, _ = self.search_hits[self.search_hit_pos]
+        self.search_label.configure(text=f"{self.search_hit_pos + 1}/{len(self.search_hits)}")
+        self.pdf_manager.go_to_page(page_index)
+        self.show_current_page()
+
+    def _search_hits_on_page(self, page_index: int):
+        """[(é_o_resultado_atual, rects)] da página (vazio se a busca é de outro documento)."""
+        if not self.search_hits or self._search_doc_id != self.pdf_manager.doc_id:
+            return []
+        return [
+            (i == self.search_hit_pos, rects)
+            for i, (hit_page, rects) in enumerate(self.search_hits)
+            if hit_page == page_index
+        ]
+
+    def _overlay_layer_items(self, page_idx, rect_page, scale) -> dict:
+        """Itens do OverlayCompositor (em pixels da imagem exibida) para as edições da página."""
+        font = get_pil_font(
+            self.editor_font_family.get(),
+            max(1, round(self.editor_font_size.get() * self.display_zoom / scale)),
+            self.editor_bold.get(),
+            self.editor_italic.get(),
+        )
+        items = {}
+        for ov in self.overlays.page(page_idx):
+            text = ov.text
+            if not text:
+                continue
+            x0, y0, x1, y1 = ov.rect
+            box = (
+                (x0 - rect_page.x0) * self.display_zoom / scale,
+                (y0 - rect_page.y0) * self.display_zoom / scale,
+                (x1 - rect_page.x0) * self.display_zoom / scale,
+                (y1 - rect_page.y0) * self.display_zoom / scale,
+            )
+            items[ov.id] = (box, text, font, self.editor_color)
+        return items
+
+    def _draw_search_highlights(self, img, page_hits, rect_page, scale):
+        """
+        Devolve uma nova imagem com os resultados destacados. Os retângulos vão
+        numa camada transparente composta por cima: desenhar direto numa
+        imagem RGBA substituiria os pixels (texto some) em vez de misturar.
+        """
+        from PIL import Image, ImageDraw
+
+        layer = Image.new("RGBA", img.size, (0, 0, 0, 0))
+        draw = ImageDraw.Draw(layer)
+        for is_current, rects in page_hits:
+            fill = SEARCH_CURRENT_COLOR if is_current else SEARCH_HIT_COLOR
+            for x0, y0, x1, y1 in rects:
+                draw.rectangle(
+                    [
+                        (x0 - rect_page.x0) * self.display_zoom / scale,
+                        (y0 - rect_page.y0) * self.display_zoom / scale,
+                        (x1 - rect_page.x0) * self.display_zoom / scale,
+                        (y1 - rect_page.y0) * self.display_zoom / scale,
+                    ],
+                    fill=fill,
+                )
+        base = img if img.mode == "RGBA" else img.convert("RGBA")
+        return Image.alpha_composite(base, layer)
+
+    # =============================
+    # Prefetch de páginas vizinhas
+    # =============================
+
+    def set_prefetch_depth(self, depth: int):
+        self.prefetch_depth = max(0, int(depth))
+        self.prefetcher.depth = self.prefetch_depth
+
+    def _schedule_prefetch(self):
+        pm = self.pdf_manager
+        if pm.doc is None or pm.has_unsaved_changes:
+            # A thread lê o arquivo do disco, que não tem as mudanças em memória
+            self.prefetcher.cancel()
+            return
+
+        zoom = self.display_zoom
+        self.prefetcher.request(
+            pm.path,
+            pm.doc_id,
+            pm.get_current_page_index(),
+            pm.page_count(),
+            zoom=zoom,
+            skip=lambda idx: pm.is_page_cached(idx, zoom=zoom),
+        )
+
+    def _poll_prefetch(self):
+        """Consome os resultados do prefetch no loop do Tk."""
+        for doc_id, page_index, zoom, colorspace, img in self.prefetcher.poll():
+            self.pdf_manager.store_rendered_page(doc_id, page_index, zoom, colorspace, img)
+        self.after(PREFETCH_POLL_MS, self._poll_prefetch)
+
+    # =============================
+    # Jobs em segundo plano
+    # =============================
+
+    def _poll_jobs(self):
+        """Único ponto onde resultados de jobs chegam à UI."""
+        changed = self.jobs.dispatch_events()
+        for job in changed:
+            if job in self._open_jobs and job.finished:
+                self._open_jobs.discard(job)
+                if job.state == CANCELLED and isinstance(job.result, tuple):
+                    # O cancelamento chegou quando o documento já estava aberto
+                    job.result[0].close()
+        if self._open_job is not None and self._open_job in changed and self._open_job.state == CANCELLED:
+            # Cancelada pelo painel de tarefas (não há callback de cancelamento)
+            self._finish_open()
+        if changed and self.jobs_panel is not None and self.jobs_panel.winfo_exists():
+            self.jobs_panel.refresh(changed)
+        self.after(JOBS_POLL_MS, self._poll_jobs)
+
+    def show_jobs_panel(self):
+        if self.jobs_panel is not None and self.jobs_panel.winfo_exists():
+            self.jobs_panel.lift()
+            return
+        from ui.jobs_panel import JobsPanel
+
+        self.jobs_panel = JobsPanel(self, self.jobs)
+
+    def show_perf_panel(self):
+        if self.perf_panel is not None and self.perf_panel.winfo_exists():
+            self.perf_panel.lift()
+            return
+        from ui.perf_panel import PerfPanel
+
+        self.perf_panel = PerfPanel(self)
 
-        num_pages = doc.page_count
-        for i in range(num_pages):
-            page = doc.load_page(i)
-            pix = page.get_pixmap(matrix=fitz.Matrix(1.5, 1.5), alpha=False)
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+    def _job_error_handler(self, message: str):
+        return lambda e: messagebox.showerror("Erro", f"{message}\n\n{e}")
 
-            # Redimensiona para caber na largura do frame, se necessário
-            max_width = 800
-            if img.width > max_width:
-                ratio = max_width / img.width
-                new_size = (max_width, int(img.height * ratio))
-                img = img.resize(new_size, Image.LANCZOS)
+    def on_close(self):
+        self.jobs.shutdown()
+        self.prefetcher.shutdown()
+        self.thumbnail_strip.shutdown()
+        self.pdf_manager.close()
+        self.destroy()
 
-            cimg = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
-            page_label = ctk.CTkLabel(scroll, image=cimg, text=f"Página {i+1}")
-            page_label.image = cimg
-            page_label.pack(pady=(5, 20))
+    # ---------- NOVO: visualização com scroll do PDF mesclado ----------
 
-        doc.close()
+    def show_merged_preview(self, merged_path: str):
+        """Abre uma janela com scroll vertical mostrando TODAS as páginas do PDF mesclado."""
+        try:
+            from ui.merged_preview import MergedPreviewWindow
+
+            MergedPreviewWindow(self, merged_path)
+        except Exception as e:
+            messagebox.showerror(
+                "Erro",
+                f"Não foi possível abrir o PDF mesclado para visualização.\n\n{e}"
+            )
 
     # ---------- /NOVO visualização mesclado ----------
 
@@ -486,23 +916,28 @@ class PDFEditorApp(ctk.CTk):
         if not save_path:
             return
 
-        try:
-            merge_pdfs(file_paths, save_path)
+        from core.pdf_merge import merge_pdfs
+
+        def on_done(_result):
             messagebox.showinfo(
                 "Sucesso",
                 f"PDFs mesclados com sucesso!\n\nArquivo salvo em:\n{save_path}"
             )
-
             # Atualiza visualização principal para o PDF mesclado
-            self.clear_overlays()
-            self.pdf_manager.open_pdf(save_path)
-            self.show_current_page()
+            self.open_pdf_async(save_path)
 
             # E abre uma janela extra com scroll, mostrando tudo em sequência
             self.show_merged_preview(save_path)
 
-        except Exception as e:
-            messagebox.showerror("Erro", f"Falha ao mesclar PDFs.\n\n{e}")
+        self.jobs.submit(
+            f"Mesclar {len(file_paths)} PDFs",
+            merge_pdfs,
+            list(file_paths),
+            save_path,
+            kind="process",
+            on_done=on_done,
+            on_error=self._job_error_handler("Falha ao mesclar PDFs."),
+        )
 
     # =============================
     # Outras funcionalidades
@@ -549,50 +984,235 @@ class PDFEditorApp(ctk.CTk):
         except Exception as e:
             messagebox.showerror("Erro", f"Falha ao salvar imagem.\n\n{e}")
 
+    def export_pages_dialog(self):
+        """Exporta várias páginas (ou o documento inteiro) como imagens, em paralelo."""
+        if self.pdf_manager.doc is None:
+            messagebox.showwarning("Atenção", "Nenhum PDF aberto.")
+            return
+        if self.pdf_manager.has_unsaved_changes:
+            messagebox.showwarning(
+                "Atenção",
+                "A exportação usa o arquivo salvo em disco.\n"
+                "Salve as edições antes para incluí-las nas imagens."
+            )
+
+        from ui.export_dialog import BatchExportDialog
+
+        BatchExportDialog(self, self.jobs, self.pdf_manager.path, self.pdf_manager.page_count())
+
     def extract_text_dialog(self):
         if self.pdf_manager.doc is None:
             messagebox.showwarning("Atenção", "Nenhum PDF aberto.")
             return
 
-        try:
-            text = self.pdf_manager.extract_text()
-
-            text_window = ctk.CTkToplevel(self)
-            text_window.title("Texto extraído do PDF")
-            text_window.geometry("800x600")
-
-            text_window.transient(self)
-            text_window.grab_set()
-            text_window.lift()
-            text_window.focus_force()
-            text_window.attributes("-topmost", True)
-            text_window.after(200, lambda: text_window.attributes("-topmost", False))
-
-            text_box = ctk.CTkTextbox(text_window, wrap="word")
-            text_box.pack(fill="both", expand=True, padx=10, pady=10)
-            text_box.insert("1.0", text)
-
-            def save_txt():
-                save_path = filedialog.asksaveasfilename(
-                    defaultextension=".txt",
-                    filetypes=[("Arquivo de texto", "*.txt")],
-                    title="Salvar texto como"
+        total = self.pdf_manager.page_count()
+
+        text_window = ctk.CTkToplevel(self)
+        text_window.title("Texto extraído do PDF")
+        text_window.geometry("800x600")
+
+        text_window.transient(self)
+        text_window.grab_set()
+        text_window.lift()
+        text_window.focus_force()
+        text_window.attributes("-topmost", True)
+        text_window.after(200, lambda: text_window.attributes("-topmost", False))
+
+        range_frame = ctk.CTkFrame(text_window, fg_color="transparent")
+        range_frame.pack(fill="x", padx=10, pady=(10, 0))
+        ctk.CTkLabel(
+            range_frame, text=f"Páginas (ex.: 1-5, 8; vazio = todas de {total}):"
+        ).pack(side="left")
+        range_var = ctk.StringVar(value="")
+        ctk.CTkEntry(range_frame, textvariable=range_var, width=160).pack(side="left", padx=5)
+
+        status_label = ctk.CTkLabel(range_frame, text="")
+        status_label.pack(side="right")
+
+        text_box = ctk.CTkTextbox(text_window, wrap="word")
+        text_box.pack(fill="both", expand=True, padx=10, pady=10)
+
+        # Estado da extração progressiva (algumas páginas por ciclo do Tk)
+        state = {"pages": [], "iter": None, "done": 0, "after_id": None}
+
+        def pump():
+            state["after_id"] = None
+            if not text_window.winfo_exists():
+                return
+            try:
+                for _ in range(TEXT_PAGES_PER_TICK):
+                    _, page_text = next(state["iter"])
+                    if state["done"]:
+                        text_box.insert("end", "\n")
+                    text_box.insert("end", page_text)
+                    state["done"] += 1
+            except StopIteration:
+                status_label.configure(text=f"{state['done']} página(s)")
+                return
+            except Exception as e:
+                messagebox.showerror("Erro", f"Falha ao extrair texto.\n\n{e}", parent=text_window)
+                return
+
+            status_label.configure(text=f"{state['done']}/{len(state['pages'])} páginas...")
+            state["after_id"] = text_window.after(1, pump)
+
+        def start():
+            try:
+                pages = parse_page_range(range_var.get(), total)
+            except ValueError as e:
+                messagebox.showerror("Erro", str(e), parent=text_window)
+                return
+
+            if state["after_id"] is not None:
+                text_window.after_cancel(state["after_id"])
+            text_box.delete("1.0", "end")
+            state.update(pages=pages, iter=self.pdf_manager.iter_text(pages), done=0)
+            pump()
+
+        def save_txt():
+            save_path = filedialog.asksaveasfilename(
+                defaultextension=".txt",
+                filetypes=[("Arquivo de texto", "*.txt")],
+                title="Salvar texto como"
+            )
+            if not save_path:
+                return
+            pages = list(state["pages"])
+            # O job não toca no documento da interface (que pode ser editado,
+            # salvo ou fechado enquanto isso): usa o arquivo ou uma cópia dele
+            try:
+                source = self.pdf_manager.snapshot_source()
+            except Exception as e:
+                messagebox.showerror("Erro", f"Falha ao salvar texto.\n\n{e}", parent=text_window)
+                return
+
+            def extract(ctx):
+                from core.text_extract import extract_text_to_file
+
+                return extract_text_to_file(
+                    source, save_path, pages, workers=os.cpu_count() or 1,
+                    progress=ctx.progress, cancel_event=ctx.cancel_event,
                 )
-                if not save_path:
-                    return
-                with open(save_path, "w", encoding="utf-8") as f:
-                    f.write(text)
-                messagebox.showinfo("Sucesso", "Texto salvo com sucesso.")
-
-            save_btn = ctk.CTkButton(
-                text_window,
-                text="Salvar como .txt",
-                command=save_txt
+
+            self.jobs.submit(
+                f"Salvar texto ({len(pages)} páginas)",
+                extract,
+                on_done=lambda _n: messagebox.showinfo("Sucesso", "Texto salvo com sucesso."),
+                on_error=self._job_error_handler("Falha ao salvar texto."),
             )
-            save_btn.pack(pady=10)
 
-        except Exception as e:
-            messagebox.showerror("Erro", f"Falha ao extrair texto.\n\n{e}")
+        ctk.CTkButton(range_frame, text="Extrair", width=80, command=start).pack(side="left", padx=5)
+
+        save_btn = ctk.CTkButton(
+            text_window,
+            text="Salvar como .txt",
+            command=save_txt
+        )
+        save_btn.pack(pady=10)
+
+        start()
+
+    def pdf_to_docx_dialog(self):
+        pdf_path = self.pdf_manager.path
+        if pdf_path is None:
+            pdf_path = filedialog.askopenfilename(filetypes=[("Arquivos PDF", "*.pdf")])
+            if not pdf_path:
+                return
+
+        docx_path = filedialog.asksaveasfilename(
+            defaultextension=".docx",
+            filetypes=[("Documento Word", "*.docx")],
+            initialfile=os.path.splitext(os.path.basename(pdf_path))[0] + ".docx",
+            title="Salvar DOCX como"
+        )
+        if not docx_path:
+            return
+
+        from core.pdf_docx_bridge import pdf_to_docx
+
+        self.jobs.submit(
+            f"PDF → DOCX: {os.path.basename(pdf_path)}",
+            pdf_to_docx,
+            pdf_path,
+            docx_path,
+            kind="process",
+            priority=PRIORITY_BULK,
+            on_done=lambda _r: messagebox.showinfo("Sucesso", f"DOCX salvo em:\n{docx_path}"),
+            on_error=self._job_error_handler("Falha ao converter para DOCX."),
+        )
+
+    def docx_to_pdf_dialog(self):
+        docx_path = filedialog.askopenfilename(filetypes=[("Documento Word", "*.docx")])
+        if not docx_path:
+            return
+
+        pdf_path = filedialog.asksaveasfilename(
+            defaultextension=".pdf",
+            filetypes=[("Arquivos PDF", "*.pdf")],
+            initialfile=os.path.splitext(os.path.basename(docx_path))[0] + ".pdf",
+            title="Salvar PDF como"
+        )
+        if not pdf_path:
+            return
+
+        from core.pdf_docx_bridge import docx_to_pdf
+
+        def on_done(result_path):
+            if messagebox.askyesno("Sucesso", f"PDF salvo em:\n{result_path}\n\nAbrir agora?"):
+                self.open_pdf_async(result_path)
+
+        self.jobs.submit(
+            f"DOCX → PDF: {os.path.basename(docx_path)}",
+            docx_to_pdf,
+            docx_path,
+            pdf_path,
+            kind="process",
+            priority=PRIORITY_BULK,
+            on_done=on_done,
+            on_error=self._job_error_handler("Falha ao converter para PDF."),
+        )
+
+    def folder_to_docx_dialog(self):
+        """Converte todos os PDFs de uma pasta para DOCX (em paralelo, como job)."""
+        input_dir = filedialog.askdirectory(title="Pasta com os PDFs")
+        if not input_dir:
+            return
+        output_dir = filedialog.askdirectory(
+            title="Pasta de destino dos DOCX", initialdir=input_dir
+        )
+        if not output_dir:
+            return
+
+        from core.pdf_docx_bridge import convert_folder_to_docx
+
+        def convert(ctx):
+            return convert_folder_to_docx(
+                input_dir,
+                output_dir,
+                progress=lambda done, total, result: ctx.progress(
+                    done, total, os.path.basename(result["input"])
+                ),
+                cancel_event=ctx.cancel_event,
+            )
+
+        def on_done(results):
+            failed = [r for r in results if not r["ok"]]
+            message = f"{len(results) - len(failed)} de {len(results)} PDFs convertidos."
+            if failed:
+                details = "\n".join(
+                    f"• {os.path.basename(r['input'])}: {r['error']}" for r in failed[:10]
+                )
+                messagebox.showwarning("Conversão concluída com erros", f"{message}\n\n{details}")
+            else:
+                messagebox.showinfo("Sucesso", message)
+
+        self.jobs.submit(
+            f"Pasta → DOCX: {os.path.basename(input_dir)}",
+            convert,
+            priority=PRIORITY_BULK,
+            on_done=on_done,
+            on_error=self._job_error_handler("Falha ao converter a pasta."),
+        )
 
     # =============================
     # Modo editor híbrido (drag + resize)
@@ -608,6 +1228,7 @@ class PDFEditorApp(ctk.CTk):
             self.editor_mode_btn.configure(text="✏️ Ativar modo editor")
         self.update_overlay_positions()
 
+    @timed("ui.preview_double_click")
     def on_preview_double_click(self, event):
         """Cria caixa de edição na linha/área clicada (arrastável e redimensionável)."""
         if not self.editor_mode:
@@ -645,40 +1266,17 @@ class PDFEditorApp(ctk.CTk):
         x_pdf = rect_page.x0 + x_full / zoom
         y_pdf = rect_page.y0 + y_full / zoom
 
-        words = page.get_text("words")
-
-        if words:
-            chosen = None
-            for w in words:
-                x0, y0, x1, y1, text, b_no, l_no, w_no = w
-                if x0 <= x_pdf <= x1 and y0 <= y_pdf <= y1:
-                    chosen = w
-                    break
-
-            if chosen is None:
-                best_dist = float("inf")
-                for w in words:
-                    x0, y0, x1, y1, text, b_no, l_no, w_no = w
-                    cx = (x0 + x1) / 2
-                    cy = (y0 + y1) / 2
-                    d = (cx - x_pdf) ** 2 + (cy - y_pdf) ** 2
-                    if d < best_dist:
-                        best_dist = d
-                        chosen = w
-
-            x0_c, y0_c, x1_c, y1_c, text_c, block_no, line_no, _ = chosen
-
-            line_words = [
-                w for w in words
-                if w[5] == block_no and w[6] == line_no
-            ]
-            line_words.sort(key=lambda w: w[7])
-
-            line_text = " ".join(w[4] for w in line_words)
-            x0_line = min(w[0] for w in line_words)
-            y0_line = min(w[1] for w in line_words)
-            x1_line = max(w[2] for w in line_words)
-            y1_line = max(w[3] for w in line_words)
+        # Duplo clique sobre uma edição já confirmada: reabre essa edição
+        existing = self.overlays.page(page_index).at(x_pdf, y_pdf)
+        hit = None if existing else self.pdf_manager.get_word_index(page_index).line_at(x_pdf, y_pdf)
+
+        if existing is not None:
+            if existing.id in self._overlay_widgets:
+                return  # já está aberta
+            line_text = existing.text
+            x0_line, y0_line, x1_line, y1_line = existing.rect
+        elif hit is not None:
+            line_text, (x0_line, y0_line, x1_line, y1_line) = hit
         else:
             line_text = ""
             largura_pdf = rect_page.width * 0.3
@@ -714,51 +1312,51 @@ class PDFEditorApp(ctk.CTk):
             text_box.insert("1.0", line_text)
         text_box.focus()
 
-        overlay = {
-            "page_index": page_index,
-            "pdf_rect": pdf_rect,
-            "text": line_text,
+        if existing is not None:
+            overlay = existing
+        else:
+            overlay = self.overlays.create(page_index, pdf_rect, line_text)
+        state = {
             "widget": text_box,
             "dragging": False,
             "resizing": False,
             "drag_offset_x": 0,
             "drag_offset_y": 0,
         }
+        self._overlay_widgets[overlay.id] = state
 
         def _on_click(_event, ov=overlay):
             self.active_overlay = ov
 
         text_box.bind("<Button-1>", _on_click)
 
-        def _on_press(e, ov=overlay):
-            w = ov["widget"].winfo_width()
-            h = ov["widget"].winfo_height()
+        def _on_press(e, st=state):
+            w = st["widget"].winfo_width()
+            h = st["widget"].winfo_height()
             border = 10
             if e.x >= w - border and e.y >= h - border:
-                ov["resizing"] = True
-                ov["dragging"] = False
+                st["resizing"] = True
+                st["dragging"] = False
             else:
-                ov["dragging"] = True
-                ov["resizing"] = False
-                ov["drag_offset_x"] = e.x
-                ov["drag_offset_y"] = e.y
-
-        def _on_motion(e, ov=overlay):
-            widget = ov["widget"]
-            if widget is None:
-                return
-            if ov["dragging"]:
-                new_x = widget.winfo_x() + (e.x - ov["drag_offset_x"])
-                new_y = widget.winfo_y() + (e.y - ov["drag_offset_y"])
+                st["dragging"] = True
+                st["resizing"] = False
+                st["drag_offset_x"] = e.x
+                st["drag_offset_y"] = e.y
+
+        def _on_motion(e, st=state):
+            widget = st["widget"]
+            if st["dragging"]:
+                new_x = widget.winfo_x() + (e.x - st["drag_offset_x"])
+                new_y = widget.winfo_y() + (e.y - st["drag_offset_y"])
                 widget.place(x=new_x, y=new_y)
-            elif ov["resizing"]:
+            elif st["resizing"]:
                 new_w = max(30, e.x)
                 new_h = max(20, e.y)
                 widget.configure(width=int(new_w), height=int(new_h))
 
-        def _on_release(e, ov=overlay):
-            ov["dragging"] = False
-            ov["resizing"] = False
+        def _on_release(e, st=state):
+            st["dragging"] = False
+            st["resizing"] = False
 
         text_box.bind("<ButtonPress-1>", _on_press)
         text_box.bind("<B1-Motion>", _on_motion)
@@ -770,20 +1368,20 @@ class PDFEditorApp(ctk.CTk):
 
         text_box.bind("<Return>", _on_return)
 
-        self.text_overlays.setdefault(page_index, []).append(overlay)
         self.active_overlay = overlay
         self.apply_format_to_overlay(overlay)
 
     def commit_overlay(self, overlay):
         """Confirma edição: usa posição/tamanho ATUAL da caixa para recalcular a área no PDF."""
-        widget = overlay.get("widget")
-        if widget is None:
+        state = self._overlay_widgets.pop(overlay.id, None)
+        if state is None:
             return
+        widget = state["widget"]
 
         text = widget.get("1.0", "end-1c").strip()
-        overlay["text"] = text
+        overlay.text = text
 
-        page_index = overlay["page_index"]
+        page_index = overlay.page_index
         page = self.pdf_manager.doc.load_page(page_index)
         rect_page = page.rect
 
@@ -817,21 +1415,26 @@ class PDFEditorApp(ctk.CTk):
         x1_pdf = x_pdf + w_full / zoom
         y1_pdf = y_pdf + h_full / zoom
 
-        overlay["pdf_rect"] = (x_pdf, y_pdf, x1_pdf, y1_pdf)
+        if text:
+            self.overlays.move(overlay, (x_pdf, y_pdf, x1_pdf, y1_pdf))
+        else:
+            # Caixa confirmada vazia: descarta a edição
+            self.overlays.remove(overlay)
 
         try:
             widget.destroy()
         except Exception:
             pass
-        overlay["widget"] = None
         self.active_overlay = None
 
+        self._save_edit_session()
         self.show_current_page()
 
     def apply_format_to_overlay(self, overlay):
-        widget = overlay.get("widget")
-        if widget is None:
+        state = self._overlay_widgets.get(overlay.id)
+        if state is None:
             return
+        widget = state["widget"]
 
         style_parts = []
         if self.editor_bold.get():
@@ -871,15 +1474,74 @@ class PDFEditorApp(ctk.CTk):
             self.editor_color = color
             self.update_active_overlay_style()
 
-    def apply_overlays_to_pdf(self):
+    def _collect_overlay_edits(self):
+        """(overlays_by_page, estilo) das edições pendentes, ou None se não houver."""
         if self.pdf_manager.doc is None:
             messagebox.showwarning("Atenção", "Nenhum PDF aberto.")
-            return
+            return None
 
-        if not any(self.text_overlays.values()):
+        if not self.overlays:
             messagebox.showinfo("Info", "Nenhuma edição para aplicar.")
+            return None
+
+        overlays_by_page = self.overlays.edits_by_page()
+        style = dict(
+            fontname=FONT_MAP.get(self.editor_font_family.get(), "helv"),
+            fontsize=self.editor_font_size.get(),
+            color=hex_to_rgb01(self.editor_color),
+        )
+        return overlays_by_page, style
+
+    @timed("ui.save_overlays_in_place")
+    def save_overlays_in_place(self):
+        """
+        Aplica as edições no documento aberto e salva no próprio arquivo
+        (incremental: grava só o que mudou, sem reabrir o PDF).
+        """
+        edits = self._collect_overlay_edits()
+        if edits is None:
+            return
+        overlays_by_page, style = edits
+
+        pm = self.pdf_manager
+        if not pm.can_save_in_place():
+            messagebox.showwarning(
+                "Atenção",
+                "Este PDF não permite salvar no próprio arquivo "
+                "(ex.: arquivo reparado ao abrir). Use \"Salvar como...\"."
+            )
             return
 
+        try:
+            pm.apply_text_overlays(overlays_by_page, **style)
+            pm.save_in_place()
+        except Exception as e:
+            # As edições já podem estar desenhadas no documento em memória: volta
+            # ao arquivo salvo, senão uma nova tentativa as desenharia duas vezes
+            try:
+                pm.revert_to_saved()
+            except Exception as revert_error:
+                messagebox.showerror(
+                    "Erro",
+                    f"Falha ao salvar as edições.\n\n{e}\n\n"
+                    f"Também não foi possível reabrir o arquivo ({revert_error}). "
+                    "Feche o PDF sem salvar e abra-o de novo antes de tentar outra vez."
+                )
+                return
+            self.show_current_page()
+            messagebox.showerror("Erro", f"Falha ao salvar as edições.\n\n{e}")
+            return
+
+        discard_session(pm.path)
+        self.clear_overlays()
+        self.show_current_page()
+
+    def apply_overlays_to_pdf(self):
+        edits = self._collect_overlay_edits()
+        if edits is None:
+            return
+        overlays_by_page, style = edits
+
         save_pdf_path = filedialog.asksaveasfilename(
             defaultextension=".pdf",
             filetypes=[("Arquivos PDF", "*.pdf")],
@@ -888,45 +1550,38 @@ class PDFEditorApp(ctk.CTk):
         if not save_pdf_path:
             return
 
-        try:
-            doc = self.pdf_manager.doc
-            rgb_color = hex_to_rgb01(self.editor_color)
-            font_name = FONT_MAP.get(self.editor_font_family.get(), "helv")
-            font_size = self.editor_font_size.get()
-
-            for page_index, overlays in self.text_overlays.items():
-                page = doc.load_page(page_index)
-
-                for ov in overlays:
-                    text = ov.get("text", "").strip()
-                    if not text:
-                        continue
-
-                    x0, y0, x1, y1 = ov["pdf_rect"]
-                    rect_overlay = fitz.Rect(x0, y0, x1, y1)
-
-                    page.draw_rect(rect_overlay, color=(1, 1, 1), fill=(1, 1, 1))
-                    page.insert_textbox(
-                        rect_overlay,
-                        text,
-                        fontsize=font_size,
-                        fontname=font_name,
-                        color=rgb_color,
-                        align=0,
-                    )
-
-            doc.save(save_pdf_path)
+        source_path = self.pdf_manager.path
+        if os.path.normcase(os.path.abspath(save_pdf_path)) == os.path.normcase(os.path.abspath(source_path)):
+            # Salvar por cima do arquivo aberto = salvar no próprio arquivo
+            self.save_overlays_in_place()
+            return
+
+        def apply(ctx):
+            # Documento próprio: o visualizador continua livre enquanto salva.
+            # O span fica aqui (e não no método): o diálogo de arquivo não entra na medida
+            from core.pdf_edit import apply_text_overlays_to_file
+
+            with span("ui.apply_overlays_to_pdf"):
+                return apply_text_overlays_to_file(
+                    source_path, save_pdf_path, overlays_by_page, progress=ctx.progress, **style
+                )
+
+        def on_done(_applied):
             messagebox.showinfo(
                 "Sucesso",
                 f"Edições aplicadas e PDF salvo em:\n{save_pdf_path}"
             )
-
+            discard_session(source_path)
+            # As edições já estão no arquivo salvo
             self.clear_overlays()
-            self.pdf_manager.open_pdf(save_pdf_path)
-            self.show_current_page()
+            self.open_pdf_async(save_pdf_path)
 
-        except Exception as e:
-            messagebox.showerror("Erro", f"Falha ao aplicar edições.\n\n{e}")
+        self.jobs.submit(
+            f"Aplicar edições em {os.path.basename(save_pdf_path)}",
+            apply,
+            on_done=on_done,
+            on_error=self._job_error_handler("Falha ao aplicar edições."),
+        )
 
     # =============================
     # Navegação + resize
@@ -940,7 +1595,72 @@ class PDFEditorApp(ctk.CTk):
         self.pdf_manager.prev_page()
         self.show_current_page()
 
+    def go_to_page(self, page_index: int):
+        self.pdf_manager.go_to_page(page_index)
+        self.show_current_page()
+
+    def show_deep_zoom(self):
+        """Abre a página atual na janela de zoom profundo (renderização em ladrilhos)."""
+        if self.pdf_manager.doc is None:
+            messagebox.showwarning("Atenção", "Nenhum PDF aberto.")
+            return
+        from ui.deep_zoom import DeepZoomWindow
+
+        DeepZoomWindow(self, self.pdf_manager, self.pdf_manager.get_current_page_index())
+
     def on_preview_resize(self, event):
         if self.pdf_manager.doc is None:
             return
+
+        frame_size = (event.width, event.height)
+        if frame_size == self._last_frame_size:
+            return
+        self._last_frame_size = frame_size
+
+        # Enquanto o usuário arrasta: só reescala a imagem atual (rápido, baixa qualidade)
+        self._show_interim_scale()
+
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.after(RESIZE_DEBOUNCE_MS, self._on_resize_settled)
+
+    def _on_resize_settled(self):
+        self._resize_after_id = None
         self.show_current_page()
+
+    def _fit_zoom(self, rect_page) -> float:
+        """Zoom para a página caber no frame de preview."""
+        return fit_zoom(rect_page, self.preview_frame.winfo_width(), self.preview_frame.winfo_height())
+
+    def _show_interim_scale(self):
+        img = self._last_display_image
+        if img is None or self.full_img_size is None:
+            return
+
+        frame_width = self.preview_frame.winfo_width()
+        frame_height = self.preview_frame.winfo_height()
+        if frame_width <= PREVIEW_MARGIN or frame_height <= PREVIEW_MARGIN:
+            return
+
+        ratio = min(
+            (frame_width - PREVIEW_MARGIN) / img.width,
+            (frame_height - PREVIEW_MARGIN) / img.height,
+        )
+        new_size = (max(1, int(img.width * ratio)), max(1, int(img.height * ratio)))
+        if new_size == self.display_img_size:
+            return
+
+        from PIL import Image
+
+        interim = img.resize(new_size, Image.NEAREST)
+        self.current_page_image = ctk.CTkImage(
+            light_image=interim,
+            dark_image=interim,
+            size=interim.size
+        )
+        self.preview_label.configure(image=self.current_page_image, text="")
+        self.preview_label.image = self.current_page_image
+
+        # full_img_size continua o da renderização: a escala das caixas é ajustada
+        self.display_img_size = new_size
+        self.update_overlay_positions()
@@ -0,0 +1,211 @@
+# pdf_editor/ui/merged_preview.py
+
+import bisect
+import os
+import tkinter as tk
+
+import customtkinter as ctk
+import fitz  # PyMuPDF
+from PIL import ImageTk
+
+from core.imaging import render_page_to_image
+
+
+PAGE_MAX_WIDTH = 800   # largura máxima de cada página no scroll
+PAGE_MAX_ZOOM = 1.5
+PAGE_GAP = 20          # espaço entre páginas
+LABEL_HEIGHT = 24      # espaço para o texto "Página N"
+RENDER_MARGIN = 2      # páginas renderizadas além das visíveis (acima/abaixo)
+KEEP_MARGIN = 6        # páginas mais longe que isso têm a imagem liberada
+CANVAS_BG = "#2b2b2b"
+
+
+class MergedPreviewWindow(ctk.CTkToplevel):
+    """
+    Janela com scroll vertical de todas as páginas de um PDF (virtualizada).
+
+    Os tamanhos vêm de page.rect, então a barra de rolagem já é correta desde
+    o início. Só as páginas visíveis (e algumas vizinhas) são renderizadas, uma
+    por vez no loop do Tk; as que ficam longe têm a imagem liberada.
+    """
+
+    def __init__(self, master, pdf_path: str):
+        # Pode lançar exceção: quem chama mostra a mensagem de erro
+        doc = fitz.open(pdf_path)
+
+        super().__init__(master)
+        self.doc = doc
+
+        self.title(f"Pré-visualização do PDF mesclado - {os.path.basename(pdf_path)}")
+        self.geometry("900x700")
+
+        info_label = ctk.CTkLabel(
+            self,
+            text=f"PDF mesclado: {os.path.basename(pdf_path)}\n"
+                 f"Use a barra de rolagem para ver todas as páginas.",
+            font=ctk.CTkFont(size=14, weight="bold"),
+            justify="center"
+        )
+        info_label.pack(padx=10, pady=(10, 5))
+
+        body = ctk.CTkFrame(self)
+        body.pack(fill="both", expand=True, padx=10, pady=10)
+
+        self.canvas = tk.Canvas(body, bg=CANVAS_BG, highlightthickness=0)
+        scrollbar = ctk.CTkScrollbar(body, command=self._on_scrollbar)
+        self.canvas.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        # Layout calculado só com page.rect (nada é renderizado aqui)
+        self.page_zooms = []
+        self.page_sizes = []
+        self.page_tops = []
+        y = PAGE_GAP
+        for i in range(self.doc.page_count):
+            rect = self.doc.load_page(i).rect
+            zoom = PAGE_MAX_ZOOM
+            if rect.width * zoom > PAGE_MAX_WIDTH:
+                zoom = PAGE_MAX_WIDTH / rect.width
+            size = (int(rect.width * zoom), int(rect.height * zoom))
+            self.page_zooms.append(zoom)
+            self.page_sizes.append(size)
+            self.page_tops.append(y)
+            y += LABEL_HEIGHT + size[1] + PAGE_GAP
+        self.total_height = y
+
+        # page_index -> ids dos itens no canvas / PhotoImage
+        self._placeholders = {}
+        self._images = {}
+        self._pending = []
+        self._render_after_id = None
+        self._center = self._center_x()
+
+        self.canvas.bind("<Configure>", lambda _e: self._relayout())
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", lambda _e: self._scroll_units(-3))
+        self.canvas.bind("<Button-5>", lambda _e: self._scroll_units(3))
+        self.bind("<Destroy>", self._on_destroy)
+
+    # =============================
+    # Scroll
+    # =============================
+
+    def _on_scrollbar(self, *args):
+        self.canvas.yview(*args)
+        self._update_visible()
+
+    def _scroll_units(self, units: int):
+        self.canvas.yview_scroll(units, "units")
+        self._update_visible()
+
+    def _on_mousewheel(self, event):
+        self._scroll_units(int(-event.delta / 120) * 3)
+
+    # =============================
+    # Virtualização
+    # =============================
+
+    def _center_x(self) -> int:
+        return max(self.canvas.winfo_width(), PAGE_MAX_WIDTH) // 2
+
+    def _relayout(self):
+        """Recentraliza os itens já criados quando a largura do canvas muda."""
+        width = max(self.canvas.winfo_width(), PAGE_MAX_WIDTH)
+        self.canvas.configure(scrollregion=(0, 0, width, self.total_height))
+
+        center = self._center_x()
+        if center != self._center:
+            self.canvas.move("all", center - self._center, 0)
+            self._center = center
+        self._update_visible()
+
+    def _visible_range(self):
+        if not self.page_tops:
+            return 0, -1
+        top = self.canvas.canvasy(0)
+        bottom = self.canvas.canvasy(self.canvas.winfo_height())
+        first = max(bisect.bisect_right(self.page_tops, top) - 1, 0)
+        last = max(bisect.bisect_right(self.page_tops, bottom) - 1, first)
+        return first, last
+
+    def _update_visible(self):
+        first, last = self._visible_range()
+        if last < first:
+            return
+
+        count = len(self.page_tops)
+        render_from = max(first - RENDER_MARGIN, 0)
+        render_to = min(last + RENDER_MARGIN, count - 1)
+
+        for i in range(render_from, render_to + 1):
+            if i not in self._placeholders:
+                self._create_placeholder(i)
+
+        # Visíveis primeiro, depois as vizinhas
+        wanted = list(range(first, last + 1))
+        wanted += [i for i in range(render_from, render_to + 1) if not first <= i <= last]
+        self._pending = [i for i in wanted if i not in self._images]
+        self._schedule_render()
+
+        # Libera o que ficou longe
+        for i in list(self._placeholders):
+            if i < first - KEEP_MARGIN or i > last + KEEP_MARGIN:
+                self._delete_page_items(i)
+
+    def _create_placeholder(self, i: int):
+        w, h = self.page_sizes[i]
+        x = self._center_x()
+        top = self.page_tops[i]
+        text_id = self.canvas.create_text(
+            x, top, text=f"Página {i + 1}", fill="#dce4ee", anchor="n"
+        )
+        rect_id = self.canvas.create_rectangle(
+            x - w // 2, top + LABEL_HEIGHT, x + w // 2, top + LABEL_HEIGHT + h,
+            fill="#3a3a3a", outline=""
+        )
+        self._placeholders[i] = [text_id, rect_id]
+
+    def _delete_page_items(self, i: int):
+        for item in self._placeholders.pop(i, ()):
+            self.canvas.delete(item)
+        entry = self._images.pop(i, None)
+        if entry is not None:
+            self.canvas.delete(entry[0])
+
+    def _schedule_render(self):
+        if self._render_after_id is None and self._pending:
+            self._render_after_id = self.after(1, self._render_next)
+
+    def _render_next(self):
+        """Renderiza uma página por vez para não travar o loop do Tk."""
+        self._render_after_id = None
+        while self._pending:
+            i = self._pending.pop(0)
+            if i in self._placeholders and i not in self._images:
+                break
+        else:
+            return
+
+        page = self.doc.load_page(i)
+        img = render_page_to_image(page, zoom=self.page_zooms[i])
+        photo = ImageTk.PhotoImage(img)
+
+        x = self._center_x()
+        item = self.canvas.create_image(
+            x, self.page_tops[i] + LABEL_HEIGHT, image=photo, anchor="n"
+        )
+        self._images[i] = (item, photo)
+
+        self._schedule_render()
+
+    def _on_destroy(self, event):
+        if event.widget is not self:
+            return
+        if self._render_after_id is not None:
+            self.after_cancel(self._render_after_id)
+            self._render_after_id = None
+        self._images.clear()
+        if self.doc is not None:
+            self.doc.close()
+            self.doc = None
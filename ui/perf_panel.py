@@ -0,0 +1,91 @@
+# pdf_editor/ui/perf_panel.py
+
+import datetime
+from tkinter import filedialog, messagebox
+
+import customtkinter as ctk
+
+from core import perf
+
+
+REFRESH_MS = 500
+
+
+class PerfPanel(ctk.CTkToplevel):
+    """
+    Tempos das operações medidas (core.perf): p50/p95 das últimas chamadas,
+    bytes renderizados e acertos de cache. A medição só fica ligada enquanto
+    o interruptor estiver ativo; o trace exportado abre no chrome://tracing
+    ou no Perfetto.
+    """
+
+    def __init__(self, master):
+        super().__init__(master)
+        self.title("Desempenho")
+        self.geometry("720x400")
+
+        top = ctk.CTkFrame(self, fg_color="transparent")
+        top.pack(fill="x", padx=10, pady=(10, 0))
+
+        self.enabled_var = ctk.BooleanVar(value=perf.is_enabled())
+        ctk.CTkSwitch(
+            top, text="Medir desempenho", variable=self.enabled_var, command=self._toggle
+        ).pack(side="left")
+        ctk.CTkButton(top, text="Exportar trace...", width=130, command=self._export).pack(side="right")
+        ctk.CTkButton(top, text="Limpar", width=80, command=self._clear).pack(side="right", padx=5)
+
+        self.table = ctk.CTkTextbox(self, font=ctk.CTkFont(family="Courier New", size=12), wrap="none")
+        self.table.pack(fill="both", expand=True, padx=10, pady=10)
+
+        self._after_id = None
+        self.bind("<Destroy>", self._on_destroy)
+        self.refresh()
+
+    def refresh(self):
+        summary = perf.recorder.summary()
+        lines = [f"{'operação':<30} {'n':>6} {'p50 ms':>9} {'p95 ms':>9} {'máx ms':>9} {'MB':>8}  cache"]
+        for name in sorted(summary):
+            s = summary[name]
+            cache = " ".join(f"{k}={v}" for k, v in sorted(s["cache"].items()))
+            mb = f"{s['bytes'] / (1024 * 1024):8.1f}" if s["bytes"] else f"{'':>8}"
+            lines.append(
+                f"{name:<30} {s['count']:>6} {s['p50_ms']:9.1f} {s['p95_ms']:9.1f} {s['max_ms']:9.1f} {mb}  {cache}"
+            )
+        if not summary:
+            lines.append("")
+            lines.append("Nenhuma medição ainda." if perf.is_enabled() else "Ative \"Medir desempenho\" e use o aplicativo.")
+
+        self.table.configure(state="normal")
+        self.table.delete("1.0", "end")
+        self.table.insert("1.0", "\n".join(lines))
+        self.table.configure(state="disabled")
+
+        self._after_id = self.after(REFRESH_MS, self.refresh)
+
+    def _toggle(self):
+        perf.enable(self.enabled_var.get())
+
+    def _clear(self):
+        perf.recorder.clear()
+
+    def _export(self):
+        default = f"cotidiano_trace_{datetime.datetime.now():%Y%m%d_%H%M%S}.json"
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            defaultextension=".json",
+            initialfile=default,
+            filetypes=[("Trace JSON", "*.json")],
+        )
+        if not path:
+            return
+        try:
+            perf.recorder.export(path)
+        except OSError as e:
+            messagebox.showerror("Erro", f"Não foi possível salvar o trace.\n\n{e}", parent=self)
+            return
+        messagebox.showinfo("Trace salvo", f"Abra em chrome://tracing ou ui.perfetto.dev:\n{path}", parent=self)
+
+    def _on_destroy(self, event):
+        if event.widget is self and self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
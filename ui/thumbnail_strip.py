@@ -0,0 +1,204 @@
+# pdf_editor/ui/thumbnail_strip.py
+
+import tkinter as tk
+
+import customtkinter as ctk
+
+from core.thumbnails import THUMB_WIDTH, THUMB_HEIGHT, ThumbnailWorker
+
+
+THUMB_POLL_MS = 50
+ROW_PAD = 8
+LABEL_HEIGHT = 16
+ROW_HEIGHT = THUMB_HEIGHT + LABEL_HEIGHT + ROW_PAD
+STRIP_WIDTH = THUMB_WIDTH + 2 * ROW_PAD
+KEEP_MARGIN_ROWS = 4   # miniaturas mantidas (e pedidas) além das visíveis
+CANVAS_BG = "#2b2b2b"
+PLACEHOLDER_COLOR = "#3a3a3a"
+CURRENT_COLOR = "#1f6aa5"
+
+
+class ThumbnailStrip(ctk.CTkFrame):
+    """
+    Faixa lateral com as miniaturas das páginas.
+
+    A lista é virtual: o canvas tem a altura de todas as linhas, mas só as
+    visíveis (mais uma margem) têm itens e imagens. As que faltam são
+    pedidas ao ThumbnailWorker, que responde primeiro a elas e depois
+    preenche o cache em disco com o resto do documento.
+
+    on_select(page_index) é chamado ao clicar numa miniatura.
+    """
+
+    def __init__(self, master, on_select, **kwargs):
+        super().__init__(master, width=STRIP_WIDTH, corner_radius=0, **kwargs)
+        self.on_select = on_select
+        self.worker = ThumbnailWorker()
+
+        self.grid_rowconfigure(0, weight=1)
+        self.canvas = tk.Canvas(
+            self, width=STRIP_WIDTH, bg=CANVAS_BG, highlightthickness=0,
+            yscrollincrement=ROW_HEIGHT // 4,
+        )
+        scrollbar = ctk.CTkScrollbar(self, command=self._on_scroll)
+        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self.canvas.grid(row=0, column=0, sticky="ns")
+        scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self._doc_key = None      # (path, doc_id) exibido
+        self._page_count = 0
+        self._current = None
+        # page_index -> {"items": [ids no canvas], "photo": PhotoImage | None}
+        self._rows = {}
+
+        self.canvas.bind("<Configure>", lambda _e: self._update_visible())
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Button-4>", lambda _e: self._scroll_units(-1))
+        self.canvas.bind("<Button-5>", lambda _e: self._scroll_units(1))
+
+        self.after(THUMB_POLL_MS, self._poll)
+
+    # =============================
+    # Documento
+    # =============================
+
+    def show_document(self, path: str, doc_id, page_count: int, current: int):
+        """Sincroniza com o documento aberto (só recarrega se ele mudou)."""
+        if (path, doc_id) != self._doc_key or page_count != self._page_count:
+            self._load(path, doc_id, page_count)
+        self.set_current(current)
+
+    def clear(self):
+        self._load(None, None, 0)
+
+    def _load(self, path, doc_id, page_count):
+        self.canvas.delete("all")
+        self._rows.clear()
+        self._current = None
+        self._doc_key = (path, doc_id) if path else None
+        self._page_count = page_count
+        self.canvas.configure(scrollregion=(0, 0, STRIP_WIDTH, page_count * ROW_HEIGHT))
+        self.canvas.yview_moveto(0)
+        self.worker.open(path, doc_id, page_count)
+        self._update_visible()
+
+    def set_current(self, page_index: int):
+        """Destaca a página atual e rola até ela se estiver fora da vista."""
+        previous, self._current = self._current, page_index
+        for index in (previous, page_index):
+            if index in self._rows:
+                self._draw_row(index)
+
+        if self._page_count:
+            top = page_index * ROW_HEIGHT
+            view_top = self.canvas.canvasy(0)
+            view_bottom = self.canvas.canvasy(self.canvas.winfo_height())
+            if top < view_top or top + ROW_HEIGHT > view_bottom:
+                self.canvas.yview_moveto(top / (self._page_count * ROW_HEIGHT))
+        self._update_visible()
+
+    def shutdown(self):
+        self.worker.shutdown()
+
+    # =============================
+    # Linhas visíveis
+    # =============================
+
+    def _visible_range(self, margin: int = 0):
+        top = self.canvas.canvasy(0)
+        bottom = self.canvas.canvasy(self.canvas.winfo_height())
+        first = max(0, int(top // ROW_HEIGHT) - margin)
+        last = min(self._page_count - 1, int(bottom // ROW_HEIGHT) + margin)
+        return first, last
+
+    def _update_visible(self):
+        if not self._page_count:
+            return
+
+        first, last = self._visible_range(KEEP_MARGIN_ROWS)
+        for page_index in list(self._rows):
+            if not first <= page_index <= last:
+                for item in self._rows.pop(page_index)["items"]:
+                    self.canvas.delete(item)
+
+        for page_index in range(first, last + 1):
+            if page_index not in self._rows:
+                self._rows[page_index] = {"items": [], "photo": None}
+                self._draw_row(page_index)
+
+        # Visíveis primeiro, depois a margem
+        vis_first, vis_last = self._visible_range()
+        missing = [p for p in range(vis_first, vis_last + 1) if self._rows[p]["photo"] is None]
+        missing += [
+            p for p in range(first, last + 1)
+            if not vis_first <= p <= vis_last and self._rows[p]["photo"] is None
+        ]
+        self.worker.request(missing)
+
+    def _draw_row(self, page_index: int):
+        row = self._rows[page_index]
+        for item in row["items"]:
+            self.canvas.delete(item)
+
+        y = page_index * ROW_HEIGHT + ROW_PAD // 2
+        x0 = ROW_PAD
+        items = []
+        if page_index == self._current:
+            items.append(self.canvas.create_rectangle(
+                x0 - 3, y - 3, x0 + THUMB_WIDTH + 3, y + THUMB_HEIGHT + 3,
+                outline=CURRENT_COLOR, width=3,
+            ))
+
+        photo = row["photo"]
+        if photo is None:
+            items.append(self.canvas.create_rectangle(
+                x0, y, x0 + THUMB_WIDTH, y + THUMB_HEIGHT, fill=PLACEHOLDER_COLOR, outline="",
+            ))
+        else:
+            items.append(self.canvas.create_image(
+                x0 + THUMB_WIDTH // 2, y + THUMB_HEIGHT // 2, image=photo, anchor="center",
+            ))
+
+        items.append(self.canvas.create_text(
+            STRIP_WIDTH // 2, y + THUMB_HEIGHT + LABEL_HEIGHT // 2 + 1,
+            text=str(page_index + 1), fill="#dddddd", font=("Arial", 9),
+        ))
+        row["items"] = items
+
+    def _poll(self):
+        """Consome as miniaturas prontas no loop do Tk."""
+        doc_id = self._doc_key[1] if self._doc_key else None
+        results = self.worker.poll()
+        if results:
+            from PIL import ImageTk  # só quando há o que mostrar (abertura mais rápida)
+
+        for result_doc_id, page_index, img in results:
+            row = self._rows.get(page_index)
+            if result_doc_id != doc_id or row is None:
+                continue
+            row["photo"] = ImageTk.PhotoImage(img)
+            self._draw_row(page_index)
+        self.after(THUMB_POLL_MS, self._poll)
+
+    # =============================
+    # Eventos
+    # =============================
+
+    def _on_scroll(self, *args):
+        self.canvas.yview(*args)
+        self._update_visible()
+
+    def _scroll_units(self, units: int):
+        self.canvas.yview_scroll(units, "units")
+        self._update_visible()
+
+    def _on_wheel(self, event):
+        self._scroll_units(-1 if event.delta > 0 else 1)
+
+    def _on_click(self, event):
+        if not self._page_count:
+            return
+        page_index = int(self.canvas.canvasy(event.y) // ROW_HEIGHT)
+        if 0 <= page_index < self._page_count:
+            self.on_select(page_index)